@@ -20,7 +20,8 @@
 import click
 
 from utils.texts import Texts
-from utils.helper import abort_if_false
+from utils.helper import (abort_if_false, delegation_filter_options, output_format_option,
+                          paging_options)
 from core.holder import (delegate, delegations,
                          cancel_pending_delegation, locked,
                          undelegate, withdraw_bounty, earned_bounties)
@@ -89,8 +90,12 @@ def _delegate(validator_id, amount, delegation_period, info, pk_file,
 @holder.command('delegations', help=TEXTS['delegations']['help'])
 @click.argument('address')
 @click.option('--wei', '-w', is_flag=True, help=TEXTS['delegations']['wei']['help'])
-def _delegations(address, wei):
-    delegations(address, wei)
+@delegation_filter_options
+@paging_options
+@output_format_option
+def _delegations(address, wei, statuses, since, min_amount, offset, limit, output_format):
+    delegations(address, wei, offset, limit, output_format, statuses=statuses, since=since,
+                min_amount=min_amount)
 
 
 @holder.command('cancel-delegation', help=TEXTS['cancel_delegation']['help'])
@@ -145,8 +150,9 @@ def _withdraw_bounty(
 @holder.command('locked', help=TEXTS['locked']['help'])
 @click.argument('address')
 @click.option('--wei', '-w', is_flag=True, help=TEXTS['locked']['wei']['help'])
-def _locked(address, wei):
-    locked(address, wei)
+@output_format_option
+def _locked(address, wei, output_format):
+    locked(address, wei, output_format)
 
 
 @holder.command('earned-bounties', help=TEXTS['earned_bounties']['help'])
@@ -160,5 +166,6 @@ def _locked(address, wei):
 )
 @click.option('--wei', '-w', is_flag=True,
               help=G_TEXTS['wei']['help'])
-def _earned_bounties(validator_id, address, wei):
-    earned_bounties(validator_id, address, wei)
+@output_format_option
+def _earned_bounties(validator_id, address, wei, output_format):
+    earned_bounties(validator_id, address, wei, output_format)
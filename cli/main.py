@@ -20,21 +20,16 @@
 import sys
 import logging
 import inspect
+import importlib
 
 import click
-from skale.transactions.exceptions import TransactionError, RevertError
 
 from cli import __version__
 from cli.info import BUILD_DATETIME, COMMIT, BRANCH, OS, VERSION
-from cli.validator import validator_cli
-# from cli.metrics import metrics_cli
-from cli.holder import holder_cli
-from cli.sgx_wallet import sgx_cli
-from cli.wallet import wallet_cli
-from cli.srw import srw_cli
 from utils.validations import UrlType
 from utils.texts import Texts
 from utils.logs import init_logger, init_log_dir
+from utils.abi_cache import build_abi_cache
 from utils.helper import safe_mk_dirs, write_json, download_file, error_exit
 from utils.exit_codes import CLIExitCodes
 from utils.constants import (SKALE_VAL_CONFIG_FOLDER, SKALE_VAL_CONFIG_FILE,
@@ -45,12 +40,57 @@ logger = logging.getLogger(__name__)
 URL_TYPE = UrlType()
 TEXTS = Texts()
 
+# Command groups are imported only when invoked: they pull web3, skale and sgx
+LAZY_COMMANDS = {
+    'validator': 'cli.validator:validator_cli',
+    'metrics': 'cli.metrics:metrics_cli',
+    'holder': 'cli.holder:holder_cli',
+    'sgx': 'cli.sgx_wallet:sgx_cli',
+    'wallet': 'cli.wallet:wallet_cli',
+    'srw': 'cli.srw:srw_cli'
+}
+
+
+class LazyCommandCollection(click.CommandCollection):
+    """CommandCollection that imports the source of a lazy command on first access"""
+
+    def __init__(self, lazy_commands=None, **kwargs):
+        super().__init__(**kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def load_source(self, cmd_name):
+        module_name, source_name = self.lazy_commands[cmd_name].split(':')
+        return getattr(importlib.import_module(module_name), source_name)
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands:
+            return self.load_source(cmd_name).get_command(ctx, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
 
 @click.group()
 def cli():
     pass
 
 
+def enable_profile(profile):
+    if profile:
+        from utils.rpc_profiler import profiler
+        profiler.enable()
+
+
+def get_error_exit_code(err):
+    from skale.transactions.exceptions import TransactionError, RevertError
+    if isinstance(err, RevertError):
+        return CLIExitCodes.REVERT_ERROR
+    if isinstance(err, TransactionError):
+        return CLIExitCodes.TRANSACTION_ERROR
+    return CLIExitCodes.FAILURE
+
+
 @cli.command('info', help=TEXTS['info']['help'])
 def info():
     print(inspect.cleandoc(f'''
@@ -87,6 +127,7 @@ def info():
 def init(endpoint, contracts_url, wallet):
     safe_mk_dirs(SKALE_VAL_CONFIG_FOLDER)
     download_file(contracts_url, SKALE_VAL_ABI_FILE)
+    build_abi_cache(SKALE_VAL_ABI_FILE)
     config = {
         'endpoint': endpoint.strip(),
         'wallet': wallet
@@ -109,15 +150,15 @@ if __name__ == '__main__':
     init_log_dir()
     init_logger()
     logger.info(f'cmd: {" ".join(str(x) for x in sys.argv)}, v.{__version__}')
-    cmd_collection = click.CommandCollection(sources=[cli, validator_cli, holder_cli,
-                                                      sgx_cli, wallet_cli, srw_cli])
+    cmd_collection = LazyCommandCollection(
+        sources=[cli],
+        lazy_commands=LAZY_COMMANDS,
+        params=[click.Option(['--profile'], is_flag=True, help=TEXTS['profile']['help'])],
+        callback=enable_profile
+    )
     try:
         cmd_collection()
     except SystemExit as err:
         raise err
-    except RevertError as err:
-        error_exit(err, exit_code=CLIExitCodes.REVERT_ERROR)
-    except TransactionError as err:
-        error_exit(err, exit_code=CLIExitCodes.TRANSACTION_ERROR)
     except Exception as err:
-        error_exit(err)
+        error_exit(err, exit_code=get_error_exit_code(err))
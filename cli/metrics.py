@@ -20,12 +20,15 @@
 import click
 from yaspin import yaspin
 
+from core.aggregation import PERIODS
 from core.metrics import (
-    check_if_node_is_registered, check_if_validator_is_registered, get_metrics_for_node,
-    get_metrics_for_validator)
+    METRICS_WORKERS, check_if_node_is_registered, check_if_validator_is_registered,
+    get_bounties_for_validator, get_metrics_for_node, get_metrics_for_validator)
+from core.export import ExportError, get_export_format
 from utils.constants import SPIN_COLOR
 from utils.print_formatters import (
-    print_node_metrics, print_validator_metrics, print_validator_node_totals)
+    print_bounties, print_metrics_run_stats, print_node_metrics, print_total_info,
+    print_validator_metrics, print_validator_node_totals)
 from utils.texts import Texts
 from utils.web3_utils import init_skale_from_config
 
@@ -79,6 +82,8 @@ def node(node_id, since, till, wei, to_file):
     if not check_if_node_is_registered(skale, node_id):
         print(TEXTS['node']['index']['id_error_msg'])
         return
+    if not check_export_file(to_file):
+        return
     with yaspin(text="Loading", color=SPIN_COLOR) as sp:
         sp.text = TEXTS['node']['index']['wait_msg']
         metrics, total_bounty = get_metrics_for_node(skale, int(node_id), since, till, wei, to_file)
@@ -115,7 +120,19 @@ def node(node_id, since, till, wei, to_file):
     '--to-file', '-f',
     help=TEXTS['validator']['save_to_file']['help']
 )
-def validator(val_id, since, till, wei, to_file):
+@click.option(
+    '--workers',
+    type=click.IntRange(min=1),
+    default=METRICS_WORKERS,
+    show_default=True,
+    help=TEXTS['validator']['workers']['help']
+)
+@click.option(
+    '--group-by', '-g',
+    type=click.Choice(PERIODS),
+    help=TEXTS['validator']['group_by']['help']
+)
+def validator(val_id, since, till, wei, to_file, workers, group_by):
     if val_id < 0:
         print(TEXTS['validator']['index']['valid_id_msg'])
         return
@@ -123,11 +140,38 @@ def validator(val_id, since, till, wei, to_file):
     if not check_if_validator_is_registered(skale, val_id):
         print(TEXTS['validator']['index']['id_error_msg'])
         return
+    if not check_export_file(to_file):
+        return
+    if group_by:
+        with yaspin(text="Loading", color=SPIN_COLOR) as sp:
+            sp.text = TEXTS['validator']['index']['wait_msg']
+            bounties, total_bounty = get_bounties_for_validator(skale, val_id, group_by, since,
+                                                                till, wei, to_file, workers)
+        if bounties['rows']:
+            print_bounties(bounties['nodes'], bounties['rows'], wei)
+            print_total_info(total_bounty, wei)
+        else:
+            print('\n' + MSGS['no_data'])
+        print_metrics_run_stats(bounties['stats'])
+        return
     with yaspin(text="Loading", color=SPIN_COLOR) as sp:
         sp.text = TEXTS['validator']['index']['wait_msg']
-        metrics, total_bounty = get_metrics_for_validator(skale, val_id, since, till, wei, to_file)
+        metrics, total_bounty = get_metrics_for_validator(skale, val_id, since, till, wei, to_file,
+                                                          workers)
     if metrics['rows']:
         print_validator_metrics(metrics['rows'], wei)
         print_validator_node_totals(metrics['totals'], total_bounty, wei)
     else:
         print('\n' + MSGS['no_data'])
+    print_metrics_run_stats(metrics['stats'])
+
+
+def check_export_file(to_file):
+    if not to_file:
+        return True
+    try:
+        get_export_format(to_file)
+    except ExportError as err:
+        print(err)
+        return False
+    return True
@@ -22,7 +22,7 @@ import click
 
 from core.srw import recharge, withdraw, balance
 from utils.texts import Texts
-from utils.helper import transaction_cmd
+from utils.helper import output_format_option, transaction_cmd
 
 
 G_TEXTS = Texts()
@@ -73,5 +73,6 @@ def _withdraw(amount, pk_file, fee):
 @click.option('--wei', '-w', is_flag=True,
               help=G_TEXTS['wei']['help'])
 @click.argument('validator_id', type=int)
-def _balance(validator_id, wei):
-    balance(validator_id, wei)
+@output_format_option
+def _balance(validator_id, wei, output_format):
+    balance(validator_id, wei, output_format)
@@ -24,7 +24,8 @@ from core.validator import (register, validators_list, delegations, accept_pendi
                             get_bond_amount, link_node_address, unlink_node_address,
                             linked_addresses, info, withdraw_fee, set_mda, change_address,
                             confirm_address, earned_fees, accept_all_delegations, edit)
-from utils.helper import abort_if_false, transaction_cmd
+from utils.helper import (abort_if_false, delegation_filter_options, output_format_option,
+                          paging_options, transaction_cmd)
 from utils.validations import EthAddressType, UrlType, FloatPercentageType
 from utils.texts import Texts
 
@@ -96,15 +97,27 @@ def _register(
 @validator.command('ls', help=TEXTS['ls']['help'])
 @click.option('--wei', '-w', is_flag=True, help=TEXTS['ls']['wei']['help'])
 @click.option('--all', is_flag=True)
-def _ls(wei, all):
-    validators_list(wei, all)
+@paging_options
+@output_format_option
+def _ls(wei, all, offset, limit, output_format):
+    validators_list(wei, all, offset, limit, output_format)
 
 
 @validator.command('delegations', help=TEXTS['delegations']['help'])
 @click.argument('validator_id')
 @click.option('--wei', '-w', is_flag=True, help=TEXTS['delegations']['wei']['help'])
-def _delegations(validator_id, wei):
-    delegations(validator_id, wei)
+@delegation_filter_options
+@click.option(
+    '--delegator',
+    type=ETH_ADDRESS_TYPE,
+    help=G_TEXTS['delegation_filter']['delegator']['help']
+)
+@paging_options
+@output_format_option
+def _delegations(validator_id, wei, statuses, since, min_amount, delegator, offset, limit,
+                 output_format):
+    delegations(validator_id, wei, offset, limit, output_format, statuses=statuses,
+                since=since, delegator=delegator, min_amount=min_amount)
 
 
 @validator.command('accept-delegation', help=TEXTS['accept_delegation']['help'])
@@ -128,10 +141,16 @@ def _accept_delegation(delegation_id, pk_file, fee):
 
 @validator.command('accept-all-delegations', help=TEXTS['accept_all_delegations']['help'])
 @transaction_cmd
-def _accept_all_delegations(pk_file, fee):
+@click.option(
+    '--pipeline',
+    is_flag=True,
+    help=TEXTS['accept_all_delegations']['pipeline']['help']
+)
+def _accept_all_delegations(pk_file, fee, pipeline):
     accept_all_delegations(
         pk_file=pk_file,
-        fee=fee
+        fee=fee,
+        pipeline=pipeline
     )
 
 
@@ -164,15 +183,18 @@ def _unlink_address(node_address, pk_file, fee):
 
 @validator.command('linked-addresses', help=TEXTS['linked_addresses']['help'])
 @click.argument('address')
-def _linked_addresses(address):
-    linked_addresses(address)
+@output_format_option
+def _linked_addresses(address, output_format):
+    linked_addresses(address, output_format)
 
 
 @validator.command('info', help=TEXTS['info']['help'])
 @click.argument('validator_id')
-def _info(validator_id):
+@output_format_option
+def _info(validator_id, output_format):
     info(
-        validator_id=int(validator_id)
+        validator_id=int(validator_id),
+        output_format=output_format
     )
 
 
@@ -194,8 +216,9 @@ def _withdraw_fee(recipient_address, pk_file, fee):
 @click.option('--wei', '-w', is_flag=True,
               help=TEXTS['bond_amount']['wei']['help'])
 @click.argument('validator_id', type=int)
-def _bond_amount(validator_id, wei):
-    get_bond_amount(validator_id, wei)
+@output_format_option
+def _bond_amount(validator_id, wei, output_format):
+    get_bond_amount(validator_id, wei, output_format)
 
 
 @validator.command('set-mda', help=TEXTS['set_mda']['help'])
@@ -249,8 +272,9 @@ def _confirm_address(validator_id, pk_file, fee):
 )
 @click.option('--wei', '-w', is_flag=True,
               help=G_TEXTS['wei']['help'])
-def _earned_fees(address, wei):
-    earned_fees(address, wei)
+@output_format_option
+def _earned_fees(address, wei, output_format):
+    earned_fees(address, wei, output_format)
 
 
 @validator.command('edit', help=TEXTS['edit']['help'])
@@ -0,0 +1,144 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of validator-cli
+#
+#   Copyright (C) 2020 SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal, localcontext
+from typing import List
+
+WEI_IN_SKL = Decimal(10 ** 18)
+DECIMAL_PRECISION = 999
+
+DAY = 'day'
+WEEK = 'week'
+MONTH = 'month'
+PERIODS = (DAY, WEEK, MONTH)
+
+
+def wei_to_skl(amounts):
+    """Converts wei amounts to SKL within one decimal context, matching to_skl results"""
+    with localcontext() as ctx:
+        ctx.prec = DECIMAL_PRECISION
+        return [Decimal(amount) / WEI_IN_SKL if amount else Decimal(0) for amount in amounts]
+
+
+def bucket_start(timestamp, period):
+    """Returns start timestamp of the UTC day, week (from Monday) or month of timestamp"""
+    date = datetime.utcfromtimestamp(timestamp).replace(hour=0, minute=0, second=0,
+                                                        microsecond=0)
+    if period == WEEK:
+        date -= timedelta(days=date.weekday())
+    elif period == MONTH:
+        date = date.replace(day=1)
+    return int((date - datetime(1970, 1, 1)).total_seconds())
+
+
+def next_bucket(bucket, period):
+    date = datetime.utcfromtimestamp(bucket)
+    if period == MONTH:
+        date = (date + timedelta(days=32)).replace(day=1)
+    else:
+        date += timedelta(days=7 if period == WEEK else 1)
+    return int((date - datetime(1970, 1, 1)).total_seconds())
+
+
+def bucket_label(bucket, period):
+    return datetime.utcfromtimestamp(bucket).strftime('%Y-%m' if period == MONTH else '%Y-%m-%d')
+
+
+@dataclass
+class Aggregate:
+    count: int = 0
+    bounty: int = 0
+    downtime: int = 0
+    latency: float = 0
+
+    @property
+    def avg_latency(self) -> float:
+        return self.latency / self.count if self.count else 0
+
+
+@dataclass
+class MetricsColumns:
+    """Node metrics stored column-wise.
+
+    Bounties are kept as Python ints since amounts in wei overflow int64,
+    latencies are in seconds rounded to 0.1 as they are displayed
+    """
+    timestamps: array = field(default_factory=lambda: array('q'))
+    node_ids: array = field(default_factory=lambda: array('q'))
+    bounties: List[int] = field(default_factory=list)
+    downtimes: array = field(default_factory=lambda: array('q'))
+    latencies: array = field(default_factory=lambda: array('d'))
+
+    @classmethod
+    def from_events(cls, events):
+        """Builds columns from (node_id, timestamp, bounty, downtime, latency) rows"""
+        columns = cls()
+        for node_id, timestamp, bounty, downtime, latency in events:
+            columns.timestamps.append(timestamp)
+            columns.node_ids.append(node_id)
+            columns.bounties.append(bounty)
+            columns.downtimes.append(downtime)
+            columns.latencies.append(round(latency / 1000, 1))
+        return columns
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def rows(self, wei=False, is_validator=False):
+        bounties = self.bounties if wei else wei_to_skl(self.bounties)
+        dates = map(lambda ts: str(datetime.utcfromtimestamp(ts)), self.timestamps)
+        if is_validator:
+            return list(map(list, zip(dates, self.node_ids, bounties, self.downtimes,
+                                      self.latencies)))
+        return list(map(list, zip(dates, bounties, self.downtimes, self.latencies)))
+
+    def aggregate(self, key):
+        """Returns Aggregate by key(node_id, timestamp), sorted by key"""
+        aggregates = {}
+        for node_id, timestamp, bounty, downtime, latency in zip(
+                self.node_ids, self.timestamps, self.bounties, self.downtimes, self.latencies):
+            aggregate = aggregates.setdefault(key(node_id, timestamp), Aggregate())
+            aggregate.count += 1
+            aggregate.bounty += bounty
+            aggregate.downtime += downtime
+            aggregate.latency += latency
+        return dict(sorted(aggregates.items()))
+
+    def rollup(self, period):
+        """Returns Aggregate by (bucket, node_id) for day, week or month buckets"""
+        return self.aggregate(lambda node_id, timestamp: (bucket_start(timestamp, period),
+                                                          node_id))
+
+    def node_totals(self, wei=False):
+        """Returns [node_id, bounty, downtime, average latency] rows"""
+        aggregates = self.aggregate(lambda node_id, _: node_id)
+        bounties = [aggregate.bounty for aggregate in aggregates.values()]
+        if not wei:
+            bounties = wei_to_skl(bounties)
+        return [
+            [node_id, bounty, aggregate.downtime, aggregate.avg_latency]
+            for (node_id, aggregate), bounty in zip(aggregates.items(), bounties)
+        ]
+
+    def total_bounty(self, wei=False):
+        total = sum(self.bounties)
+        return total if wei else wei_to_skl([total])[0]
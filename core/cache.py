@@ -0,0 +1,422 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of validator-cli
+#
+#   Copyright (C) 2020 SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import os
+import sqlite3
+from datetime import datetime
+
+from utils.constants import SKALE_VAL_CACHE_FILE
+from utils.helper import safe_mk_dirs
+
+logger = logging.getLogger(__name__)
+
+CACHE_DB_TIMEOUT = 30
+SQLITE_MAX_PARAMS = 900
+
+
+def to_timestamp(date):
+    return int((date - datetime(1970, 1, 1)).total_seconds())
+
+
+class SqliteCache:
+    """Base class for local caches stored in a single SQLite file.
+
+    Every cache is bound to a chain key (SKALE Manager address); when the key
+    changes the tables of this cache are dropped and rebuilt.
+    """
+    NAME = None
+    TABLES = ()
+    SCHEMA = ''
+
+    def __init__(self, chain_key, path=None):
+        path = path or SKALE_VAL_CACHE_FILE
+        safe_mk_dirs(os.path.dirname(path))
+        self.conn = sqlite3.connect(path, timeout=CACHE_DB_TIMEOUT)
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, chain_key TEXT)'
+        )
+        self._validate_chain_key(chain_key)
+        self.conn.executescript(self.SCHEMA)
+        self.conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _validate_chain_key(self, chain_key):
+        row = self.conn.execute(
+            'SELECT chain_key FROM cache_meta WHERE name = ?', (self.NAME,)
+        ).fetchone()
+        if row is not None and row[0] == chain_key:
+            return
+        if row is not None:
+            logger.info(f'Chain changed, dropping {self.NAME} cache')
+        for table in self.TABLES:
+            self.conn.execute(f'DROP TABLE IF EXISTS {table}')
+        self.conn.execute(
+            'INSERT OR REPLACE INTO cache_meta (name, chain_key) VALUES (?, ?)',
+            (self.NAME, chain_key)
+        )
+        self.conn.commit()
+
+
+class BountyCache(SqliteCache):
+    """BountyReceived events of the nodes keyed by (node_id, block_number).
+
+    For every node the cache keeps the [lowest_block, highest_block] range
+    that is fully synced: all node events from that range are stored.
+    Day, week and month rollups of the events are stored along with the synced
+    range they were computed for.
+    """
+    NAME = 'bounty'
+    TABLES = ('bounty_events', 'bounty_sync', 'bounty_rollups', 'bounty_rollup_sync')
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS bounty_events (
+            node_id INTEGER NOT NULL,
+            block_number INTEGER NOT NULL,
+            timestamp INTEGER NOT NULL,
+            bounty TEXT NOT NULL,
+            downtime INTEGER NOT NULL,
+            latency INTEGER NOT NULL,
+            previous_block INTEGER NOT NULL,
+            PRIMARY KEY (node_id, block_number)
+        );
+        CREATE INDEX IF NOT EXISTS bounty_events_time ON bounty_events (node_id, timestamp);
+        CREATE TABLE IF NOT EXISTS bounty_sync (
+            node_id INTEGER PRIMARY KEY,
+            lowest_block INTEGER NOT NULL,
+            highest_block INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS bounty_rollups (
+            node_id INTEGER NOT NULL,
+            period TEXT NOT NULL,
+            bucket INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            bounty TEXT NOT NULL,
+            downtime INTEGER NOT NULL,
+            latency REAL NOT NULL,
+            PRIMARY KEY (node_id, period, bucket)
+        );
+        CREATE TABLE IF NOT EXISTS bounty_rollup_sync (
+            node_id INTEGER NOT NULL,
+            period TEXT NOT NULL,
+            lowest_block INTEGER NOT NULL,
+            highest_block INTEGER NOT NULL,
+            PRIMARY KEY (node_id, period)
+        );
+    '''
+
+    def get_synced_range(self, node_id):
+        row = self.conn.execute(
+            'SELECT lowest_block, highest_block FROM bounty_sync WHERE node_id = ?',
+            (node_id,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def set_synced_range(self, node_id, lowest_block, highest_block):
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO bounty_sync (node_id, lowest_block, highest_block) '
+                'VALUES (?, ?, ?)',
+                (node_id, lowest_block, highest_block)
+            )
+
+    def reset_node(self, node_id):
+        with self.conn:
+            self.conn.execute('DELETE FROM bounty_events WHERE node_id = ?', (node_id,))
+            self.conn.execute('DELETE FROM bounty_sync WHERE node_id = ?', (node_id,))
+            self.conn.execute('DELETE FROM bounty_rollups WHERE node_id = ?', (node_id,))
+            self.conn.execute('DELETE FROM bounty_rollup_sync WHERE node_id = ?', (node_id,))
+
+    def add_events(self, node_id, rows):
+        """Stores node events in a single transaction.
+
+        rows are (block_number, timestamp, bounty, downtime, latency, previous_block)
+        """
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO bounty_events (node_id, block_number, timestamp, '
+                'bounty, downtime, latency, previous_block) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [(node_id, block_number, timestamp, str(bounty), downtime, latency,
+                  previous_block)
+                 for block_number, timestamp, bounty, downtime, latency, previous_block in rows]
+            )
+
+    def get_oldest_event(self, node_id):
+        row = self.conn.execute(
+            'SELECT block_number, timestamp, previous_block FROM bounty_events '
+            'WHERE node_id = ? ORDER BY block_number LIMIT 1',
+            (node_id,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def get_newest_event(self, node_id):
+        row = self.conn.execute(
+            'SELECT block_number, timestamp, previous_block FROM bounty_events '
+            'WHERE node_id = ? ORDER BY block_number DESC LIMIT 1',
+            (node_id,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def get_events(self, node_id, start_date=None, end_date=None):
+        """Returns (timestamp, bounty, downtime, latency) rows, newest first"""
+        where, params = self._events_filter([node_id], start_date, end_date)
+        query = ('SELECT timestamp, bounty, downtime, latency FROM bounty_events '
+                 f'WHERE {where} ORDER BY block_number DESC')
+        return [
+            (timestamp, int(bounty), downtime, latency)
+            for timestamp, bounty, downtime, latency in self.conn.execute(query, params)
+        ]
+
+    def iter_events(self, node_ids, start_date=None, end_date=None):
+        """Yields (node_id, timestamp, bounty, downtime, latency) rows of the nodes, newest first.
+
+        Rows are read from the cursor one by one, so they are never all held in memory
+        """
+        where, params = self._events_filter(node_ids, start_date, end_date)
+        query = ('SELECT node_id, timestamp, bounty, downtime, latency FROM bounty_events '
+                 f'WHERE {where} ORDER BY timestamp DESC, node_id')
+        for node_id, timestamp, bounty, downtime, latency in self.conn.execute(query, params):
+            yield node_id, timestamp, int(bounty), downtime, latency
+
+    def get_events_time_range(self, node_id, lowest_block=None, highest_block=None):
+        """Returns (min, max) timestamps of node events outside [lowest_block, highest_block]"""
+        query = 'SELECT MIN(timestamp), MAX(timestamp) FROM bounty_events WHERE node_id = ?'
+        params = [node_id]
+        if lowest_block is not None:
+            query += ' AND (block_number < ? OR block_number > ?)'
+            params.extend([lowest_block, highest_block])
+        row = self.conn.execute(query, params).fetchone()
+        return None if row[0] is None else tuple(row)
+
+    def get_rollup_range(self, node_id, period):
+        row = self.conn.execute(
+            'SELECT lowest_block, highest_block FROM bounty_rollup_sync '
+            'WHERE node_id = ? AND period = ?',
+            (node_id, period)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def set_rollups(self, node_id, period, rollups, synced_range, first_bucket=None,
+                    end_bucket=None):
+        """Replaces node rollups from first_bucket till end_bucket (exclusive).
+
+        rollups are (bucket, count, bounty, downtime, latency) rows
+        """
+        query = 'DELETE FROM bounty_rollups WHERE node_id = ? AND period = ?'
+        params = [node_id, period]
+        if first_bucket is not None:
+            query += ' AND bucket >= ? AND bucket < ?'
+            params.extend([first_bucket, end_bucket])
+        with self.conn:
+            self.conn.execute(query, params)
+            self.conn.executemany(
+                'INSERT INTO bounty_rollups (node_id, period, bucket, count, bounty, downtime, '
+                'latency) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [(node_id, period, bucket, count, str(bounty), downtime, latency)
+                 for bucket, count, bounty, downtime, latency in rollups]
+            )
+            self.set_rollup_range(node_id, period, synced_range)
+
+    def set_rollup_range(self, node_id, period, synced_range):
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO bounty_rollup_sync (node_id, period, lowest_block, '
+                'highest_block) VALUES (?, ?, ?, ?)',
+                (node_id, period, *synced_range)
+            )
+
+    def get_rollups(self, node_ids, period, first_bucket=None, end_bucket=None):
+        """Returns (bucket, node_id, count, bounty, downtime, latency) rows"""
+        query = (f'SELECT bucket, node_id, count, bounty, downtime, latency FROM bounty_rollups '
+                 f'WHERE node_id IN ({", ".join("?" * len(node_ids))}) AND period = ?')
+        params = [*node_ids, period]
+        if first_bucket is not None:
+            query += ' AND bucket >= ?'
+            params.append(first_bucket)
+        if end_bucket is not None:
+            query += ' AND bucket < ?'
+            params.append(end_bucket)
+        query += ' ORDER BY bucket, node_id'
+        return [
+            (bucket, node_id, count, int(bounty), downtime, latency)
+            for bucket, node_id, count, bounty, downtime, latency in
+            self.conn.execute(query, params)
+        ]
+
+    @staticmethod
+    def _events_filter(node_ids, start_date=None, end_date=None):
+        where = f'node_id IN ({", ".join("?" * len(node_ids))})'
+        params = list(node_ids)
+        if start_date is not None:
+            where += ' AND timestamp >= ?'
+            params.append(to_timestamp(start_date))
+        if end_date is not None:
+            where += ' AND timestamp < ?'
+            params.append(to_timestamp(end_date))
+        return where, params
+
+
+class BlockIndex(SqliteCache):
+    """Block timestamps used to resolve dates to block numbers by bisection"""
+    NAME = 'blocks'
+    TABLES = ('block_timestamps',)
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS block_timestamps (
+            block_number INTEGER PRIMARY KEY,
+            timestamp INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS block_timestamps_time ON block_timestamps (timestamp);
+    '''
+
+    def get_timestamps(self, block_numbers):
+        """Returns known timestamps by block number"""
+        timestamps = {}
+        for i in range(0, len(block_numbers), SQLITE_MAX_PARAMS):
+            chunk = block_numbers[i:i + SQLITE_MAX_PARAMS]
+            placeholders = ', '.join('?' * len(chunk))
+            timestamps.update(self.conn.execute(
+                'SELECT block_number, timestamp FROM block_timestamps '
+                f'WHERE block_number IN ({placeholders})',
+                chunk
+            ).fetchall())
+        return timestamps
+
+    def add_timestamps(self, timestamps):
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO block_timestamps (block_number, timestamp) VALUES (?, ?)',
+                timestamps.items()
+            )
+
+    def get_bounds(self, timestamp):
+        """Returns the last known block before timestamp and the first one not before it"""
+        before = self.conn.execute(
+            'SELECT MAX(block_number) FROM block_timestamps WHERE timestamp < ?', (timestamp,)
+        ).fetchone()[0]
+        after = self.conn.execute(
+            'SELECT MIN(block_number) FROM block_timestamps WHERE timestamp >= ?', (timestamp,)
+        ).fetchone()[0]
+        return before, after
+
+
+class DelegationIndex(SqliteCache):
+    """Delegations of validators and token holders (scopes) synced so far.
+
+    A scope is seeded from the contract indices once; delegations proposed
+    later are added from DelegationProposed events up to the synced block.
+    Statuses are stored as last seen and have to be re-verified on chain.
+    """
+    NAME = 'delegations'
+    TABLES = ('delegations', 'delegation_scopes', 'delegation_sync')
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS delegations (
+            id INTEGER PRIMARY KEY,
+            address TEXT NOT NULL,
+            validator_id INTEGER NOT NULL,
+            amount TEXT NOT NULL,
+            delegation_period INTEGER NOT NULL,
+            created INTEGER NOT NULL,
+            started INTEGER NOT NULL,
+            finished INTEGER NOT NULL,
+            info TEXT NOT NULL,
+            status TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS delegations_validator ON delegations (validator_id, id);
+        CREATE INDEX IF NOT EXISTS delegations_holder ON delegations (address, id);
+        CREATE TABLE IF NOT EXISTS delegation_scopes (
+            scope TEXT PRIMARY KEY
+        );
+        CREATE TABLE IF NOT EXISTS delegation_sync (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            synced_block INTEGER NOT NULL
+        );
+    '''
+    COLUMNS = ('address', 'validator_id', 'amount', 'delegation_period', 'created', 'started',
+               'finished', 'info', 'id', 'status')
+
+    def get_synced_block(self):
+        row = self.conn.execute('SELECT synced_block FROM delegation_sync').fetchone()
+        return row[0] if row else None
+
+    def set_synced_block(self, block_number):
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO delegation_sync (id, synced_block) VALUES (0, ?)',
+                (block_number,)
+            )
+
+    def is_seeded(self, scope):
+        return self.conn.execute(
+            'SELECT 1 FROM delegation_scopes WHERE scope = ?', (scope,)
+        ).fetchone() is not None
+
+    def get_scopes(self):
+        return {scope for scope, in self.conn.execute('SELECT scope FROM delegation_scopes')}
+
+    def add_scope(self, scope):
+        with self.conn:
+            self.conn.execute('INSERT OR IGNORE INTO delegation_scopes (scope) VALUES (?)',
+                              (scope,))
+
+    def reset(self):
+        with self.conn:
+            for table in self.TABLES:
+                self.conn.execute(f'DELETE FROM {table}')
+
+    def add_delegations(self, delegations):
+        with self.conn:
+            self.conn.executemany(
+                f'INSERT OR REPLACE INTO delegations ({", ".join(self.COLUMNS)}) '
+                f'VALUES ({", ".join("?" * len(self.COLUMNS))})',
+                [
+                    tuple(str(delegation[column]) if column == 'amount' else delegation[column]
+                          for column in self.COLUMNS)
+                    for delegation in delegations
+                ]
+            )
+
+    def get_delegations(self, validator_id=None, address=None, since=None):
+        """Returns delegations of the validator and/or the holder ordered by ID"""
+        conditions, params = [], []
+        if validator_id is not None:
+            conditions.append('validator_id = ?')
+            params.append(validator_id)
+        if address is not None:
+            conditions.append('address = ?')
+            params.append(address)
+        if since is not None:
+            conditions.append('created >= ?')
+            params.append(to_timestamp(since))
+        query = f'SELECT {", ".join(self.COLUMNS)} FROM delegations'
+        if conditions:
+            query += f' WHERE {" AND ".join(conditions)}'
+        query += ' ORDER BY id'
+        delegations = []
+        for row in self.conn.execute(query, params):
+            delegation = dict(zip(self.COLUMNS, row))
+            delegation['amount'] = int(delegation['amount'])
+            delegations.append(delegation)
+        return delegations
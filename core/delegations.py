@@ -0,0 +1,289 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of validator-cli
+#
+#   Copyright (C) 2020 SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime
+from itertools import islice
+from typing import Optional, Tuple
+
+from skale.contracts.manager.delegation.delegation_controller import FIELDS as DELEGATION_FIELDS
+from skale.dataclasses.delegation_status import DelegationStatus
+
+from core.cache import DelegationIndex, to_timestamp
+from utils.filter import SkaleFilterError
+from utils.helper import page
+from utils.print_formatters import Progress
+from utils.rpc_batch import check_result, decode_call_result, eth_call, iter_batch_results
+
+logger = logging.getLogger(__name__)
+
+DELEGATION_CHUNK_SIZE = 50
+DELEGATION_WORKERS = 4
+EVENTS_BLOCK_CHUNK_SIZE = 10000
+MAX_EVENTS_SYNC_BLOCKS = 500000
+# delegations never leave these statuses, so they are not re-verified on chain
+FINAL_STATUSES = ('CANCELED', 'REJECTED', 'COMPLETED')
+
+
+@dataclass
+class DelegationFilter:
+    """Conditions delegations are selected by.
+
+    holder, validator_id and since are applied to the index query, min_amount
+    (wei) - to indexed delegations, statuses - after they are re-verified
+    """
+    statuses: Tuple[str, ...] = ()
+    since: Optional[datetime] = None
+    holder: Optional[str] = None
+    validator_id: Optional[int] = None
+    min_amount: Optional[int] = None
+
+    def matches(self, delegation):
+        return (not self.statuses or delegation['status'] in self.statuses) and \
+            (self.since is None or delegation['created'] >= to_timestamp(self.since)) and \
+            (self.holder is None or delegation['address'] == self.holder) and \
+            (self.validator_id is None or delegation['validator_id'] == self.validator_id) and \
+            (self.min_amount is None or delegation['amount'] >= self.min_amount)
+
+
+def get_validator_delegation_ids(skale, validator_id):
+    validator_id = int(validator_id)
+    functions = skale.delegation_controller.contract.functions
+    length = functions.getDelegationsByValidatorLength(validator_id).call()
+    return get_delegation_ids(skale, 'delegationsByValidator', validator_id, length)
+
+
+def get_holder_delegation_ids(skale, address):
+    functions = skale.delegation_controller.contract.functions
+    length = functions.getDelegationsByHolderLength(address).call()
+    return get_delegation_ids(skale, 'delegationsByHolder', address, length)
+
+
+def get_delegation_ids(skale, fn_name, key, length):
+    """Reads `length` items of the delegationsByValidator/delegationsByHolder index"""
+    contract = skale.delegation_controller.contract
+    calls = [eth_call(contract, fn_name, key, index) for index in range(length)]
+    return [
+        decode_call_result(contract, fn_name, check_result(result))
+        for result in iter_batch_results(skale.web3, calls, workers=DELEGATION_WORKERS)
+    ]
+
+
+def get_proposed_delegation_ids(skale, from_block, to_block, timeout=1, retries=10):
+    """Returns IDs from DelegationProposed events of the blocks range.
+
+    A failed request is retried with a chunk half as large, so provider limits
+    on the logs range or the response size are worked around
+    """
+    proposed_event = skale.delegation_controller.contract.events.DelegationProposed
+    delegation_ids = []
+    chunk_size, failures = EVENTS_BLOCK_CHUNK_SIZE, 0
+    chunk_start = from_block
+    while chunk_start <= to_block:
+        chunk_end = min(chunk_start + chunk_size - 1, to_block)
+        try:
+            events = proposed_event.getLogs(fromBlock=chunk_start, toBlock=chunk_end)
+        except Exception as err:
+            logger.error(f'Retrieving events from {chunk_start} to {chunk_end} failed with {err}')
+            failures += 1
+            if failures >= retries:
+                raise SkaleFilterError('Filter get_events timed out')
+            chunk_size = max(chunk_size // 2, 1)
+            time.sleep(timeout)
+            continue
+        failures = 0
+        delegation_ids.extend(event['args']['delegationId'] for event in events)
+        chunk_start = chunk_end + 1
+    return delegation_ids
+
+
+def validator_scope(validator_id):
+    return f'validator:{int(validator_id)}'
+
+
+def holder_scope(address):
+    return f'holder:{address}'
+
+
+def validator_delegations(skale, validator_id, offset=0, limit=None, delegation_filter=None):
+    """Returns delegations to the validator, see find_delegations.
+
+    When filtered by holder, the holder scope is used, it is usually much smaller
+    """
+    delegation_filter = replace(delegation_filter or DelegationFilter(),
+                                validator_id=int(validator_id))
+    if delegation_filter.holder:
+        return holder_delegations(skale, delegation_filter.holder, offset, limit,
+                                  delegation_filter)
+    return find_delegations(
+        skale, validator_scope(validator_id),
+        lambda: get_validator_delegation_ids(skale, validator_id),
+        offset, limit, delegation_filter
+    )
+
+
+def holder_delegations(skale, address, offset=0, limit=None, delegation_filter=None):
+    """Returns delegations of the token holder, see find_delegations"""
+    delegation_filter = replace(delegation_filter or DelegationFilter(), holder=address)
+    return find_delegations(
+        skale, holder_scope(address),
+        lambda: get_holder_delegation_ids(skale, address),
+        offset, limit, delegation_filter
+    )
+
+
+def find_delegations(skale, scope, get_scope_ids, offset, limit, delegation_filter):
+    """Yields the requested page of delegations matching the filter.
+
+    Delegations are selected from the local index, synced with the chain
+    first, only their statuses are re-verified on chain. Without a status
+    filter only delegations of the page are re-verified. The first time the
+    scope is listed without a status filter, delegations are yielded as
+    they are loaded into the index
+    """
+    with DelegationIndex(skale.manager.address) as index:
+        sync_delegation_index(skale, index)
+        if not index.is_seeded(scope):
+            # streamed rows show the loading progress themselves, IDs are sorted
+            # to yield delegations in the order of the index
+            seeded = filter(delegation_filter.matches, seed_scope(
+                skale, index, scope, sorted(get_scope_ids()),
+                show_progress=bool(delegation_filter.statuses)
+            ))
+            if not delegation_filter.statuses:
+                yield from islice(seeded, offset, None if limit is None else offset + limit)
+            for _ in seeded:
+                pass
+            if not delegation_filter.statuses:
+                return
+        delegations = [
+            delegation for delegation in index.get_delegations(
+                validator_id=delegation_filter.validator_id,
+                address=delegation_filter.holder,
+                since=delegation_filter.since
+            )
+            if delegation_filter.min_amount is None or
+            delegation['amount'] >= delegation_filter.min_amount
+        ]
+        if not delegation_filter.statuses:
+            delegations = page(delegations, offset, limit)
+        delegations = verify_statuses(skale, index, delegations)
+    if delegation_filter.statuses:
+        delegations = page(list(filter(delegation_filter.matches, delegations)), offset, limit)
+    yield from delegations
+
+
+def sync_delegation_index(skale, index):
+    """Adds delegations of seeded scopes proposed since the synced block.
+
+    The synced block is moved before a scope is seeded, so the index always
+    has all delegations of seeded scopes proposed till the synced block.
+    An index too far behind is dropped,
+    re-seeding is cheaper than the events scan, as well as an index ahead of
+    the chain (the chain was reset)
+    """
+    block_number = skale.web3.eth.block_number
+    synced_block = index.get_synced_block()
+    if synced_block is not None and (block_number < synced_block or
+                                     block_number - synced_block > MAX_EVENTS_SYNC_BLOCKS):
+        index.reset()
+        synced_block = None
+    if synced_block is not None and synced_block < block_number:
+        delegation_ids = get_proposed_delegation_ids(skale, synced_block + 1, block_number)
+        scopes = index.get_scopes()
+        index.add_delegations(
+            delegation for delegation in fetch_delegations(skale, delegation_ids)
+            if validator_scope(delegation['validator_id']) in scopes or
+            holder_scope(delegation['address']) in scopes
+        )
+    index.set_synced_block(block_number)
+
+
+def seed_scope(skale, index, scope, delegation_ids, show_progress=True):
+    """Yields delegations of the scope as they are loaded, storing them into the index.
+
+    The scope is marked as seeded once all its delegations are stored
+    """
+    chunk = []
+    for delegation in fetch_delegations(skale, delegation_ids, show_progress):
+        chunk.append(delegation)
+        if len(chunk) == DELEGATION_CHUNK_SIZE:
+            index.add_delegations(chunk)
+            chunk = []
+        yield delegation
+    index.add_delegations(chunk)
+    index.add_scope(scope)
+
+
+def verify_statuses(skale, index, delegations):
+    """Returns delegations with statuses read from the chain.
+
+    Delegations which status changed are reloaded, started and finished
+    change along with it, and updated in the index
+    """
+    contract = skale.delegation_controller.contract
+    mutable = [delegation for delegation in delegations
+               if delegation['status'] not in FINAL_STATUSES]
+    calls = [eth_call(contract, 'getState', delegation['id']) for delegation in mutable]
+    states = iter_batch_results(skale.web3, calls, workers=DELEGATION_WORKERS)
+    changed_ids = [
+        delegation['id'] for delegation, state in zip(mutable, states)
+        if DelegationStatus(
+            decode_call_result(contract, 'getState', check_result(state))
+        ).name != delegation['status']
+    ]
+    if not changed_ids:
+        return delegations
+    changed = {delegation['id']: delegation
+               for delegation in fetch_delegations(skale, changed_ids)}
+    index.add_delegations(changed.values())
+    return [changed.get(delegation['id'], delegation) for delegation in delegations]
+
+
+def fetch_delegations(skale, delegation_ids, show_progress=True):
+    """Yields delegations with ID and status in the order of IDs.
+
+    Delegations are requested in batched chunks of DELEGATION_CHUNK_SIZE,
+    DELEGATION_WORKERS chunks in parallel, and yielded as soon as their chunk
+    arrives
+    """
+    contract = skale.delegation_controller.contract
+    calls = []
+    for delegation_id in delegation_ids:
+        calls.append(eth_call(contract, 'getDelegation', delegation_id))
+        calls.append(eth_call(contract, 'getState', delegation_id))
+    results = iter_batch_results(skale.web3, calls, chunk_size=DELEGATION_CHUNK_SIZE * 2,
+                                 workers=DELEGATION_WORKERS)
+    progress = Progress('Delegations loaded', len(delegation_ids), enabled=show_progress)
+    try:
+        for number, delegation_id in enumerate(delegation_ids):
+            if number % DELEGATION_CHUNK_SIZE == 0:
+                progress.update(number)
+            delegation = dict(zip(
+                DELEGATION_FIELDS,
+                decode_call_result(contract, 'getDelegation', check_result(next(results)))
+            ))
+            state = decode_call_result(contract, 'getState', check_result(next(results)))
+            delegation['id'] = delegation_id
+            delegation['status'] = DelegationStatus(state).name
+            yield delegation
+    finally:
+        progress.clear()
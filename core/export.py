@@ -0,0 +1,102 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of validator-cli
+#
+#   Copyright (C) 2020 SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import csv
+import json
+import os
+from itertools import islice
+
+EXPORT_BATCH_SIZE = 10000
+
+CSV_FORMAT = 'csv'
+NDJSON_FORMAT = 'ndjson'
+PARQUET_FORMAT = 'parquet'
+EXPORT_FORMATS = {
+    '.csv': CSV_FORMAT,
+    '.ndjson': NDJSON_FORMAT,
+    '.jsonl': NDJSON_FORMAT,
+    '.parquet': PARQUET_FORMAT
+}
+
+
+class ExportError(Exception):
+    pass
+
+
+def get_export_format(path):
+    """Returns export format by file extension, files with unknown extensions are saved as CSV"""
+    export_format = EXPORT_FORMATS.get(os.path.splitext(path)[1].lower(), CSV_FORMAT)
+    if export_format == PARQUET_FORMAT:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ExportError('Parquet export requires pyarrow: '
+                              'pip install validator-cli[parquet]')
+    return export_format
+
+
+def export_rows(path, columns, rows, dtypes=None):
+    """Writes rows to the file as they are produced by the rows iterator.
+
+    dtypes are used for Parquet columns: t - text, i - integer, f - float,
+    a - SKL amount, w - amount in wei; text is used by default
+    """
+    export_format = get_export_format(path)
+    if export_format == PARQUET_FORMAT:
+        write_parquet(path, columns, rows, dtypes or ['t'] * len(columns))
+    elif export_format == NDJSON_FORMAT:
+        write_ndjson(path, columns, rows)
+    else:
+        write_csv(path, columns, rows)
+
+
+def write_csv(path, columns, rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(rows)
+
+
+def write_ndjson(path, columns, rows):
+    with open(path, 'w') as f:
+        for row in rows:
+            f.write(json.dumps(dict(zip(columns, row)), default=str) + '\n')
+
+
+def write_parquet(path, columns, rows, dtypes):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parquet_types = {
+        't': pa.string(),
+        'i': pa.int64(),
+        'f': pa.float64(),
+        'a': pa.decimal128(38, 18),
+        'w': pa.decimal128(38, 0)
+    }
+    schema = pa.schema([(column, parquet_types[dtype]) for column, dtype in zip(columns, dtypes)])
+    rows = iter(rows)
+    with pq.ParquetWriter(path, schema, compression='zstd') as writer:
+        batch = list(islice(rows, EXPORT_BATCH_SIZE))
+        while batch:
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(zip(*batch), schema)],
+                schema=schema
+            ))
+            batch = list(islice(rows, EXPORT_BATCH_SIZE))
@@ -23,6 +23,7 @@ from typing import Optional
 from yaspin import yaspin
 from skale.utils.web3_utils import to_checksum_address
 
+from core.delegations import DelegationFilter, holder_delegations
 from core.transaction import TxFee
 from utils.helper import to_skl
 from utils.web3_utils import (init_skale_from_config,
@@ -30,16 +31,25 @@ from utils.web3_utils import (init_skale_from_config,
 from utils.print_formatters import print_delegations
 from utils.helper import to_wei, from_wei
 from utils.constants import SPIN_COLOR
+from utils.output_formats import TABLE_FORMAT, is_structured, print_record, print_records
 
 
-def delegations(address, wei):
+def delegations(address, wei, offset=0, limit=None, output_format=TABLE_FORMAT,
+                statuses=(), since=None, min_amount=None):
     checksum_address = to_checksum_address(address)
-    skale = init_skale_from_config()
+    skale = init_skale_from_config(disable_spin=is_structured(output_format))
     if not skale:
         return
-    delegations_list = skale.delegation_controller.get_all_delegations_by_holder(
-        checksum_address
+    delegation_filter = DelegationFilter(
+        statuses=tuple(statuses),
+        since=since,
+        min_amount=None if min_amount is None else to_wei(min_amount)
     )
+    delegations_list = holder_delegations(skale, checksum_address, offset, limit,
+                                          delegation_filter)
+    if is_structured(output_format):
+        print_records(delegations_list, output_format)
+        return
     print(f'Delegations for address {address}:\n')
     print_delegations(delegations_list, wei)
 
@@ -108,20 +118,27 @@ def withdraw_bounty(validator_id: int, recipient_address: str,
         print(f'Transaction hash: {tx_res.tx_hash}')
 
 
-def locked(address, wei):
-    skale = init_skale_from_config()
+def locked(address, wei, output_format=TABLE_FORMAT):
+    skale = init_skale_from_config(disable_spin=is_structured(output_format))
     if not skale:
         return
     locked_amount_wei = skale.token_state.get_and_update_locked_amount(address)
+    if is_structured(output_format):
+        print_record({'address': address, 'locked': locked_amount_wei}, output_format)
+        return
     amount = locked_amount_wei if wei else to_skl(locked_amount_wei)
     print(f'Locked amount for address {address}:\n{amount}')
 
 
-def earned_bounties(validator_id, address, wei):
-    skale = init_skale_from_config()
+def earned_bounties(validator_id, address, wei, output_format=TABLE_FORMAT):
+    skale = init_skale_from_config(disable_spin=is_structured(output_format))
     if not skale:
         return
     earned_bounties_data = skale.distributor.get_earned_bounty_amount(validator_id, address)
+    if is_structured(output_format):
+        print_record({'validator_id': validator_id, 'address': address, **earned_bounties_data},
+                     output_format)
+        return
     earned_bounties_amount = earned_bounties_data['earned']
     earned_bounties_msg = f'Earned bounties for {address}, validator ID - {validator_id}: '
     if not wei:
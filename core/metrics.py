@@ -17,15 +17,37 @@
 #   You should have received a copy of the GNU Affero General Public License
 #   along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import threading
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
+from statistics import mean
+from typing import Dict
+from urllib.parse import urlparse
 
-from web3.logs import DISCARD
+from aiohttp import ClientResponseError, ClientSession
+from eth_utils import encode_hex, event_abi_to_log_topic
+from skale.contracts.manager.nodes import FIELDS as NODE_FIELDS
 
-import pandas as pd
+from core.aggregation import (Aggregate, MetricsColumns, bucket_label, bucket_start,
+                              next_bucket, wei_to_skl)
+from core.cache import BlockIndex, BountyCache, to_timestamp
+from core.export import export_rows
+from utils.filter import SkaleFilter, SkaleFilterError
 from utils.helper import to_skl
+from utils.rpc_batch import MAX_BATCH_SIZE, BatchRequestError
+from utils.rpc_profiler import profiler
+from utils.web3_utils import init_async_web3
+
+logger = logging.getLogger(__name__)
 
 BLOCK_CHUNK_SIZE = 1000
+METRICS_WORKERS = 4
+MAX_INFLIGHT_REQUESTS = 16
+
+NODE_METRICS_COLUMNS = ['Date', 'Bounty', 'Downtime', 'Latency']
+VALIDATOR_METRICS_COLUMNS = ['Date', 'Node ID', 'Bounty', 'Downtime', 'Latency']
 
 
 def check_if_node_is_registered(skale, node_id):
@@ -41,93 +63,494 @@ def get_nodes_for_validator(skale, val_id):
     return skale.nodes.get_validator_node_indices(val_id)
 
 
-def get_metrics_for_validator(skale, val_id, start_date=None, end_date=None, wei=None,
-                              to_file=None):
-    class nodeThread(threading.Thread):
-        def __init__(self, node_id):
-            threading.Thread.__init__(self)
-            self.node_id = node_id
-
-        def run(self):
-            metrics = get_metrics_from_events(skale, self.node_id, start_date, end_date,
-                                              is_validator=True)
-            all_metrics.extend(metrics)
-
-    node_ids = get_nodes_for_validator(skale, val_id, )
-    all_metrics = []
-    thread_list = []
-    for node_id in node_ids:
-        node_thread = nodeThread(node_id)
-
-        thread_list.append(node_thread)
-        node_thread.start()
-    for th in thread_list:
-        th.join()
-    if all_metrics:
-        columns = ['Date', 'Node ID', 'Bounty', 'Downtime', 'Latency']
-        df = pd.DataFrame(all_metrics, columns=columns)
-        if not wei:
-            df['Bounty'] = df['Bounty'].apply(to_skl)
-        df.sort_values(by=['Date'], inplace=True, ascending=False)
-        metrics_rows = df.values.tolist()
-        node_group = df.groupby(['Node ID'])
-        metrics_sums = node_group.agg({'Bounty': 'sum', 'Downtime': 'sum', 'Latency': 'mean'})
-        metrics_sums = metrics_sums.reset_index().values.tolist()
-        total_bounty = df['Bounty'].sum()
+@dataclass
+class MetricsRunStats:
+    nodes: int = 0
+    elapsed: float = 0
+    latencies: Dict[int, float] = field(default_factory=dict)
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed else 0
+
+    @property
+    def avg_latency(self) -> float:
+        return mean(self.latencies.values()) if self.latencies else 0
+
+    @property
+    def max_latency(self) -> float:
+        return max(self.latencies.values(), default=0)
+
+
+def collect_nodes_metrics(skale, node_ids, start_date=None, end_date=None,
+                          workers=METRICS_WORKERS, wei=False, to_file=None, group_by=None):
+    """Collects metrics for the nodes, syncing at most `workers` nodes at a time.
+
+    Returns MetricsColumns of the synced nodes, newest first, or their rollups by
+    (bucket, node_id) if group_by period is given; failed nodes are recorded in stats.errors.
+    Events of the synced nodes are saved to_file
+    """
+    stats = MetricsRunStats(nodes=len(node_ids))
+    started_at = time.monotonic()
+    with BountyCache(skale.manager.address) as cache:
+        stats.latencies, errors = asyncio.run(
+            sync_nodes_bounty_events(skale, cache, node_ids, start_date, end_date, workers)
+        )
+        stats.errors = {node_id: str(err) for node_id, err in errors.items()}
+        synced_node_ids = [node_id for node_id in node_ids if node_id not in errors]
+        if group_by:
+            metrics = get_bounty_rollups(cache, synced_node_ids, group_by, start_date, end_date)
+        else:
+            metrics = MetricsColumns.from_events(
+                cache.iter_events(synced_node_ids, start_date, end_date)
+            )
         if to_file:
-            df.to_csv(to_file, index=False)
+            export_cached_metrics(cache, synced_node_ids, to_file, start_date, end_date, wei,
+                                  is_validator=True)
+    stats.elapsed = time.monotonic() - started_at
+    logger.info(f'Metrics collected for {stats.nodes} nodes in {stats.elapsed:.1f}s, '
+                f'latencies: {stats.latencies}')
+    return metrics, stats
+
+
+def get_metrics_for_validator(skale, val_id, start_date=None, end_date=None, wei=None,
+                              to_file=None, workers=METRICS_WORKERS):
+    node_ids = get_nodes_for_validator(skale, val_id)
+    metrics, stats = collect_nodes_metrics(skale, node_ids, start_date, end_date, workers,
+                                           wei, to_file)
+    if len(metrics):
+        metrics_rows = metrics.rows(wei, is_validator=True)
+        metrics_sums = metrics.node_totals(wei)
+        total_bounty = metrics.total_bounty(wei)
     else:
         metrics_rows = metrics_sums = total_bounty = None
-    return {'rows': metrics_rows, 'totals': metrics_sums}, total_bounty
+    return {'rows': metrics_rows, 'totals': metrics_sums, 'stats': stats}, total_bounty
 
 
-def get_metrics_for_node(skale, node_id, start_date=None, end_date=None, wei=None, to_file=None):
-    metrics = get_metrics_from_events(skale, node_id, start_date, end_date)
-    columns = ['Date', 'Bounty', 'Downtime', 'Latency']
-    df = pd.DataFrame(metrics, columns=columns)
-    if not wei:
-        df['Bounty'] = df['Bounty'].apply(to_skl)
-    total_bounty = df['Bounty'].sum()
-    metrics_rows = df.values.tolist()
+def get_bounties_for_validator(skale, val_id, group_by, start_date=None, end_date=None,
+                               wei=None, to_file=None, workers=METRICS_WORKERS):
+    """Returns bounties per day, week or month bucket for every validator node, newest first.
+
+    Rows are [bucket, all nodes bounty, bounty of each node], the same rows are saved to_file
+    """
+    node_ids = get_nodes_for_validator(skale, val_id)
+    rollups, stats = collect_nodes_metrics(skale, node_ids, start_date, end_date, workers,
+                                           wei, group_by=group_by)
+    nodes = sorted({node_id for _, node_id in rollups})
+    buckets = sorted({bucket for bucket, _ in rollups}, reverse=True)
+    bounties_rows = []
+    for bucket in buckets:
+        bounties = [rollups[bucket, node_id].bounty if (bucket, node_id) in rollups else 0
+                    for node_id in nodes]
+        bounties.insert(0, sum(bounties))
+        if not wei:
+            bounties = wei_to_skl(bounties)
+        bounties_rows.append([bucket_label(bucket, group_by), *bounties])
+    total_bounty = sum(row[1] for row in bounties_rows)
     if to_file:
-        df.to_csv(to_file, index=False)
-    return metrics_rows, total_bounty
-
-
-def get_metrics_from_events(skale, node_id, start_date=None, end_date=None,
-                            is_validator=False):
-    metrics_rows = []
-
-    block_number = skale.monitors.get_last_bounty_block(node_id)
-    while True:
-        block_data = skale.web3.eth.get_block(block_number)
-        txs = block_data["transactions"]
-        for tx in txs:
-            rec = skale.web3.eth.get_transaction_receipt(tx)
-            if rec["to"] != skale.manager.contract.address:
-                continue
-            h_receipt = skale.manager.contract.events.BountyReceived().processReceipt(
-                rec, errors=DISCARD)
-            if len(h_receipt) == 0:
-                continue
-            args = h_receipt[0]['args']
-            block_timestamp = datetime.utcfromtimestamp(block_data['timestamp'])
-            if start_date is not None and start_date > block_timestamp:
-                return metrics_rows
-            if args['nodeIndex'] == node_id:
-                block_number = args['previousBlockEvent']
-                if end_date is not None and end_date <= block_timestamp:
-                    break
-                bounty = args['bounty']
-                metrics_row = [str(block_timestamp),
-                               bounty,
-                               args['averageDowntime'],
-                               round(args['averageLatency'] / 1000, 1)]
-                if is_validator:
-                    metrics_row.insert(1, args['nodeIndex'])
-                metrics_rows.append(metrics_row)
-                break
-
-        if block_number is None or block_number == 0:
-            break
-    return metrics_rows
+        columns = ['Date', 'All nodes', *(f'Node ID = {node_id}' for node_id in nodes)]
+        dtypes = ['t'] + ['w' if wei else 'a'] * (len(nodes) + 1)
+        export_rows(to_file, columns, bounties_rows, dtypes)
+    return {'nodes': nodes, 'rows': bounties_rows, 'stats': stats}, total_bounty
+
+
+def get_metrics_for_node(skale, node_id, start_date=None, end_date=None, wei=None, to_file=None):
+    metrics = get_metrics_from_events(skale, node_id, start_date, end_date, wei=wei,
+                                      to_file=to_file)
+    return metrics.rows(wei), metrics.total_bounty(wei)
+
+
+def get_bounty_events(skale, node_id, from_block, to_block):
+    return SkaleFilter(
+        skale.manager.contract.events.BountyReceived,
+        from_block=from_block,
+        to_block=to_block,
+        argument_filters={'nodeIndex': node_id}
+    ).get_events()
+
+
+def get_block_timestamp(skale, block_number):
+    return skale.web3.eth.get_block(block_number)['timestamp']
+
+
+def get_node_reward_info(skale, node_id):
+    """Returns start block and last reward date of the node in a single call"""
+    node = skale.nodes.contract.functions.nodes(node_id).call()
+    return node[NODE_FIELDS.index('start_block')], node[NODE_FIELDS.index('last_reward_date')]
+
+
+class EventsRpc:
+    """Runs blocking web3 requests of the events engine in the loop executor.
+
+    Block timestamps are looked up in the block index first and stored there once fetched
+    """
+
+    def __init__(self, skale, semaphore, block_index=None):
+        self.skale = skale
+        self.semaphore = semaphore
+        self.block_index = block_index
+
+    async def _run(self, func, *args):
+        async with self.semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, func, *args)
+
+    async def get_node_reward_info(self, node_id):
+        return await self._run(get_node_reward_info, self.skale, node_id)
+
+    async def get_bounty_events(self, node_id, from_block, to_block):
+        return await self._run(get_bounty_events, self.skale, node_id, from_block, to_block)
+
+    async def get_block_number(self):
+        return await self._run(lambda: self.skale.web3.eth.block_number)
+
+    async def get_block_timestamp(self, block_number):
+        return (await self.get_block_timestamps([block_number]))[0]
+
+    async def get_block_timestamps(self, block_numbers):
+        timestamps = {}
+        if self.block_index is not None:
+            timestamps = self.block_index.get_timestamps(block_numbers)
+        missing = [n for n in dict.fromkeys(block_numbers) if n not in timestamps]
+        if missing:
+            fetched = dict(zip(missing, await self._request_block_timestamps(missing)))
+            if self.block_index is not None:
+                self.block_index.add_timestamps(fetched)
+            timestamps.update(fetched)
+        return [timestamps[n] for n in block_numbers]
+
+    async def _request_block_timestamp(self, block_number):
+        return await self._run(get_block_timestamp, self.skale, block_number)
+
+    async def _request_block_timestamps(self, block_numbers):
+        return await asyncio.gather(*(self._request_block_timestamp(n) for n in block_numbers))
+
+
+class AsyncEventsRpc(EventsRpc):
+    """Sends log and block requests of the events engine through the async provider"""
+
+    def __init__(self, skale, semaphore, web3, session, block_index=None, timeout=1,
+                 retries=10):
+        super().__init__(skale, semaphore, block_index)
+        self.web3 = web3
+        self.session = session
+        self.batch_supported = True
+        self.timeout = timeout
+        self.retries = retries
+        self.event = skale.manager.contract.events.BountyReceived()
+        self.topic = encode_hex(event_abi_to_log_topic(self.event.abi))
+
+    async def get_bounty_events(self, node_id, from_block, to_block):
+        params = {
+            'address': self.skale.manager.address,
+            'fromBlock': from_block,
+            'toBlock': to_block,
+            'topics': [self.topic, '0x' + format(node_id, '064x')]
+        }
+        for _ in range(self.retries):
+            try:
+                async with self.semaphore:
+                    logs = await self.web3.eth.get_logs(params)
+            except Exception as err:
+                logger.error(f'Retrieving events from {from_block} to {to_block} failed with {err}')
+                await asyncio.sleep(self.timeout)
+            else:
+                return [self.event.processLog(log) for log in logs]
+        raise SkaleFilterError('Filter get_events timed out')
+
+    async def get_block_number(self):
+        async with self.semaphore:
+            return await self.web3.eth.block_number
+
+    async def _request_block_timestamp(self, block_number):
+        async with self.semaphore:
+            block = await self.web3.eth.get_block(block_number)
+        return block['timestamp']
+
+    async def _request_block_timestamps(self, block_numbers):
+        if self.batch_supported and len(block_numbers) > 1:
+            try:
+                return await self._batch_block_timestamps(block_numbers)
+            except (BatchRequestError, ClientResponseError) as err:
+                logger.info(f'Batch requests are rejected by the endpoint: {err}')
+                self.batch_supported = False
+        return await super()._request_block_timestamps(block_numbers)
+
+    async def _batch_block_timestamps(self, block_numbers):
+        timestamps = []
+        for i in range(0, len(block_numbers), MAX_BATCH_SIZE):
+            batch = block_numbers[i:i + MAX_BATCH_SIZE]
+            payload = [
+                {'jsonrpc': '2.0', 'id': _id, 'method': 'eth_getBlockByNumber',
+                 'params': [hex(block_number), False]}
+                for _id, block_number in enumerate(batch)
+            ]
+            started_at = time.perf_counter()
+            async with self.semaphore:
+                async with self.session.post(self.web3.provider.endpoint_uri,
+                                             json=payload) as response:
+                    responses = await response.json(content_type=None)
+            if profiler.enabled:
+                profiler.record(('batch eth_getBlockByNumber', None, None),
+                                time.perf_counter() - started_at, payload, responses)
+            if not isinstance(responses, list):
+                raise BatchRequestError(f'Unexpected batch response: {responses}')
+            blocks = {r.get('id'): r.get('result') for r in responses}
+            if any(blocks.get(_id) is None for _id in range(len(batch))):
+                raise BatchRequestError(f'Incomplete batch response: {responses}')
+            timestamps.extend(int(blocks[_id]['timestamp'], 16) for _id in range(len(batch)))
+        return timestamps
+
+
+async def iter_bounty_event_chunks(rpc, node_id, block_number, stop_block=0):
+    """Yields non-empty chunks of node BountyReceived events, newest first.
+
+    Scans go from block_number down to stop_block (exclusive) following previousBlockEvent
+    """
+    while block_number > stop_block:
+        from_block = max(block_number - BLOCK_CHUNK_SIZE + 1, stop_block + 1)
+        events = await rpc.get_bounty_events(node_id, from_block, block_number)
+        if not events:
+            block_number = from_block - 1
+            continue
+        events = sorted(events, key=lambda e: (e['blockNumber'], e['logIndex']), reverse=True)
+        yield events
+        block_number = min(events[-1]['args']['previousBlockEvent'], from_block - 1)
+
+
+async def store_bounty_events(cache, node_id, events, timestamps):
+    cache.add_events(node_id, [
+        (event['blockNumber'], timestamp, event['args']['bounty'],
+         event['args']['averageDowntime'], event['args']['averageLatency'],
+         event['args']['previousBlockEvent'])
+        for event, timestamp in zip(events, await timestamps)
+    ])
+
+
+async def fetch_bounty_events(rpc, cache, node_id, block_number, stop_block=0):
+    """Stores node events from block_number down to stop_block (exclusive) into the cache.
+
+    Block headers of a chunk are requested while the next chunk is being scanned
+    """
+    pending = None
+    try:
+        async for events in iter_bounty_event_chunks(rpc, node_id, block_number, stop_block):
+            timestamps = asyncio.ensure_future(
+                rpc.get_block_timestamps([event['blockNumber'] for event in events])
+            )
+            previous, pending = pending, (events, timestamps)
+            if previous is not None:
+                await store_bounty_events(cache, node_id, *previous)
+        if pending is not None:
+            await store_bounty_events(cache, node_id, *pending)
+    finally:
+        if pending is not None and not pending[1].done():
+            pending[1].cancel()
+            await asyncio.gather(pending[1], return_exceptions=True)
+
+
+async def find_block_by_timestamp(rpc, timestamp):
+    """Returns the first block with timestamp >= given one, bisecting block headers.
+
+    Bisection starts from the closest blocks around timestamp known to the block index
+    """
+    latest_block = await rpc.get_block_number()
+    low, high = 0, latest_block
+    if rpc.block_index is not None:
+        before, after = rpc.block_index.get_bounds(timestamp)
+        if before is not None:
+            low = before + 1
+        if after is not None and after <= latest_block:
+            high = after
+    if low > latest_block:
+        return latest_block + 1
+    if high == latest_block and await rpc.get_block_timestamp(high) < timestamp:
+        return high + 1
+    while low < high:
+        middle = (low + high) // 2
+        if await rpc.get_block_timestamp(middle) < timestamp:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+async def sync_bounty_events(rpc, cache, node_id, start_date=None, end_date=None):
+    """Extends the synced block range of the node to cover the date window.
+
+    The last bounty block is the last block not newer than the node last reward date.
+    Window bounds are resolved to blocks by timestamp only when the cache can't answer
+    """
+    start_block, last_reward_date = await rpc.get_node_reward_info(node_id)
+    synced_range = cache.get_synced_range(node_id)
+    newest_event = cache.get_newest_event(node_id)
+    if synced_range is not None and newest_event is not None and \
+            newest_event[1] >= last_reward_date:
+        last_block = synced_range[1]
+    else:
+        last_block = await find_block_by_timestamp(rpc, last_reward_date + 1) - 1
+    if synced_range is not None and last_block < synced_range[1]:
+        cache.reset_node(node_id)
+        synced_range = None
+    lowest_block, highest_block = synced_range or (None, None)
+
+    first_block, top_block = start_block, last_block
+    if start_date is not None and lowest_block != start_block:
+        first_block = max(await find_block_by_timestamp(rpc, to_timestamp(start_date)),
+                          start_block)
+    if end_date is not None and (highest_block is None or last_block > highest_block):
+        end_block = await find_block_by_timestamp(rpc, to_timestamp(end_date))
+        top_block = min(top_block, end_block - 1)
+    if first_block > top_block:
+        return
+
+    if synced_range is None:
+        await fetch_bounty_events(rpc, cache, node_id, top_block,
+                                  stop_block=max(first_block - 1, 0))
+        cache.set_synced_range(node_id, first_block, top_block)
+        return
+    if top_block > highest_block:
+        await fetch_bounty_events(rpc, cache, node_id, top_block, stop_block=highest_block)
+        highest_block = top_block
+    if first_block < lowest_block:
+        oldest_event = cache.get_oldest_event(node_id)
+        block_number = oldest_event[2] if oldest_event is not None else lowest_block - 1
+        await fetch_bounty_events(rpc, cache, node_id, block_number,
+                                  stop_block=max(first_block - 1, 0))
+        lowest_block = first_block
+    cache.set_synced_range(node_id, lowest_block, highest_block)
+
+
+async def sync_nodes_bounty_events(skale, cache, node_ids, start_date=None, end_date=None,
+                                   workers=METRICS_WORKERS):
+    """Syncs bounty events of the nodes concurrently.
+
+    Returns sync latencies and errors by node ID
+    """
+    latencies, errors = {}, {}
+    nodes_semaphore = asyncio.Semaphore(workers)
+    requests_semaphore = asyncio.Semaphore(MAX_INFLIGHT_REQUESTS)
+
+    async def sync_node(rpc, node_id):
+        async with nodes_semaphore:
+            started_at = time.monotonic()
+            try:
+                await sync_bounty_events(rpc, cache, node_id, start_date, end_date)
+            except Exception as err:
+                logger.exception(f'Collecting metrics for node {node_id} failed')
+                errors[node_id] = err
+            else:
+                latencies[node_id] = time.monotonic() - started_at
+
+    async def sync_nodes(rpc):
+        await asyncio.gather(*(sync_node(rpc, node_id) for node_id in node_ids))
+
+    endpoint = getattr(skale.web3.provider, 'endpoint_uri', None)
+    with BlockIndex(skale.manager.address) as block_index:
+        if urlparse(str(endpoint)).scheme not in ('http', 'https'):
+            await sync_nodes(EventsRpc(skale, requests_semaphore, block_index))
+            return latencies, errors
+        web3 = init_async_web3(endpoint)
+        async with ClientSession(raise_for_status=True) as session:
+            await web3.provider.cache_async_session(session)
+            await sync_nodes(
+                AsyncEventsRpc(skale, requests_semaphore, web3, session, block_index)
+            )
+    return latencies, errors
+
+
+def format_metrics_row(node_id, timestamp, bounty, downtime, latency, is_validator=False):
+    metrics_row = [str(datetime.utcfromtimestamp(timestamp)),
+                   bounty,
+                   downtime,
+                   round(latency / 1000, 1)]
+    if is_validator:
+        metrics_row.insert(1, node_id)
+    return metrics_row
+
+
+def export_cached_metrics(cache, node_ids, to_file, start_date=None, end_date=None, wei=False,
+                          is_validator=False):
+    """Streams cached metrics of the nodes to the file, newest first"""
+    def metrics_rows():
+        for node_id, timestamp, bounty, downtime, latency in cache.iter_events(
+                node_ids, start_date, end_date):
+            bounty = bounty if wei else to_skl(bounty)
+            yield format_metrics_row(node_id, timestamp, bounty, downtime, latency,
+                                     is_validator)
+
+    columns = VALIDATOR_METRICS_COLUMNS if is_validator else NODE_METRICS_COLUMNS
+    dtypes = ['t', 'w' if wei else 'a', 'i', 'f']
+    if is_validator:
+        dtypes.insert(1, 'i')
+    export_rows(to_file, columns, metrics_rows(), dtypes)
+
+
+def refresh_bounty_rollups(cache, node_id, period):
+    """Recomputes rollup buckets of the node that got events since the last refresh"""
+    synced_range = cache.get_synced_range(node_id)
+    rollup_range = cache.get_rollup_range(node_id, period)
+    if synced_range is None or synced_range == rollup_range:
+        return
+    time_range = cache.get_events_time_range(node_id, *(rollup_range or ()))
+    if time_range is None:
+        cache.set_rollup_range(node_id, period, synced_range)
+        return
+    first_bucket = bucket_start(time_range[0], period)
+    end_bucket = next_bucket(bucket_start(time_range[1], period), period)
+    events = cache.iter_events([node_id], datetime.utcfromtimestamp(first_bucket),
+                               datetime.utcfromtimestamp(end_bucket))
+    rollups = [
+        (bucket, aggregate.count, aggregate.bounty, aggregate.downtime, aggregate.latency)
+        for (bucket, _), aggregate in MetricsColumns.from_events(events).rollup(period).items()
+    ]
+    cache.set_rollups(node_id, period, rollups, synced_range, first_bucket, end_bucket)
+
+
+def get_bounty_rollups(cache, node_ids, period, start_date=None, end_date=None):
+    """Returns Aggregate by (bucket, node_id) for the date window.
+
+    Buckets inside the window are read from stored rollups, buckets cut by the window
+    edges are aggregated from the events
+    """
+    for node_id in node_ids:
+        refresh_bounty_rollups(cache, node_id, period)
+    first_bucket = end_bucket = None
+    if start_date is not None:
+        first_bucket = bucket_start(to_timestamp(start_date), period)
+        if first_bucket < to_timestamp(start_date):
+            first_bucket = next_bucket(first_bucket, period)
+    if end_date is not None:
+        end_bucket = bucket_start(to_timestamp(end_date), period)
+
+    if first_bucket is not None and end_bucket is not None and first_bucket >= end_bucket:
+        rollups, edges = {}, [(start_date, end_date)]
+    else:
+        rollups = {
+            (bucket, node_id): Aggregate(count, bounty, downtime, latency)
+            for bucket, node_id, count, bounty, downtime, latency in
+            cache.get_rollups(node_ids, period, first_bucket, end_bucket)
+        }
+        edges = []
+        if first_bucket is not None:
+            edges.append((start_date, datetime.utcfromtimestamp(first_bucket)))
+        if end_bucket is not None:
+            edges.append((datetime.utcfromtimestamp(end_bucket), end_date))
+    for edge_start, edge_end in edges:
+        events = cache.iter_events(node_ids, edge_start, edge_end)
+        rollups.update(MetricsColumns.from_events(events).rollup(period))
+    return rollups
+
+
+def get_metrics_from_events(skale, node_id, start_date=None, end_date=None, wei=False,
+                            to_file=None):
+    with BountyCache(skale.manager.address) as cache:
+        _, errors = asyncio.run(
+            sync_nodes_bounty_events(skale, cache, [node_id], start_date, end_date)
+        )
+        if node_id in errors:
+            raise errors[node_id]
+        if to_file:
+            export_cached_metrics(cache, [node_id], to_file, start_date, end_date, wei)
+        return MetricsColumns.from_events(cache.iter_events([node_id], start_date, end_date))
@@ -27,6 +27,7 @@ from yaspin import yaspin
 from core.transaction import TxFee
 from utils.constants import SPIN_COLOR
 from utils.helper import to_wei
+from utils.output_formats import TABLE_FORMAT, is_structured, print_record
 from utils.print_formatters import print_srw_balance
 from utils.web3_utils import init_skale_from_config, init_skale_w_wallet_from_config
 
@@ -85,7 +86,10 @@ def withdraw(amount: str, pk_file: str, fee: Optional[TxFee]) -> None:
         print(f'Transaction hash: {tx_res.tx_hash}')
 
 
-def balance(validator_id, wei=False):
-    skale = init_skale_from_config()
+def balance(validator_id, wei=False, output_format=TABLE_FORMAT):
+    skale = init_skale_from_config(disable_spin=is_structured(output_format))
     srw_balance = skale.wallets.get_validator_balance(validator_id)
+    if is_structured(output_format):
+        print_record({'validator_id': validator_id, 'balance': srw_balance}, output_format)
+        return
     print_srw_balance(validator_id, srw_balance, wei)
@@ -0,0 +1,180 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of validator-cli
+#
+#   Copyright (C) 2020 SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import dataclasses
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from skale.transactions.tools import compose_base_fields
+
+from core.transaction import TxFee
+from utils.rpc_batch import RpcCallError, check_result, request_batch
+
+logger = logging.getLogger(__name__)
+
+GAS_LIMIT_MULTIPLIER = 1.2
+RECEIPT_POLL_INTERVAL = 3
+RECEIPTS_TIMEOUT = 600
+MAX_RESUBMISSIONS = 3
+
+TX_SKIPPED = 'skipped'
+TX_SIGNED = 'signed'
+TX_SENT = 'sent'
+TX_MINED = 'mined'
+TX_REVERTED = 'reverted'
+TX_FAILED = 'failed'
+TX_TIMEOUT = 'timeout'
+WAITING_STATUSES = (TX_SIGNED, TX_SENT)
+
+
+@dataclass
+class PipelinedTx:
+    """Contract transaction submitted with the other transactions of a pipeline"""
+    name: str
+    contract: object
+    fn_name: str
+    args: Tuple = ()
+    nonce: Optional[int] = None
+    raw_tx: Optional[str] = None
+    tx_hash: Optional[str] = None
+    status: Optional[str] = None
+    resubmissions: int = 0
+    error: Optional[str] = None
+
+    @property
+    def data(self):
+        return self.contract.encodeABI(fn_name=self.fn_name, args=self.args)
+
+
+def send_pipelined(skale, txs, fee: TxFee, on_update=None, timeout=RECEIPTS_TIMEOUT):
+    """Sends the transactions without waiting for each other's receipts.
+
+    Transactions are signed with sequential nonces up front, broadcast back to
+    back and their receipts are polled in batches till all of them are mined.
+    Transactions dropped by the node are resubmitted up to MAX_RESUBMISSIONS
+    times, the ones after a failed nonce are failed at once as they can't be
+    mined. Final status of every transaction is set in its `status`
+    """
+    sign_txs(skale, txs, fee)
+    broadcast_txs(skale.web3, [tx for tx in txs if tx.status == TX_SIGNED])
+    deadline = time.monotonic() + timeout
+    while True:
+        waiting = [tx for tx in txs if tx.status in WAITING_STATUSES]
+        if waiting:
+            check_receipts(skale, waiting)
+        if on_update:
+            on_update(txs)
+        waiting = [tx for tx in txs if tx.status in WAITING_STATUSES]
+        if not waiting:
+            return txs
+        if time.monotonic() > deadline:
+            first_nonce = min(tx.nonce for tx in waiting)
+            for tx in waiting:
+                tx.status = TX_TIMEOUT
+                if tx.nonce > first_nonce:
+                    tx.error = f'Waits for transaction with nonce {first_nonce}'
+            return txs
+        time.sleep(RECEIPT_POLL_INTERVAL)
+
+
+def sign_txs(skale, txs, fee):
+    """Signs transactions which gas estimation succeeds, nonces are assigned in order"""
+    address = skale.wallet.address
+    estimates = request_batch(skale.web3, [
+        ('eth_estimateGas', [{'from': address, 'to': tx.contract.address, 'data': tx.data}])
+        for tx in txs
+    ])
+    nonce = skale.web3.eth.get_transaction_count(address, 'pending')
+    for tx, estimate in zip(txs, estimates):
+        if isinstance(estimate, RpcCallError):
+            tx.status = TX_SKIPPED
+            tx.error = str(estimate)
+            continue
+        tx.nonce = nonce
+        nonce += 1
+        signed_tx = skale.wallet.sign({
+            'to': tx.contract.address,
+            'data': tx.data,
+            **compose_base_fields(
+                nonce=tx.nonce,
+                gas_limit=int(int(estimate, 16) * GAS_LIMIT_MULTIPLIER),
+                **dataclasses.asdict(fee)
+            )
+        })
+        tx.raw_tx = signed_tx.rawTransaction.hex()
+        tx.tx_hash = signed_tx.hash.hex()
+        tx.status = TX_SIGNED
+
+
+def broadcast_txs(web3, txs):
+    """Sends signed transactions in one batch, rejected ones stay signed to be resubmitted"""
+    results = request_batch(web3, [('eth_sendRawTransaction', [tx.raw_tx]) for tx in txs])
+    for tx, result in zip(txs, results):
+        if isinstance(result, RpcCallError):
+            logger.info(f'Transaction {tx.name} with nonce {tx.nonce} rejected: {result}')
+            tx.error = str(result)
+        else:
+            tx.status = TX_SENT
+            tx.error = None
+
+
+def check_receipts(skale, txs):
+    """Updates statuses of waiting transactions by their receipts.
+
+    Transactions the node doesn't know anymore are resubmitted, the ones
+    which nonce was taken by another transaction are failed. When a failed
+    transaction leaves its nonce unused, all transactions after it are failed
+    """
+    calls = [('eth_getTransactionCount', [skale.wallet.address, 'latest'])]
+    calls += [('eth_getTransactionReceipt', [tx.tx_hash]) for tx in txs]
+    calls += [('eth_getTransactionByHash', [tx.tx_hash]) for tx in txs]
+    results = request_batch(skale.web3, calls)
+    # the count is requested first, so receipts of all nonces below it are already there
+    next_nonce = int(check_result(results[0]), 16)
+    receipts, known_txs = results[1:len(txs) + 1], results[len(txs) + 1:]
+    dropped = []
+    for tx, receipt, known_tx in zip(txs, receipts, known_txs):
+        if isinstance(receipt, RpcCallError) or isinstance(known_tx, RpcCallError):
+            continue
+        if receipt:
+            tx.status = TX_MINED if int(receipt['status'], 16) == 1 else TX_REVERTED
+            tx.error = None
+        elif tx.nonce < next_nonce:
+            tx.status = TX_FAILED
+            tx.error = 'Nonce is used by another transaction'
+        elif known_tx is None:
+            if tx.resubmissions >= MAX_RESUBMISSIONS:
+                tx.status = TX_FAILED
+                tx.error = tx.error or 'Transaction is dropped'
+            else:
+                tx.resubmissions += 1
+                dropped.append(tx)
+    gap_nonces = [tx.nonce for tx in txs if tx.status == TX_FAILED and tx.nonce >= next_nonce]
+    if gap_nonces:
+        gap_nonce = min(gap_nonces)
+        for tx in txs:
+            if tx.nonce > gap_nonce and tx.status in WAITING_STATUSES:
+                tx.status = TX_FAILED
+                tx.error = f'Nonce {gap_nonce} is not used, the transaction can not be mined'
+        dropped = [tx for tx in dropped if tx.status in WAITING_STATUSES]
+    if dropped:
+        logger.info(f'Resubmitting {len(dropped)} dropped transactions')
+        broadcast_txs(skale.web3, dropped)
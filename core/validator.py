@@ -24,14 +24,21 @@ from typing import Optional
 import click
 from yaspin import yaspin
 from terminaltables import SingleTable
+from skale.contracts.manager.delegation.validator_service import FIELDS as VALIDATOR_FIELDS
+from skale.utils.web3_utils import to_checksum_address
 
+from core.delegations import DelegationFilter, validator_delegations
 from core.transaction import TxFee
+from core.tx_pipeline import TX_MINED, WAITING_STATUSES, PipelinedTx, send_pipelined
 from utils.web3_utils import (
     init_skale_from_config, init_skale_w_wallet_from_config)
-from utils.print_formatters import (print_bond_amount, print_validators,
-                                    print_delegations, print_linked_addresses)
-from utils.helper import to_wei, from_wei, percent_to_permille, permille_to_percent
+from utils.print_formatters import (print_bond_amount, print_validators, print_delegations,
+                                    print_linked_addresses, print_tx_statuses)
+from utils.helper import page, to_wei, from_wei, percent_to_permille, permille_to_percent
 from utils.constants import SPIN_COLOR
+from utils.rpc_batch import (RpcCallError, check_result, decode_call_result, eth_call,
+                             request_batch)
+from utils.output_formats import TABLE_FORMAT, is_structured, print_record, print_records
 
 
 def register(name: str, description: str, commission_rate: float, min_delegation: int,
@@ -54,21 +61,38 @@ def register(name: str, description: str, commission_rate: float, min_delegation
         print(f'Transaction hash: {tx_res.tx_hash}')
 
 
-def validators_list(wei, all):
-    skale = init_skale_from_config()
+def validators_list(wei, all, offset=0, limit=None, output_format=TABLE_FORMAT):
+    skale = init_skale_from_config(disable_spin=is_structured(output_format))
     if not all:
-        validators = skale.validator_service.ls(trusted_only=True)
+        validator_ids = skale.validator_service.get_trusted_validator_ids()
     else:
-        validators = skale.validator_service.ls()
+        validator_ids = range(1, skale.validator_service.number_of_validators() + 1)
+    validators = (
+        skale.validator_service.get_with_id(val_id)
+        for val_id in page(validator_ids, offset, limit)
+    )
+    if is_structured(output_format):
+        print_records(validators, output_format)
+        return
     print_validators(validators, wei)
 
 
-def delegations(validator_id, wei):
-    skale = init_skale_from_config()
+def delegations(validator_id, wei, offset=0, limit=None, output_format=TABLE_FORMAT,
+                statuses=(), since=None, delegator=None, min_amount=None):
+    skale = init_skale_from_config(disable_spin=is_structured(output_format))
     if not skale:
         return
-    delegations_list = skale.delegation_controller.get_all_delegations_by_validator(
-        validator_id)
+    delegation_filter = DelegationFilter(
+        statuses=tuple(statuses),
+        since=since,
+        holder=to_checksum_address(delegator) if delegator else None,
+        min_amount=None if min_amount is None else to_wei(min_amount)
+    )
+    delegations_list = validator_delegations(skale, validator_id, offset, limit,
+                                             delegation_filter)
+    if is_structured(output_format):
+        print_records(delegations_list, output_format)
+        return
     print(f'Delegations for validator ID {validator_id}:\n')
     print_delegations(delegations_list, wei)
 
@@ -91,18 +115,16 @@ def accept_pending_delegation(
         print(f'Transaction hash: {tx_res.tx_hash}')
 
 
-def accept_all_delegations(pk_file: str, fee: Optional[TxFee]) -> None:
+def accept_all_delegations(pk_file: str, fee: Optional[TxFee], pipeline: bool = False) -> None:
     skale = init_skale_w_wallet_from_config(pk_file)
     if not skale:
         return
     fee = fee or TxFee(gas_price=skale.gas_price)
     validator_id = skale.validator_service.validator_id_by_address(
         skale.wallet.address)
-    delegations_list = skale.delegation_controller.get_all_delegations_by_validator(
-        validator_id)
-
-    pending_delegations = list(filter(lambda delegation: delegation['status'] == 'PROPOSED',
-                                      delegations_list))
+    pending_delegations = list(validator_delegations(
+        skale, validator_id, delegation_filter=DelegationFilter(statuses=('PROPOSED',))
+    ))
     n_of_pending_delegations = len(pending_delegations)
     if n_of_pending_delegations == 0:
         print('No pending delegations to accept')
@@ -115,6 +137,10 @@ def accept_all_delegations(pk_file: str, fee: Optional[TxFee]) -> None:
         print('Operation canceled')
         return
 
+    if pipeline:
+        accept_delegations_pipelined(skale, pending_delegations, fee)
+        return
+
     with yaspin(text='Accepting ALL delegation requests', color=SPIN_COLOR) as sp:
         for delegation in pending_delegations:
             tx_res = skale.delegation_controller.accept_pending_delegation(
@@ -126,6 +152,25 @@ def accept_all_delegations(pk_file: str, fee: Optional[TxFee]) -> None:
             print(f'Transaction hash: {tx_res.tx_hash}')
 
 
+def accept_delegations_pipelined(skale, delegations_list, fee: TxFee) -> None:
+    txs = [
+        PipelinedTx(f'Accept delegation {delegation["id"]}',
+                    skale.delegation_controller.contract, 'acceptPendingDelegation',
+                    (delegation['id'],))
+        for delegation in delegations_list
+    ]
+
+    with yaspin(text='Sending ALL delegation accept transactions', color=SPIN_COLOR) as sp:
+        def show_progress(txs):
+            done = sum(tx.status not in WAITING_STATUSES for tx in txs)
+            sp.text = f'Waiting for receipts: {done}/{len(txs)} transactions done'
+
+        send_pipelined(skale, txs, fee, on_update=show_progress)
+    print_tx_statuses(txs)
+    n_of_accepted = sum(tx.status == TX_MINED for tx in txs)
+    print(f'\n{n_of_accepted} of {len(txs)} delegation(s) accepted')
+
+
 def link_node_address(node_address: str,
                       signature: str,
                       pk_file: str,
@@ -160,33 +205,71 @@ def unlink_node_address(node_address: str, pk_file: str, fee: Optional[TxFee]) -
         print(f'Transaction hash: {tx_res.tx_hash}')
 
 
-def linked_addresses(address):
-    skale = init_skale_from_config()
+def linked_addresses(address, output_format=TABLE_FORMAT):
+    skale = init_skale_from_config(disable_spin=is_structured(output_format))
     if not skale:
         return
     addresses = skale.validator_service.get_linked_addresses_by_validator_address(
         address)
     addresses_info = get_addresses_info(skale, addresses)
+    if is_structured(output_format):
+        print_records(addresses_info, output_format)
+        return
     print(f'Linked addresses for {address}:\n')
     print_linked_addresses(addresses_info)
 
 
 def get_addresses_info(skale, addresses):
+    """Returns statuses and balances of the addresses in two batched round-trips.
+
+    An address is primary when it's the main address of the validator it
+    belongs to, the same check as ValidatorService.is_main_address does
+    """
+    contract = skale.validator_service.contract
+    results = request_batch(skale.web3, [
+        *(('eth_getBalance', [address, 'latest']) for address in addresses),
+        *(eth_call(contract, 'getValidatorId', address) for address in addresses)
+    ])
+    balances = [check_result(balance) for balance in results[:len(addresses)]]
+    id_results = results[len(addresses):]
+    validator_ids = [
+        None if isinstance(result, RpcCallError)
+        else decode_call_result(contract, 'getValidatorId', result)
+        for result in id_results
+    ]
+    main_addresses = get_validator_main_addresses(skale, set(filter(None, validator_ids)))
     return [
         {
             'address': address,
-            'status': 'Primary' if skale.validator_service.is_main_address(address) else 'Linked',
-            'balance': str(skale.web3.fromWei(skale.web3.eth.getBalance(address), 'ether'))
+            'status': 'Primary' if main_addresses.get(validator_id) == address else 'Linked',
+            'balance': int(balance, 16)
         }
-        for address in addresses
+        for address, balance, validator_id in zip(addresses, balances, validator_ids)
     ]
 
 
-def info(validator_id):
-    skale = init_skale_from_config()
+def get_validator_main_addresses(skale, validator_ids):
+    contract = skale.validator_service.contract
+    validator_ids = sorted(validator_ids)
+    results = request_batch(skale.web3, [
+        eth_call(contract, 'validators', validator_id) for validator_id in validator_ids
+    ])
+    address_index = VALIDATOR_FIELDS.index('validator_address')
+    return {
+        validator_id: decode_call_result(contract, 'validators', result)[address_index]
+        for validator_id, result in zip(validator_ids, results)
+        if not isinstance(result, RpcCallError)
+    }
+
+
+def info(validator_id, output_format=TABLE_FORMAT):
+    skale = init_skale_from_config(disable_spin=is_structured(output_format))
     if not skale:
         return
     validator_info = skale.validator_service.get(validator_id)
+    if is_structured(output_format):
+        print_record({'id': validator_id, **validator_info}, output_format)
+        return
     # is_accepting_new_requests = skale.validator_service.is_accepting_new_requests(validator_id)
     # accepting_delegation_requests = 'Yes' if is_accepting_new_requests else 'No'
     minimum_delegation_amount = from_wei(
@@ -219,11 +302,14 @@ def withdraw_fee(recipient_address: str, pk_file: str, fee: Optional[TxFee]) ->
         print(f'Transaction hash: {tx_res.tx_hash}')
 
 
-def get_bond_amount(validator_id, wei=False):
-    skale = init_skale_from_config()
+def get_bond_amount(validator_id, wei=False, output_format=TABLE_FORMAT):
+    skale = init_skale_from_config(disable_spin=is_structured(output_format))
     bond_amount = skale.validator_service.get_and_update_bond_amount(
         validator_id
     )
+    if is_structured(output_format):
+        print_record({'validator_id': validator_id, 'bond_amount': bond_amount}, output_format)
+        return
     print_bond_amount(validator_id, bond_amount, wei)
 
 
@@ -275,11 +361,14 @@ def confirm_address(validator_id: int, pk_file: str, fee: Optional[TxFee]) -> No
         print(f'Transaction hash: {tx_res.tx_hash}')
 
 
-def earned_fees(validator_address, wei):
-    skale = init_skale_from_config()
+def earned_fees(validator_address, wei, output_format=TABLE_FORMAT):
+    skale = init_skale_from_config(disable_spin=is_structured(output_format))
     if not skale:
         return
     earned_fee = skale.distributor.get_earned_fee_amount(validator_address)
+    if is_structured(output_format):
+        print_record({'address': validator_address, **earned_fee}, output_format)
+        return
     earned_fee_amount = earned_fee['earned']
     earned_fee_msg = f'Earned fee for {validator_address}: '
     if not wei:
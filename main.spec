@@ -39,13 +39,21 @@ a = Analysis(
     binaries=binaries,
     datas=[
         ("./text.yml", "data"),
+        ("./text.marshal", "data"),
         (os.path.dirname(wcwidth.__file__), 'wcwidth'),
         *external_data
     ],
     hiddenimports=[
         'eth_hash.pkg_resources.pysha3', 
         'pkg_resources.py2_warn', 
-        'cmath'
+        'cmath',
+        # command groups imported lazily by cli/main.py
+        'cli.validator',
+        'cli.metrics',
+        'cli.holder',
+        'cli.sgx_wallet',
+        'cli.wallet',
+        'cli.srw'
     ],
     hookspath=hookspath,
     runtime_hooks=runtime_hooks,
@@ -41,6 +41,9 @@ EXECUTABLE_NAME=sk-val-$VERSION-$OS
 
 UNAME_RES="$(uname -s)"
 
+python $DIR/compile_texts.py
+python $DIR/check_import_time.py
+
 pyinstaller main.spec
 
 mv $PARENT_DIR/dist/main $PARENT_DIR/dist/$EXECUTABLE_NAME
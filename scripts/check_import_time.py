@@ -0,0 +1,72 @@
+"""Fails when sk-val entrypoint imports heavy dependencies or exceeds import time budget.
+
+Usage: python scripts/check_import_time.py [--budget-ms 250] [--runs 3]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+ENTRYPOINT_MODULE = 'cli.main'
+DEFAULT_BUDGET_MS = 250
+# Should be imported only by the command groups that use them
+LAZY_MODULES = ('web3', 'skale', 'sgx', 'eth_account', 'pandas', 'pyarrow', 'aiohttp',
+                'yaspin', 'terminaltables', 'texttable')
+
+
+def measure_import(module=ENTRYPOINT_MODULE):
+    """Returns cumulative import time of the module (us) and names of all imported modules"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'Import of {module} failed:\n{result.stderr}')
+    cumulative, modules = None, []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, total, name = line.split('|')
+        if not total.strip().isdigit():
+            continue
+        modules.append(name.strip())
+        if name.strip() == module:
+            cumulative = int(total)
+    return cumulative, modules
+
+
+def find_lazy_modules(modules):
+    return sorted({name for name in modules if name.split('.')[0] in LAZY_MODULES})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check sk-val import time budget')
+    parser.add_argument('--budget-ms', type=float,
+                        default=float(os.getenv('IMPORT_TIME_BUDGET_MS', DEFAULT_BUDGET_MS)))
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    timings = []
+    for _ in range(args.runs):
+        cumulative, modules = measure_import()
+        timings.append(cumulative / 1000)
+    import_time = min(timings)
+    print(f'{ENTRYPOINT_MODULE} import time: {import_time:.1f} ms, '
+          f'budget: {args.budget_ms:.1f} ms')
+
+    errors = []
+    lazy_modules = find_lazy_modules(modules)
+    if lazy_modules:
+        errors.append(f'Heavy modules imported at startup: {", ".join(lazy_modules)}')
+    if import_time > args.budget_ms:
+        errors.append(f'Import time budget exceeded: {import_time:.1f} > {args.budget_ms:.1f} ms')
+    for error in errors:
+        print(error, file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,16 @@
+"""Compiles text.yml into text.marshal bundled into the binary.
+
+Usage: python scripts/compile_texts.py
+"""
+
+import os
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from utils.texts import compile_texts  # noqa: E402
+
+
+if __name__ == '__main__':
+    print(f'Texts compiled to {compile_texts()}')
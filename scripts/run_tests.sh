@@ -11,4 +11,4 @@ export ENV=test
 
 bash scripts/run_sgx_simulator.sh
 
-py.test --cov=$PROJECT_DIR/ $PROJECT_DIR/tests/ --ignore=tests/cli/metrics_node_test.py --ignore=tests/cli/metrics_validator_test.py $@
+py.test --cov=$PROJECT_DIR/ $PROJECT_DIR/tests/ $@
@@ -45,6 +45,7 @@ extras_require = {
     'dev': [
         "PyInstaller==5.5",
         "pytest==5.4.2",
+        "pandas==1.5.1",
         "twine==3.1.1",
         "mock==4.0.2",
         "boto3==1.13.7",
@@ -53,11 +54,15 @@ extras_require = {
     ],
     'hw-wallet': [
         "ledgerblue==0.1.31"
+    ],
+    'parquet': [
+        "pyarrow==11.0.0"
     ]
 }
 
 extras_require['dev'] = (
-    extras_require['linter'] + extras_require['dev'] + extras_require['hw-wallet']
+    extras_require['linter'] + extras_require['dev'] + extras_require['hw-wallet'] +
+    extras_require['parquet']
 )
 
 
@@ -77,7 +82,6 @@ setup(
         "skale.py==5.8dev3",
         "yaspin==2.2.0",
         "texttable==1.6.4",
-        "pandas==1.5.1",
         "terminaltables==3.1.10",
     ],
     python_requires='>=3.7,<4',
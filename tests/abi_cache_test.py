@@ -0,0 +1,67 @@
+""" Tests for utils/abi_cache.py module """
+
+import os
+import time
+
+import pytest
+
+from utils.abi_cache import AbiCacheError, CachedAbi, build_abi_cache, load_abi
+from utils.helper import write_json
+
+ABI = {
+    'validator_service_address': '0x' + '22' * 20,
+    'validator_service_abi': [{'type': 'function', 'name': 'getValidator'}],
+    'distributor_address': '0x' + '33' * 20,
+    'distributor_abi': [{'type': 'function', 'name': 'withdrawBounty'}],
+    'time_helpers_with_debug_address': None
+}
+
+
+@pytest.fixture
+def abi_filepath(tmp_dir):
+    filepath = os.path.join(tmp_dir, 'abi_cache_test.json')
+    write_json(filepath, ABI)
+    yield filepath
+    for path in (filepath, os.path.join(tmp_dir, 'abi_cache_test.cache')):
+        if os.path.isfile(path):
+            os.remove(path)
+
+
+def test_load_abi(abi_filepath):
+    abi = load_abi(abi_filepath)
+    assert os.path.isfile(abi_filepath.replace('.json', '.cache'))
+    assert abi.offsets.keys() == {'validator_service_abi', 'distributor_abi'}
+    assert abi.values == {
+        'validator_service_address': ABI['validator_service_address'],
+        'distributor_address': ABI['distributor_address'],
+        'time_helpers_with_debug_address': None
+    }
+    assert abi['distributor_abi'] == ABI['distributor_abi']
+    assert 'validator_service_abi' not in abi.values
+    assert dict(abi) == ABI
+    assert abi.get('time_helpers_with_debug_address') is None
+    with pytest.raises(KeyError):
+        abi['nodes_abi']
+
+
+def test_load_abi_rebuilds_outdated_cache(abi_filepath):
+    assert load_abi(abi_filepath)['distributor_address'] == ABI['distributor_address']
+    time.sleep(0.01)
+    write_json(abi_filepath, {**ABI, 'distributor_address': '0x' + '44' * 20})
+    with pytest.raises(AbiCacheError):
+        CachedAbi(abi_filepath.replace('.json', '.cache'), abi_filepath)
+    assert load_abi(abi_filepath)['distributor_address'] == '0x' + '44' * 20
+
+
+def test_load_abi_same_content(abi_filepath):
+    cache_filepath = build_abi_cache(abi_filepath)
+    write_json(abi_filepath, ABI)
+    os.utime(abi_filepath, ns=(0, 0))
+    assert dict(CachedAbi(cache_filepath, abi_filepath)) == ABI
+
+
+def test_load_abi_corrupted_cache(abi_filepath):
+    cache_filepath = build_abi_cache(abi_filepath)
+    with open(cache_filepath, 'wb') as cache_file:
+        cache_file.write(b'corrupted')
+    assert dict(load_abi(abi_filepath)) == ABI
@@ -0,0 +1,60 @@
+""" Tests for core/aggregation.py module """
+
+from decimal import Decimal
+
+from core.aggregation import (MetricsColumns, bucket_label, bucket_start, next_bucket,
+                              wei_to_skl)
+from utils.helper import to_skl
+
+EVENTS = [
+    (1, 2000, 3 * 10 ** 18, 2, 1500),
+    (2, 2000, 10 ** 18 // 2, 0, 1000),
+    (1, 1000, 10 ** 18, 0, 2500)
+]
+
+
+def test_wei_to_skl():
+    amounts = [0, 1, 123456789, 5 * 10 ** 21]
+    assert wei_to_skl(amounts) == [to_skl(amount) for amount in amounts]
+
+
+def test_metrics_columns_rows():
+    metrics = MetricsColumns.from_events(EVENTS)
+    assert len(metrics) == 3
+    assert metrics.rows(wei=True, is_validator=True)[0] == [
+        '1970-01-01 00:33:20', 1, 3 * 10 ** 18, 2, 1.5
+    ]
+    assert metrics.rows()[1] == ['1970-01-01 00:33:20', Decimal('0.5'), 0, 1.0]
+
+
+def test_metrics_columns_totals():
+    metrics = MetricsColumns.from_events(EVENTS)
+    assert metrics.node_totals() == [
+        [1, Decimal(4), 2, 2.0],
+        [2, Decimal('0.5'), 0, 1.0]
+    ]
+    assert metrics.total_bounty() == Decimal('4.5')
+    assert metrics.total_bounty(wei=True) == 45 * 10 ** 17
+    assert MetricsColumns().total_bounty() == 0
+
+
+def test_buckets():
+    timestamp = 1593950400  # Sunday, 2020-07-05 12:00:00 UTC
+    day = bucket_start(timestamp, 'day')
+    assert bucket_label(day, 'day') == '2020-07-05'
+    assert bucket_label(next_bucket(day, 'day'), 'day') == '2020-07-06'
+    week = bucket_start(timestamp, 'week')
+    assert bucket_label(week, 'week') == '2020-06-29'
+    assert bucket_label(next_bucket(week, 'week'), 'week') == '2020-07-06'
+    month = bucket_start(timestamp, 'month')
+    assert bucket_label(month, 'month') == '2020-07'
+    assert bucket_label(next_bucket(bucket_start(1580515200, 'month'), 'month'), 'month') == \
+        '2020-03'
+
+
+def test_metrics_columns_rollup():
+    rollups = MetricsColumns.from_events(EVENTS).rollup('day')
+    assert list(rollups) == [(0, 1), (0, 2)]
+    assert rollups[0, 1].count == 2
+    assert rollups[0, 1].bounty == 4 * 10 ** 18
+    assert rollups[0, 1].avg_latency == 2.0
@@ -0,0 +1,234 @@
+""" Synthetic SKALE chain served through a local stand-in JSON-RPC endpoint """
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from eth_abi import encode_abi
+from eth_utils import event_abi_to_log_topic, function_abi_to_4byte_selector
+from web3 import Web3
+
+MANAGER_ADDRESS = '0x' + '11' * 20
+NODES_ADDRESS = '0x' + '22' * 20
+OWNER_ADDRESS = '0x' + '33' * 20
+
+GENESIS_TIMESTAMP = 1593561600  # 2020-07-01
+BLOCK_TIME = 15
+EVENT_INTERVAL = 5760  # blocks between node bounties, about a day
+
+BOUNTY_RECEIVED_ABI = {
+    'anonymous': False,
+    'inputs': [
+        {'indexed': True, 'name': 'nodeIndex', 'type': 'uint256'},
+        {'indexed': False, 'name': 'owner', 'type': 'address'},
+        {'indexed': False, 'name': 'averageDowntime', 'type': 'uint256'},
+        {'indexed': False, 'name': 'averageLatency', 'type': 'uint256'},
+        {'indexed': False, 'name': 'bounty', 'type': 'uint256'},
+        {'indexed': False, 'name': 'previousBlockEvent', 'type': 'uint256'}
+    ],
+    'name': 'BountyReceived',
+    'type': 'event'
+}
+NODES_ABI = {
+    'inputs': [{'name': '', 'type': 'uint256'}],
+    'name': 'nodes',
+    'outputs': [
+        {'name': 'name', 'type': 'string'},
+        {'name': 'ip', 'type': 'bytes4'},
+        {'name': 'publicIP', 'type': 'bytes4'},
+        {'name': 'port', 'type': 'uint16'},
+        {'name': 'startBlock', 'type': 'uint256'},
+        {'name': 'lastRewardDate', 'type': 'uint256'},
+        {'name': 'finishTime', 'type': 'uint256'},
+        {'name': 'status', 'type': 'uint8'},
+        {'name': 'validatorId', 'type': 'uint256'}
+    ],
+    'stateMutability': 'view',
+    'type': 'function'
+}
+BOUNTY_TOPIC = '0x' + event_abi_to_log_topic(BOUNTY_RECEIVED_ABI).hex()
+NODES_SELECTOR = '0x' + function_abi_to_4byte_selector(NODES_ABI).hex()
+
+
+class SyntheticChain:
+    """Chain with `events` BountyReceived events for each of `nodes` nodes.
+
+    Node N starts at block N + 1 and gets a bounty every EVENT_INTERVAL blocks
+    """
+
+    def __init__(self, nodes, events):
+        self.nodes = nodes
+        self.events = events
+        self.block_number = self.event_block(nodes - 1, events) + EVENT_INTERVAL // 2
+
+    def start_block(self, node_id):
+        return node_id + 1
+
+    def event_block(self, node_id, number):
+        return self.start_block(node_id) + number * EVENT_INTERVAL
+
+    def timestamp(self, block_number):
+        return GENESIS_TIMESTAMP + block_number * BLOCK_TIME
+
+    def last_reward_date(self, node_id):
+        last_block = self.event_block(node_id, self.events) if self.events else \
+            self.start_block(node_id)
+        return self.timestamp(last_block)
+
+    def get_logs(self, node_id, from_block, to_block):
+        if node_id >= self.nodes:
+            return []
+        first = max(1, -(-(from_block - self.start_block(node_id)) // EVENT_INTERVAL))
+        last = min(self.events, (to_block - self.start_block(node_id)) // EVENT_INTERVAL)
+        return [self.log(node_id, number) for number in range(first, last + 1)]
+
+    def log(self, node_id, number):
+        block_number = self.event_block(node_id, number)
+        previous_block = self.event_block(node_id, number - 1) if number > 1 else 0
+        data = encode_abi(
+            ['address', 'uint256', 'uint256', 'uint256', 'uint256'],
+            [OWNER_ADDRESS, number % 3, 1000 + number % 500, (100 + node_id) * 10 ** 18,
+             previous_block]
+        )
+        return {
+            'address': MANAGER_ADDRESS,
+            'topics': [BOUNTY_TOPIC, '0x' + format(node_id, '064x')],
+            'data': '0x' + data.hex(),
+            'blockNumber': hex(block_number),
+            'blockHash': '0x' + format(block_number, '064x'),
+            'transactionHash': '0x' + format(block_number, '064x'),
+            'transactionIndex': '0x0',
+            'logIndex': '0x0',
+            'removed': False
+        }
+
+    def block(self, block_number):
+        return {
+            'number': hex(block_number),
+            'hash': '0x' + format(block_number, '064x'),
+            'parentHash': '0x' + format(max(block_number - 1, 0), '064x'),
+            'timestamp': hex(self.timestamp(block_number)),
+            'transactions': []
+        }
+
+    def call(self, tx):
+        if tx['to'].lower() != NODES_ADDRESS or not tx['data'].startswith(NODES_SELECTOR):
+            raise ValueError(f'Unexpected call: {tx}')
+        node_id = int(tx['data'][10:], 16)
+        output_types = [output['type'] for output in NODES_ABI['outputs']]
+        return '0x' + encode_abi(output_types, [
+            f'node{node_id}', b'\x7f\x00\x00\x01', b'\x7f\x00\x00\x01', 10000,
+            self.start_block(node_id), self.last_reward_date(node_id), 0, 0, 1
+        ]).hex()
+
+    def handle(self, method, params):
+        if method == 'eth_blockNumber':
+            return hex(self.block_number)
+        if method == 'eth_chainId':
+            return hex(1)
+        if method == 'eth_getBlockByNumber':
+            block_number = self.block_number if params[0] == 'latest' else int(params[0], 16)
+            return self.block(block_number)
+        if method == 'eth_getLogs':
+            log_filter = params[0]
+            node_id = int(log_filter['topics'][1], 16)
+            return self.get_logs(node_id, to_int(log_filter['fromBlock']),
+                                 to_int(log_filter['toBlock']))
+        if method == 'eth_call':
+            return self.call(params[0])
+        raise ValueError(f'Method {method} is not supported')
+
+
+def to_int(value):
+    return int(value, 16) if isinstance(value, str) else value
+
+
+class StandInRpc:
+    """Local JSON-RPC server answering from the synthetic chain.
+
+    Counts calls per method (batched calls are counted as `batch`) and can
+    delay every response by `latency` seconds. Batches are rejected with an
+    HTTP error if batch_error is `http`, with a JSON-RPC error if it's `rpc`
+    """
+
+    def __init__(self, chain, latency=0, batch_error=None):
+        self.chain = chain
+        self.latency = latency
+        self.batch_error = batch_error
+        self.calls = Counter()
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def endpoint(self):
+        return f'http://127.0.0.1:{self.server.server_port}'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def count(self, method):
+        with self.lock:
+            self.calls[method] += 1
+
+    def respond(self, request):
+        try:
+            result = self.chain.handle(request['method'], request.get('params', []))
+        except ValueError as err:
+            return {'jsonrpc': '2.0', 'id': request['id'],
+                    'error': {'code': -32601, 'message': str(err)}}
+        return {'jsonrpc': '2.0', 'id': request['id'], 'result': result}
+
+    def _handler(self):
+        rpc = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                status = 200
+                if isinstance(request, list):
+                    rpc.count('batch')
+                    if rpc.batch_error:
+                        status = 400 if rpc.batch_error == 'http' else 200
+                        response = {'jsonrpc': '2.0', 'id': None,
+                                    'error': {'code': -32600, 'message': 'Batch is not allowed'}}
+                    else:
+                        response = [rpc.respond(r) for r in request]
+                else:
+                    rpc.count(request['method'])
+                    response = rpc.respond(request)
+                if rpc.latency:
+                    time.sleep(rpc.latency)
+                body = json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+class StandInSkale:
+    """The parts of Skale object used by the metrics engine, bound to a stand-in endpoint"""
+
+    class Contract:
+        def __init__(self, web3, address, abi):
+            self.address = Web3.toChecksumAddress(address)
+            self.contract = web3.eth.contract(address=self.address, abi=abi)
+
+    def __init__(self, endpoint):
+        self.web3 = Web3(Web3.HTTPProvider(endpoint))
+        self.manager = self.Contract(self.web3, MANAGER_ADDRESS, [BOUNTY_RECEIVED_ABI])
+        self.nodes = self.Contract(self.web3, NODES_ADDRESS, [NODES_ABI])
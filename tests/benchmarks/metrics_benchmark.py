@@ -0,0 +1,68 @@
+""" Metrics engine benchmark on a synthetic chain of N nodes x M bounty events.
+
+Usage: python -m tests.benchmarks.metrics_benchmark --nodes 16 --events 365
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+from unittest import mock
+
+from core.metrics import collect_nodes_metrics
+from tests.benchmarks.chain import StandInRpc, StandInSkale, SyntheticChain
+
+
+def peak_rss_mb():
+    """Peak RSS of the process in MB (ru_maxrss is in KB on Linux)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_metrics_benchmark(nodes, events, runs=2, latency=0, workers=None):
+    """Collects metrics of all synthetic nodes `runs` times sharing one cache.
+
+    The first run is cold, the following ones only check for new events.
+    Returns RPC calls, wall time and peak RSS for every run
+    """
+    chain = SyntheticChain(nodes, events)
+    results = []
+    with tempfile.TemporaryDirectory() as cache_dir, StandInRpc(chain, latency) as rpc, \
+            mock.patch('core.cache.SKALE_VAL_CACHE_FILE', os.path.join(cache_dir, 'cache.db')):
+        skale = StandInSkale(rpc.endpoint)
+        kwargs = {'workers': workers} if workers else {}
+        for _ in range(runs):
+            rpc.calls.clear()
+            started_at = time.monotonic()
+            metrics, stats = collect_nodes_metrics(skale, list(range(nodes)), **kwargs)
+            results.append({
+                'rows': len(metrics),
+                'errors': stats.errors,
+                'rpc_calls': sum(rpc.calls.values()),
+                'rpc_calls_by_method': dict(rpc.calls),
+                'wall_time': time.monotonic() - started_at,
+                'peak_rss_mb': peak_rss_mb()
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the metrics engine')
+    parser.add_argument('--nodes', type=int, default=16)
+    parser.add_argument('--events', type=int, default=365)
+    parser.add_argument('--runs', type=int, default=2)
+    parser.add_argument('--latency', type=float, default=0,
+                        help='Delay of every RPC response, seconds')
+    parser.add_argument('--workers', type=int)
+    args = parser.parse_args()
+    results = run_metrics_benchmark(args.nodes, args.events, args.runs, args.latency,
+                                    args.workers)
+    print(f'{args.nodes} nodes x {args.events} events')
+    for number, result in enumerate(results, start=1):
+        print(f"run {number}: {result['rows']} rows, {result['rpc_calls']} RPC calls "
+              f"{result['rpc_calls_by_method']}, {result['wall_time']:.2f}s, "
+              f"peak RSS {result['peak_rss_mb']:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
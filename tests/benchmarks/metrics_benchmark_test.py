@@ -0,0 +1,18 @@
+""" Performance regression tests for the metrics engine """
+
+from tests.benchmarks.metrics_benchmark import run_metrics_benchmark
+
+NODES = 4
+EVENTS = 30
+# bisecting a block by timestamp takes at most that many header requests
+MAX_BISECTION_CALLS = 32
+
+
+def test_metrics_engine_rpc_calls():
+    cold_run, warm_run = run_metrics_benchmark(NODES, EVENTS)
+    assert not cold_run['errors']
+    assert cold_run['rows'] == warm_run['rows'] == NODES * EVENTS
+    # a log scan and a block header per event, last bounty block resolution per node
+    assert cold_run['rpc_calls'] <= NODES * (EVENTS * 2 + MAX_BISECTION_CALLS)
+    # nothing but the node reward info is requested when there are no new events
+    assert set(warm_run['rpc_calls_by_method']) <= {'eth_call', 'eth_chainId'}
@@ -0,0 +1,108 @@
+""" Tests for core/cache.py module """
+
+from datetime import datetime
+
+from core.cache import BlockIndex, BountyCache, DelegationIndex, to_timestamp
+
+CHAIN_KEY = '0x0000000000000000000000000000000000000001'
+NODE_ID = 0
+
+
+def add_events(cache, blocks):
+    previous_blocks = [0, *blocks[:-1]]
+    cache.add_events(NODE_ID, [
+        (block_number, block_number * 100, block_number * 10 ** 18, 0, 1000, previous_block)
+        for block_number, previous_block in zip(blocks, previous_blocks)
+    ])
+
+
+def test_bounty_cache_events(tmp_filepath):
+    with BountyCache(CHAIN_KEY, tmp_filepath) as cache:
+        add_events(cache, [10, 20, 30])
+        cache.set_synced_range(NODE_ID, 0, 30)
+
+    with BountyCache(CHAIN_KEY, tmp_filepath) as cache:
+        assert cache.get_synced_range(NODE_ID) == (0, 30)
+        assert cache.get_oldest_event(NODE_ID) == (10, 1000, 0)
+        events = cache.get_events(NODE_ID)
+        assert [e[0] for e in events] == [3000, 2000, 1000]
+        assert events[0][1] == 30 * 10 ** 18
+
+        start_date = datetime.utcfromtimestamp(2000)
+        end_date = datetime.utcfromtimestamp(3000)
+        assert to_timestamp(start_date) == 2000
+        events = cache.get_events(NODE_ID, start_date=start_date, end_date=end_date)
+        assert [e[0] for e in events] == [2000]
+
+
+def test_bounty_cache_rollups(tmp_filepath):
+    with BountyCache(CHAIN_KEY, tmp_filepath) as cache:
+        add_events(cache, [10, 20, 30])
+        cache.set_synced_range(NODE_ID, 0, 30)
+        assert cache.get_events_time_range(NODE_ID) == (1000, 3000)
+        assert cache.get_events_time_range(NODE_ID, 0, 20) == (3000, 3000)
+        assert cache.get_events_time_range(NODE_ID, 0, 30) is None
+
+        cache.set_rollups(NODE_ID, 'day', [(0, 2, 30 * 10 ** 18, 0, 2.0), (86400, 1, 1, 0, 1.0)],
+                          (0, 20))
+        cache.set_rollups(NODE_ID, 'day', [(86400, 2, 2, 0, 2.0)], (0, 30),
+                          first_bucket=86400, end_bucket=2 * 86400)
+        assert cache.get_rollup_range(NODE_ID, 'day') == (0, 30)
+        assert cache.get_rollups([NODE_ID], 'day') == [
+            (0, NODE_ID, 2, 30 * 10 ** 18, 0, 2.0),
+            (86400, NODE_ID, 2, 2, 0, 2.0)
+        ]
+        assert cache.get_rollups([NODE_ID], 'day', first_bucket=1, end_bucket=86400) == []
+
+        cache.reset_node(NODE_ID)
+        assert cache.get_rollup_range(NODE_ID, 'day') is None
+        assert cache.get_rollups([NODE_ID], 'day') == []
+
+
+def test_bounty_cache_chain_change(tmp_filepath):
+    with BountyCache(CHAIN_KEY, tmp_filepath) as cache:
+        add_events(cache, [10])
+        cache.set_synced_range(NODE_ID, 0, 10)
+
+    with BountyCache('0x0000000000000000000000000000000000000002', tmp_filepath) as cache:
+        assert cache.get_synced_range(NODE_ID) is None
+        assert cache.get_events(NODE_ID) == []
+
+
+def test_block_index(tmp_filepath):
+    with BlockIndex(CHAIN_KEY, tmp_filepath) as block_index:
+        assert block_index.get_bounds(1000) == (None, None)
+        block_index.add_timestamps({10: 1000, 20: 2000, 30: 3000})
+
+    with BlockIndex(CHAIN_KEY, tmp_filepath) as block_index:
+        assert block_index.get_timestamps([10, 15, 30]) == {10: 1000, 30: 3000}
+        assert block_index.get_bounds(2000) == (10, 20)
+        assert block_index.get_bounds(2500) == (20, 30)
+        assert block_index.get_bounds(5000) == (30, None)
+
+
+def test_delegation_index(tmp_filepath):
+    holder = '0x' + 'b1' * 20
+    delegations = [
+        {'address': holder, 'validator_id': validator_id, 'amount': delegation_id * 10 ** 18,
+         'delegation_period': 3, 'created': delegation_id * 100, 'started': 0, 'finished': 0,
+         'info': '', 'id': delegation_id, 'status': 'PROPOSED'}
+        for validator_id, delegation_id in [(1, 3), (2, 4), (1, 5)]
+    ]
+    with DelegationIndex(CHAIN_KEY, tmp_filepath) as index:
+        assert index.get_synced_block() is None
+        index.add_delegations(delegations)
+        index.add_scope('validator:1')
+        index.set_synced_block(100)
+
+    with DelegationIndex(CHAIN_KEY, tmp_filepath) as index:
+        assert index.get_synced_block() == 100
+        assert index.is_seeded('validator:1')
+        assert not index.is_seeded('validator:2')
+        assert index.get_delegations(validator_id=1) == [delegations[0], delegations[2]]
+        assert index.get_delegations(address=holder,
+                                     since=datetime.utcfromtimestamp(400)) == delegations[1:]
+        index.reset()
+        assert index.get_delegations() == []
+        assert index.get_synced_block() is None
+        assert not index.is_seeded('validator:1')
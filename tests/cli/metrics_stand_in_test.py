@@ -0,0 +1,83 @@
+""" Tests for cli/metrics.py module against the stand-in RPC endpoint """
+
+import json
+from unittest import mock
+
+import pytest
+
+from cli.metrics import validator
+from tests.benchmarks.chain import StandInRpc, StandInSkale, SyntheticChain
+from tests.utils import parse_table
+
+NODES = 2
+EVENTS = 40  # daily bounties from 2020-07-02 to 2020-08-10
+VALIDATOR_ID = 1
+
+
+@pytest.fixture
+def stand_in_skale(tmp_filepath):
+    with StandInRpc(SyntheticChain(NODES, EVENTS)) as rpc, \
+            mock.patch('core.cache.SKALE_VAL_CACHE_FILE', tmp_filepath), \
+            mock.patch('cli.metrics.init_skale_from_config',
+                       return_value=StandInSkale(rpc.endpoint)), \
+            mock.patch('cli.metrics.check_if_validator_is_registered', return_value=True), \
+            mock.patch('core.metrics.get_nodes_for_validator',
+                       return_value=list(range(NODES))):
+        yield
+
+
+def assert_run_stats(output_list):
+    stats_index = next(i for i, line in enumerate(output_list)
+                       if line.startswith(f'Metrics collected for {NODES} node(s)'))
+    assert output_list.index(' Total bounty per the given period: 8040.000 SKL') < stats_index
+    latency_rows = parse_table('\n'.join(output_list[stats_index:]), 'Node ID Latency (s)')
+    assert [row[0] for row in latency_rows] == ['0', '1']
+
+
+def test_metrics_group_by_month(stand_in_skale, runner):
+    result = runner.invoke(validator, ['-id', str(VALIDATOR_ID), '--group-by', 'month'])
+    assert result.exit_code == 0, result.output
+
+    rows = parse_table(result.output, 'Date All nodes Node ID = 0 Node ID = 1')
+    assert rows == [
+        ['2020-08', '2010.000', '1000.000', '1010.000'],
+        ['2020-07', '6030.000', '3000.000', '3030.000']
+    ]
+    assert_run_stats(result.output.splitlines())
+
+
+def test_metrics_group_by_month_to_ndjson(stand_in_skale, runner, tmp_filepath):
+    to_file = tmp_filepath + '.ndjson'
+    result = runner.invoke(validator, ['-id', str(VALIDATOR_ID), '--group-by', 'month',
+                                       '-f', to_file])
+    assert result.exit_code == 0, result.output
+
+    with open(to_file) as f:
+        records = [json.loads(line) for line in f]
+    assert [list(record.values()) for record in records] == [
+        ['2020-08', '2010', '1000', '1010'],
+        ['2020-07', '6030', '3000', '3030']
+    ]
+    assert list(records[0]) == ['Date', 'All nodes', 'Node ID = 0', 'Node ID = 1']
+
+
+def test_metrics_to_ndjson(stand_in_skale, runner, tmp_filepath):
+    to_file = tmp_filepath + '.ndjson'
+    result = runner.invoke(validator, ['-id', str(VALIDATOR_ID), '-f', to_file])
+    assert result.exit_code == 0, result.output
+
+    rows = parse_table(result.output, 'Date Node ID Bounty Downtime Latency')
+    assert len(rows) == NODES * EVENTS
+    assert parse_table(result.output, 'Node ID Total Bounty Downtime Latency') == [
+        ['0', '4000.0', '40', '1.0'],
+        ['1', '4040.0', '40', '1.0']
+    ]
+    assert_run_stats(result.output.splitlines())
+
+    with open(to_file) as f:
+        records = [json.loads(line) for line in f]
+    assert len(records) == NODES * EVENTS
+    assert records[0] == {'Date': '2020-08-10 00:00:30', 'Node ID': 1, 'Bounty': '101',
+                          'Downtime': 1, 'Latency': 1.0}
+    assert records[-1] == {'Date': '2020-07-02 00:00:15', 'Node ID': 0, 'Bounty': '100',
+                           'Downtime': 1, 'Latency': 1.0}
@@ -15,6 +15,7 @@ G_TEXTS = Texts()
 NO_DATA_MSG = G_TEXTS['msg']['no_data']
 NEG_ID_MSG = G_TEXTS['metrics']['validator']['index']['valid_id_msg']
 NOT_EXIST_VAL_ID_MSG = G_TEXTS['metrics']['validator']['index']['id_error_msg']
+RUN_STATS_PREFIX = 'Metrics collected for'
 
 
 def setup_module():
@@ -30,6 +31,13 @@ def yy_mm_dd_to_date(date_str):
     return datetime.strptime(date_str, format_str)
 
 
+def metrics_output(output):
+    """Output lines before the run stats, which are printed after an empty line"""
+    lines = output.splitlines()
+    stats_index = next(i for i, line in enumerate(lines) if line.startswith(RUN_STATS_PREFIX))
+    return lines[:stats_index - 1]
+
+
 def test_neg_id(runner):
     result = runner.invoke(validator, ['-id', str(-1)])
     output_list = result.output.splitlines()
@@ -49,7 +57,7 @@ def test_metrics(skale, runner):
     metrics = metrics_all['rows']
     totals = metrics_all['totals']
     row_count = len(metrics) + len(totals) + SERVICE_ROW_COUNT * 2
-    output_list = result.output.splitlines()[-row_count:]
+    output_list = metrics_output(result.output)[-row_count:]
 
     assert '       Date           Node ID    Bounty     Downtime   Latency' == output_list[0]
     assert '--------------------------------------------------------------' == output_list[1]
@@ -72,7 +80,7 @@ def test_metrics_since_not_empty(skale, runner):
     metrics = metrics_all['rows']
     totals = metrics_all['totals']
     row_count = len(metrics) + len(totals) + SERVICE_ROW_COUNT * 2
-    output_list = result.output.splitlines()[-row_count:]
+    output_list = metrics_output(result.output)[-row_count:]
 
     assert '       Date           Node ID    Bounty     Downtime   Latency' == output_list[0]
     assert '--------------------------------------------------------------' == output_list[1]
@@ -88,7 +96,7 @@ def test_metrics_since_not_empty(skale, runner):
 def test_metrics_since_empty(runner):
     start_date = '2100-01-01'
     result = runner.invoke(validator, ['-id', str(D_VALIDATOR_ID), '-s', start_date])
-    output_list = result.output.splitlines()
+    output_list = metrics_output(result.output)
 
     assert NO_DATA_MSG == output_list[-1]
 
@@ -101,7 +109,7 @@ def test_metrics_till_not_empty(skale, runner):
     totals = metrics_all['totals']
     row_count = len(metrics) + len(totals) + SERVICE_ROW_COUNT * 2
     result = runner.invoke(validator, ['-id', str(D_VALIDATOR_ID), '-t', end_date])
-    output_list = result.output.splitlines()[-row_count:]
+    output_list = metrics_output(result.output)[-row_count:]
 
     assert '       Date           Node ID    Bounty     Downtime   Latency' == output_list[0]
     assert '--------------------------------------------------------------' == output_list[1]
@@ -117,7 +125,7 @@ def test_metrics_till_not_empty(skale, runner):
 def test_metrics_till_empty(runner):
     end_date = '2000-01-01'
     result = runner.invoke(validator, ['-id', str(D_VALIDATOR_ID), '-t', end_date])
-    output_list = result.output.splitlines()
+    output_list = metrics_output(result.output)
 
     assert NO_DATA_MSG == output_list[-1]
 
@@ -133,7 +141,7 @@ def test_metrics_since_till_not_empty(skale, runner):
     row_count = len(metrics) + len(totals) + SERVICE_ROW_COUNT * 2
     result = runner.invoke(validator, ['-id', str(D_VALIDATOR_ID),
                                        '-s', start_date, '-t', end_date])
-    output_list = result.output.splitlines()[-row_count:]
+    output_list = metrics_output(result.output)[-row_count:]
 
     assert '       Date           Node ID    Bounty     Downtime   Latency' == output_list[0]
     assert '--------------------------------------------------------------' == output_list[1]
@@ -151,7 +159,7 @@ def test_metrics_since_till_empty(runner):
     end_date = '2100-02-01'
     result = runner.invoke(validator, ['-id', str(D_VALIDATOR_ID),
                                        '-s', start_date, '-t', end_date])
-    output_list = result.output.splitlines()
+    output_list = metrics_output(result.output)
 
     assert NO_DATA_MSG == output_list[-1]
 
@@ -163,7 +171,7 @@ def test_metrics_with_csv_export(skale, runner):
     metrics = metrics_all['rows']
     totals = metrics_all['totals']
     row_count = len(metrics) + len(totals) + SERVICE_ROW_COUNT * 2
-    output_list = result.output.splitlines()[-row_count:]
+    output_list = metrics_output(result.output)[-row_count:]
 
     assert '       Date           Node ID    Bounty     Downtime   Latency' == output_list[0]
     assert '--------------------------------------------------------------' == output_list[1]
@@ -190,7 +198,7 @@ def test_metrics_with_csv_export_in_wei(skale, runner):
     metrics = metrics_all['rows']
     totals = metrics_all['totals']
     row_count = len(metrics) + len(totals) + SERVICE_ROW_COUNT * 2
-    output_list = result.output.splitlines()[-row_count:]
+    output_list = metrics_output(result.output)[-row_count:]
 
     assert '       Date           Node ID            Bounty             Downtime   Latency' == output_list[0]  # noqa
     assert '------------------------------------------------------------------------------' == output_list[1]  # noqa
@@ -1,6 +1,7 @@
 """ Tests for cli/validator.py module """
 
 import copy
+import json
 import random
 from datetime import datetime
 
@@ -107,6 +108,18 @@ def test_ls(runner, skale):
     assert result.exit_code == 0
 
 
+def test_ls_json_without_disable_spin(runner, skale):
+    tty_sys = mock.Mock(stdout=mock.Mock(isatty=lambda: True))
+    with mock.patch('utils.web3_utils.DISABLE_SPIN', None), \
+            mock.patch('utils.web3_utils.sys', tty_sys):
+        result = runner.invoke(_ls, ['--format', 'json'])
+    assert result.exit_code == 0
+    validators = json.loads(result.output)
+    assert [validator['name'] for validator in validators] == [
+        validator['name'] for validator in skale.validator_service.ls(trusted_only=True)
+    ]
+
+
 def test_ls_all(runner, skale, new_wallet_pk):
     if skale.validator_service.number_of_validators() < 2:
         create_new_validator_wallet_pk(skale, runner, new_wallet_pk)
@@ -175,6 +188,61 @@ def test_delegations_skl(runner, validator, skale):
     assert result.exit_code == 0
 
 
+def test_delegations_paging(runner, validator, skale):
+    validator_id = validator
+    delegation_ids = [
+        delegation['id']
+        for delegation in skale.delegation_controller.get_all_delegations_by_validator(
+            validator_id
+        )
+    ]
+    result = runner.invoke(
+        _delegations,
+        [str(validator_id), '--offset', '1', '--limit', '1']
+    )
+    output_list = result.output.splitlines()
+    assert len(output_list) == (5 if len(delegation_ids) > 1 else 4)
+    if len(delegation_ids) > 1:
+        assert output_list[-1].split()[0] == str(delegation_ids[1])
+    assert result.exit_code == 0
+
+    result = runner.invoke(_delegations, [str(validator_id), '--limit', '0'])
+    assert result.exit_code == 2
+
+
+def test_delegations_ndjson(runner, validator, skale):
+    validator_id = validator
+    validators_delegations = skale.delegation_controller.get_all_delegations_by_validator(
+        validator_id
+    )
+    result = runner.invoke(_delegations, [str(validator_id), '--format', 'ndjson'])
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.output.splitlines()] == validators_delegations
+
+
+def test_delegations_filters(runner, validator, skale):
+    validator_id = validator
+    validators_delegations = skale.delegation_controller.get_all_delegations_by_validator(
+        validator_id
+    )
+    result = runner.invoke(_delegations, [
+        str(validator_id), '--status', 'proposed', '--status', 'accepted',
+        '--delegator', skale.wallet.address, '--format', 'ndjson'
+    ])
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.output.splitlines()] == [
+        delegation for delegation in validators_delegations
+        if delegation['status'] in ('PROPOSED', 'ACCEPTED') and
+        delegation['address'] == skale.wallet.address
+    ]
+
+    result = runner.invoke(_delegations, [
+        str(validator_id), '--since', '2100-01-01', '--format', 'ndjson'
+    ])
+    assert result.exit_code == 0
+    assert result.output == ''
+
+
 @pytest.mark.parametrize('fee_options', TEST_FEE_OPTIONS)
 def test_accept_delegation(runner, validator, skale, fee_options):
     validator_id = validator
@@ -0,0 +1,318 @@
+""" Tests for core/delegations.py module """
+
+import io
+from datetime import datetime
+from unittest import mock
+
+import pytest
+from eth_abi import encode_abi
+from eth_utils import event_abi_to_log_topic, function_abi_to_4byte_selector
+from web3 import Web3
+
+from core.cache import DelegationIndex
+from core.delegations import (DelegationFilter, fetch_delegations, get_proposed_delegation_ids,
+                              get_validator_delegation_ids, holder_delegations,
+                              validator_delegations)
+from tests.benchmarks.chain import StandInRpc
+from utils.filter import SkaleFilterError
+from utils.helper import to_wei
+from utils.validations import TokenAmountType
+
+DELEGATION_CONTROLLER_ADDRESS = Web3.toChecksumAddress('0x' + '55' * 20)
+MANAGER_ADDRESS = Web3.toChecksumAddress('0x' + '11' * 20)
+HOLDER_ADDRESS = Web3.toChecksumAddress('0x' + 'b1' * 20)
+OTHER_HOLDER_ADDRESS = Web3.toChecksumAddress('0x' + 'b2' * 20)
+DELEGATIONS_NUMBER = 120
+DELEGATION_TYPES = ['address', 'uint256', 'uint256', 'uint256', 'uint256', 'uint256',
+                    'uint256', 'string']
+
+
+def uint_function_abi(name, inputs, outputs):
+    return {
+        'inputs': [{'name': '', 'type': _type} for _type in inputs],
+        'name': name,
+        'outputs': [{'name': '', 'type': _type} for _type in outputs],
+        'stateMutability': 'view',
+        'type': 'function'
+    }
+
+
+GET_DELEGATION_ABI = {
+    'inputs': [{'name': 'delegationId', 'type': 'uint256'}],
+    'name': 'getDelegation',
+    'outputs': [{
+        'name': '',
+        'type': 'tuple',
+        'components': [
+            {'name': name, 'type': _type} for name, _type in zip(
+                ['holder', 'validatorId', 'amount', 'delegationPeriod', 'created',
+                 'started', 'finished', 'info'],
+                DELEGATION_TYPES
+            )
+        ]
+    }],
+    'stateMutability': 'view',
+    'type': 'function'
+}
+DELEGATION_PROPOSED_ABI = {
+    'anonymous': False,
+    'inputs': [{'indexed': False, 'name': 'delegationId', 'type': 'uint256'}],
+    'name': 'DelegationProposed',
+    'type': 'event'
+}
+DELEGATION_CONTROLLER_ABI = [
+    GET_DELEGATION_ABI,
+    DELEGATION_PROPOSED_ABI,
+    uint_function_abi('getState', ['uint256'], ['uint8']),
+    uint_function_abi('getDelegationsByValidatorLength', ['uint256'], ['uint256']),
+    uint_function_abi('delegationsByValidator', ['uint256', 'uint256'], ['uint256']),
+    uint_function_abi('getDelegationsByHolderLength', ['address'], ['uint256']),
+    uint_function_abi('delegationsByHolder', ['address', 'uint256'], ['uint256'])
+]
+SELECTORS = {
+    '0x' + function_abi_to_4byte_selector(abi).hex(): abi['name']
+    for abi in DELEGATION_CONTROLLER_ABI if abi['type'] == 'function'
+}
+
+
+class StandInDelegationChain:
+    """Validator 1 has delegations with IDs 1000 + index, state is ID % 3.
+
+    The holder has every other delegation of validator 1 (odd IDs) and the
+    same number of delegations to validator 2 with IDs 2000 + index, other
+    delegations of validator 1 belong to another holder. Logs requests for more
+    than max_logs_range blocks are rejected
+    """
+
+    def __init__(self):
+        self.block_number = 100
+        self.validator_length = DELEGATIONS_NUMBER
+        self.states = {}
+        self.proposed = []
+        self.max_logs_range = None
+
+    def propose(self, validator_id=1):
+        """Adds a delegation to the validator in a new block.
+
+        Delegations to validators other than 1 and 2 have IDs validator_id * 1000
+        """
+        self.block_number += 1
+        if validator_id == 1:
+            delegation_id = 1000 + self.validator_length
+            self.validator_length += 1
+        else:
+            delegation_id = validator_id * 1000
+        self.proposed.append((self.block_number, delegation_id))
+        return delegation_id
+
+    def handle(self, method, params):
+        if method == 'eth_chainId':
+            return hex(1)
+        if method == 'eth_blockNumber':
+            return hex(self.block_number)
+        if method == 'eth_getLogs':
+            from_block, to_block = int(params[0]['fromBlock'], 16), int(params[0]['toBlock'], 16)
+            if self.max_logs_range is not None and to_block - from_block >= self.max_logs_range:
+                raise ValueError('Logs range is too large')
+            return self.get_logs(from_block, to_block)
+        if method != 'eth_call':
+            raise ValueError(f'Method {method} is not supported')
+        data = params[0]['data']
+        name = SELECTORS[data[:10]]
+        arguments = [int(data[i:i + 64], 16) for i in range(10, len(data), 64)]
+        if name == 'getDelegationsByValidatorLength':
+            return self.encode(['uint256'], [self.validator_length])
+        if name == 'delegationsByValidator':
+            return self.encode(['uint256'], [1000 + arguments[1]])
+        if name == 'getDelegationsByHolderLength':
+            return self.encode(['uint256'], [DELEGATIONS_NUMBER])
+        if name == 'delegationsByHolder':
+            index = arguments[1]
+            return self.encode(['uint256'], [1000 + index if index % 2 else 2000 + index])
+        if name == 'getState':
+            return self.encode(['uint8'], [self.states.get(arguments[0], arguments[0] % 3)])
+        delegation_id = arguments[0]
+        return self.encode([f"({','.join(DELEGATION_TYPES)})"], [(
+            self.holder(delegation_id), delegation_id // 1000, delegation_id * 10 ** 18, 3,
+            1600000000 + delegation_id, 0, 0, f'delegation {delegation_id}'
+        )])
+
+    def holder(self, delegation_id):
+        if delegation_id >= 2000 or delegation_id % 2:
+            return HOLDER_ADDRESS
+        return OTHER_HOLDER_ADDRESS
+
+    def get_logs(self, from_block, to_block):
+        topic = '0x' + event_abi_to_log_topic(DELEGATION_PROPOSED_ABI).hex()
+        return [
+            {
+                'address': DELEGATION_CONTROLLER_ADDRESS,
+                'topics': [topic],
+                'data': self.encode(['uint256'], [delegation_id]),
+                'blockNumber': hex(block_number),
+                'blockHash': '0x' + format(block_number, '064x'),
+                'transactionHash': '0x' + format(delegation_id, '064x'),
+                'transactionIndex': '0x0',
+                'logIndex': '0x0',
+                'removed': False
+            }
+            for block_number, delegation_id in self.proposed
+            if from_block <= block_number <= to_block
+        ]
+
+    def encode(self, types, values):
+        return '0x' + encode_abi(types, values).hex()
+
+
+@pytest.fixture
+def chain():
+    return StandInDelegationChain()
+
+
+@pytest.fixture
+def rpc(chain):
+    with StandInRpc(chain) as rpc:
+        yield rpc
+
+
+@pytest.fixture
+def skale(rpc, tmp_filepath):
+    web3 = Web3(Web3.HTTPProvider(rpc.endpoint))
+    skale = mock.Mock(web3=web3)
+    skale.manager.address = MANAGER_ADDRESS
+    skale.delegation_controller.contract = web3.eth.contract(
+        address=DELEGATION_CONTROLLER_ADDRESS, abi=DELEGATION_CONTROLLER_ABI
+    )
+    with mock.patch('core.cache.SKALE_VAL_CACHE_FILE', tmp_filepath):
+        yield skale
+
+
+def test_get_validator_delegation_ids(rpc, skale):
+    delegation_ids = get_validator_delegation_ids(skale, 1)
+    assert delegation_ids == list(range(1000, 1000 + DELEGATIONS_NUMBER))
+    assert rpc.calls['eth_call'] == 1
+    assert rpc.calls['batch'] == 2
+
+
+def test_fetch_delegations(rpc, skale):
+    delegation_ids = list(range(1000, 1000 + DELEGATIONS_NUMBER))
+    delegations = list(fetch_delegations(skale, delegation_ids))
+    assert [delegation['id'] for delegation in delegations] == delegation_ids
+    assert delegations[1] == {
+        'address': HOLDER_ADDRESS,
+        'validator_id': 1,
+        'amount': 1001 * 10 ** 18,
+        'delegation_period': 3,
+        'created': 1600001001,
+        'started': 0,
+        'finished': 0,
+        'info': 'delegation 1001',
+        'id': 1001,
+        'status': 'CANCELED'
+    }
+    assert dict(rpc.calls) == {'batch': 3}
+
+
+def test_fetch_delegations_progress(skale):
+    class TtyStringIO(io.StringIO):
+        def isatty(self):
+            return True
+
+    delegation_ids = list(range(1000, 1000 + DELEGATIONS_NUMBER))
+    with mock.patch('sys.stderr', new=TtyStringIO()) as stderr:
+        for number, delegation in enumerate(fetch_delegations(skale, delegation_ids)):
+            if number == 60:
+                assert stderr.getvalue().endswith(f'50/{DELEGATIONS_NUMBER}')
+        assert stderr.getvalue().endswith('\r\x1b[K')
+
+
+def test_validator_delegations_streamed(skale):
+    delegations = validator_delegations(skale, 1)
+    assert next(delegations)['id'] == 1000
+    with DelegationIndex(MANAGER_ADDRESS) as index:
+        assert not index.is_seeded('validator:1')
+
+    delegations = list(holder_delegations(skale, HOLDER_ADDRESS, offset=1, limit=2))
+    assert [delegation['id'] for delegation in delegations] == [1003, 1005]
+    with DelegationIndex(MANAGER_ADDRESS) as index:
+        assert index.is_seeded(f'holder:{HOLDER_ADDRESS}')
+        assert len(index.get_delegations(address=HOLDER_ADDRESS)) == DELEGATIONS_NUMBER
+
+
+def test_validator_delegations_index(chain, rpc, skale):
+    delegations = list(validator_delegations(skale, 1))
+    assert delegations == list(fetch_delegations(skale, range(1000, 1000 + DELEGATIONS_NUMBER)))
+
+    # answered from the index, only statuses which may still change are re-verified
+    rpc.calls.clear()
+    assert list(validator_delegations(skale, 1)) == delegations
+    assert rpc.calls['batch'] == 1
+    assert 'eth_getLogs' not in rpc.calls
+
+    new_id = chain.propose()
+    chain.states[1000] = 1
+    delegations = list(validator_delegations(skale, 1))
+    assert delegations[-1]['id'] == new_id
+    assert len(delegations) == DELEGATIONS_NUMBER + 1
+    assert delegations[0]['status'] == 'ACCEPTED'
+
+    delegation_filter = DelegationFilter(statuses=('PROPOSED',),
+                                         since=datetime.utcfromtimestamp(1600001050),
+                                         min_amount=1060 * 10 ** 18)
+    delegations = list(validator_delegations(skale, 1, offset=1, limit=3,
+                                             delegation_filter=delegation_filter))
+    assert [delegation['id'] for delegation in delegations] == [1065, 1068, 1071]
+
+
+def test_validator_delegations_by_holder(rpc, skale):
+    delegation_filter = DelegationFilter(holder=HOLDER_ADDRESS, statuses=('ACCEPTED',))
+    delegations = list(validator_delegations(skale, 1, delegation_filter=delegation_filter))
+    assert [delegation['id'] for delegation in delegations] == \
+        [delegation_id for delegation_id in range(1001, 1000 + DELEGATIONS_NUMBER, 2)
+         if delegation_id % 3 == 1]
+    assert all(delegation['validator_id'] == 1 for delegation in delegations)
+    assert len(list(holder_delegations(skale, HOLDER_ADDRESS))) == DELEGATIONS_NUMBER
+
+
+def test_index_keeps_seeded_scopes(chain, skale):
+    list(validator_delegations(skale, 1))
+    chain.propose(validator_id=3)
+    new_id = chain.propose()
+    assert list(validator_delegations(skale, 1))[-1]['id'] == new_id
+    with DelegationIndex(MANAGER_ADDRESS) as index:
+        assert index.get_delegations(validator_id=1)[-1]['id'] == new_id
+        assert index.get_delegations(validator_id=3) == []
+
+
+def test_index_reset_on_chain_reset(chain, skale):
+    assert len(list(validator_delegations(skale, 1))) == DELEGATIONS_NUMBER
+    chain.block_number = 50
+    chain.validator_length = 10
+    assert len(list(validator_delegations(skale, 1))) == 10
+    with DelegationIndex(MANAGER_ADDRESS) as index:
+        assert index.get_synced_block() == 50
+
+
+def test_get_proposed_delegation_ids_shrinks_chunks(chain, rpc, skale):
+    chain.proposed = [(5, 1500), (12000, 1501), (25000, 1502)]
+    chain.max_logs_range = 3000
+    assert get_proposed_delegation_ids(skale, 1, 30000, timeout=0) == [1500, 1501, 1502]
+    # 10000 and 5000 blocks chunks are rejected, then the range is scanned by 2500 blocks
+    assert rpc.calls['eth_getLogs'] == 2 + 12
+
+
+def test_get_proposed_delegation_ids_retries(chain, skale):
+    chain.max_logs_range = 0
+    with pytest.raises(SkaleFilterError):
+        get_proposed_delegation_ids(skale, 1, 100, timeout=0, retries=3)
+
+
+@pytest.mark.parametrize('amount', ['1.1', '1000.3', '0.000000000000000001'])
+def test_min_amount_boundary(amount):
+    min_amount = to_wei(TokenAmountType().convert(amount, None, None))
+    delegation_filter = DelegationFilter(min_amount=min_amount)
+    exact_amount = int(amount.replace('.', '').lstrip('0')) * \
+        10 ** (18 - len(amount.split('.')[1]))
+    assert min_amount == exact_amount
+    assert delegation_filter.matches({'amount': exact_amount})
+    assert not delegation_filter.matches({'amount': exact_amount - 1})
@@ -0,0 +1,56 @@
+""" Tests for core/export.py module """
+
+import json
+import os
+import sys
+from decimal import Decimal
+
+import pandas
+import pytest
+
+from core.export import ExportError, export_rows, get_export_format
+
+COLUMNS = ['Date', 'Node ID', 'Bounty', 'Downtime', 'Latency']
+DTYPES = ['t', 'i', 'w', 'i', 'f']
+ROWS = [
+    ['2020-07-02 10:00:00', 1, 5 * 10 ** 27, 0, 1.5],
+    ['2020-07-01 10:00:00', 2, 0, 3, 0.0]
+]
+
+
+def test_get_export_format():
+    assert get_export_format('metrics.csv') == 'csv'
+    assert get_export_format('metrics.txt') == 'csv'
+    assert get_export_format('metrics.jsonl') == 'ndjson'
+    assert get_export_format('metrics.NDJSON') == 'ndjson'
+
+
+def test_export_csv(tmp_dir):
+    filepath = os.path.join(tmp_dir, 'metrics.csv')
+    export_rows(filepath, COLUMNS, iter(ROWS), DTYPES)
+    df = pandas.read_csv(filepath, dtype={'Bounty': str})
+    assert df.columns.tolist() == COLUMNS
+    assert df['Bounty'].tolist() == [str(5 * 10 ** 27), '0']
+
+
+def test_export_ndjson(tmp_dir):
+    filepath = os.path.join(tmp_dir, 'metrics.ndjson')
+    export_rows(filepath, COLUMNS, (row for row in ROWS), DTYPES)
+    with open(filepath) as f:
+        records = [json.loads(line) for line in f]
+    assert records[0] == dict(zip(COLUMNS, ROWS[0]))
+    assert len(records) == 2
+
+
+def test_export_parquet(tmp_dir):
+    pq = pytest.importorskip('pyarrow.parquet')
+    filepath = os.path.join(tmp_dir, 'metrics.parquet')
+    rows = [['2020-07-02 10:00:00', 1, Decimal('5000.5'), 0, 1.5]]
+    export_rows(filepath, COLUMNS, iter(rows), ['t', 'i', 'a', 'i', 'f'])
+    assert pq.read_table(filepath).to_pylist() == [dict(zip(COLUMNS, rows[0]))]
+
+
+def test_export_parquet_without_pyarrow(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'pyarrow', None)
+    with pytest.raises(ExportError):
+        get_export_format('metrics.parquet')
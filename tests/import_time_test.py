@@ -0,0 +1,26 @@
+""" Tests for sk-val entrypoint imports, the time budget is checked by scripts/build.sh """
+
+import importlib.util
+import os
+
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+CHECK_SCRIPT = os.path.join(PROJECT_DIR, 'scripts', 'check_import_time.py')
+BUILD_INFO_FILE = os.path.join(PROJECT_DIR, 'cli', 'info.py')
+
+
+def load_check_script():
+    spec = importlib.util.spec_from_file_location('check_import_time', CHECK_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.skipif(not os.path.isfile(BUILD_INFO_FILE),
+                    reason='cli/info.py is generated by scripts/build.sh')
+def test_no_heavy_modules_imported():
+    check_script = load_check_script()
+    _, modules = check_script.measure_import()
+    assert check_script.ENTRYPOINT_MODULE in modules
+    assert check_script.find_lazy_modules(modules) == []
@@ -0,0 +1,44 @@
+""" Tests for LazySkale from utils/web3_utils.py module """
+
+import os
+from unittest import mock
+
+from skale.contracts.contract_manager import ContractManager
+
+from utils.helper import write_json
+from utils.web3_utils import LazySkale
+
+ENDPOINT = 'http://127.0.0.1:1'
+ABI = {
+    'contract_manager_address': '0x' + '11' * 20,
+    'contract_manager_abi': [],
+    'validator_service_address': '0x' + '22' * 20,
+    'validator_service_abi': [],
+    'distributor_address': '0x' + '33' * 20,
+    'distributor_abi': []
+}
+
+
+def test_lazy_skale_contracts(tmp_dir):
+    abi_filepath = os.path.join(tmp_dir, 'lazy_skale_abi.json')
+    write_json(abi_filepath, ABI)
+    skale = LazySkale(ENDPOINT, abi_filepath)
+    assert 'distributor' not in vars(skale)
+
+    assert skale.distributor.address == ABI['distributor_address']
+    assert 'distributor' in vars(skale)
+    assert 'validator_service' not in vars(skale)
+    assert skale.distributor is skale.distributor
+    assert skale.not_a_contract is None
+
+
+def test_lazy_skale_upgradeable_contract(tmp_dir):
+    abi_filepath = os.path.join(tmp_dir, 'lazy_skale_abi.json')
+    write_json(abi_filepath, {**ABI, 'nodes_abi': []})
+    nodes_address = '0x' + '44' * 20
+    with mock.patch.object(ContractManager, 'get_contract_address',
+                           return_value=nodes_address) as get_contract_address:
+        skale = LazySkale(ENDPOINT, abi_filepath)
+        assert skale.nodes.address == nodes_address
+    get_contract_address.assert_called_once_with('Nodes')
+    assert isinstance(skale.contract_manager, ContractManager)
@@ -0,0 +1,86 @@
+""" Tests for core/metrics.py module """
+
+import asyncio
+from unittest import mock
+
+import pytest
+from aiohttp import ClientSession
+
+from core.cache import BlockIndex
+from core.metrics import AsyncEventsRpc, EventsRpc, find_block_by_timestamp
+from tests.benchmarks.chain import StandInRpc, StandInSkale, SyntheticChain
+from utils.web3_utils import init_async_web3
+
+BLOCK_NUMBERS = [10, 5760, 30, 5760, 11521]
+CHAIN_KEY = '0x0000000000000000000000000000000000000001'
+# several blocks may share a timestamp
+BLOCK_TIMESTAMPS = [100, 110, 110, 110, 120, 130, 130, 140]
+
+
+async def get_block_timestamps(skale, block_numbers):
+    web3 = init_async_web3(skale.web3.provider.endpoint_uri)
+    async with ClientSession(raise_for_status=True) as session:
+        await web3.provider.cache_async_session(session)
+        rpc = AsyncEventsRpc(skale, asyncio.Semaphore(4), web3, session)
+        return rpc, await rpc.get_block_timestamps(block_numbers)
+
+
+@pytest.mark.parametrize('batch_error', [None, 'http', 'rpc'])
+def test_block_timestamps_batch_fallback(batch_error):
+    chain = SyntheticChain(nodes=2, events=3)
+    with StandInRpc(chain, batch_error=batch_error) as rpc:
+        events_rpc, timestamps = asyncio.run(
+            get_block_timestamps(StandInSkale(rpc.endpoint), BLOCK_NUMBERS)
+        )
+    assert timestamps == [chain.timestamp(block_number) for block_number in BLOCK_NUMBERS]
+    assert rpc.calls['batch'] == 1
+    assert events_rpc.batch_supported is (batch_error is None)
+    # duplicates are requested once
+    assert rpc.calls['eth_getBlockByNumber'] == (0 if batch_error is None else 4)
+
+
+def find_block(cache_path, timestamp, known_blocks=()):
+    """Returns found block and the number of requested headers"""
+    skale = mock.Mock()
+    skale.web3.eth.block_number = len(BLOCK_TIMESTAMPS) - 1
+    skale.web3.eth.get_block.side_effect = \
+        lambda block_number: {'timestamp': BLOCK_TIMESTAMPS[block_number]}
+
+    async def find(block_index):
+        rpc = EventsRpc(skale, asyncio.Semaphore(1), block_index)
+        return await find_block_by_timestamp(rpc, timestamp)
+
+    with BlockIndex(CHAIN_KEY, cache_path) as block_index:
+        block_index.add_timestamps({n: BLOCK_TIMESTAMPS[n] for n in known_blocks})
+        block_number = asyncio.run(find(block_index))
+    return block_number, skale.web3.eth.get_block.call_count
+
+
+@pytest.mark.parametrize('timestamp, block_number', [
+    (50, 0),     # before genesis
+    (100, 0),    # genesis
+    (120, 4),    # exact hit
+    (110, 1),    # first of blocks with equal timestamps
+    (130, 5),
+    (115, 4),    # between blocks
+    (140, 7),    # head
+    (141, 8),    # after head
+    (1000, 8)
+])
+def test_find_block_by_timestamp(tmp_filepath, timestamp, block_number):
+    assert find_block(tmp_filepath, timestamp)[0] == block_number
+
+
+@pytest.mark.parametrize('timestamp, known_blocks, block_number, requests', [
+    (115, [1, 4], 4, 1),         # bisection between known blocks
+    (120, [4], 4, 2),
+    (110, [2, 3], 1, 2),         # known block inside equal timestamps
+    (110, [0, 1], 1, 0),         # adjacent known bounds, nothing is requested
+    (130, [6], 5, 3),
+    (50, [0], 0, 0),             # before known genesis
+    (141, [7], 8, 0),            # known head, after head
+    (1000, [2, 5], 8, 1)
+])
+def test_find_block_by_timestamp_known_bounds(tmp_filepath, timestamp, known_blocks,
+                                              block_number, requests):
+    assert find_block(tmp_filepath, timestamp, known_blocks) == (block_number, requests)
@@ -0,0 +1,57 @@
+""" Tests for utils/output_formats.py module """
+
+import io
+import json
+
+import pytest
+
+from utils.output_formats import print_record, print_records
+
+DELEGATIONS = [
+    {'id': 1, 'address': '0x' + '11' * 20, 'amount': 10 ** 24, 'status': 'ACCEPTED'},
+    {'id': 2, 'address': '0x' + '22' * 20, 'amount': 5 * 10 ** 18, 'status': 'PROPOSED'}
+]
+
+
+def test_print_records_json():
+    output = io.StringIO()
+    print_records(iter(DELEGATIONS), 'json', file=output)
+    assert json.loads(output.getvalue()) == DELEGATIONS
+
+
+def test_print_records_ndjson():
+    output = io.StringIO()
+    print_records(iter(DELEGATIONS), 'ndjson', file=output)
+    assert [json.loads(line) for line in output.getvalue().splitlines()] == DELEGATIONS
+
+
+def test_print_records_csv():
+    output = io.StringIO()
+    print_records(iter(DELEGATIONS), 'csv', file=output)
+    assert output.getvalue().splitlines() == [
+        'id,address,amount,status',
+        f'1,{"0x" + "11" * 20},1000000000000000000000000,ACCEPTED',
+        f'2,{"0x" + "22" * 20},5000000000000000000,PROPOSED'
+    ]
+
+
+def test_print_records_empty():
+    for output_format, expected in (('json', '[]\n'), ('ndjson', ''), ('csv', '')):
+        output = io.StringIO()
+        print_records([], output_format, file=output)
+        assert output.getvalue() == expected
+
+
+def test_print_record():
+    record = {'validator_id': 1, 'bond_amount': 10 ** 24}
+    output = io.StringIO()
+    print_record(record, 'json', file=output)
+    assert json.loads(output.getvalue()) == record
+    output = io.StringIO()
+    print_record(record, 'csv', file=output)
+    assert output.getvalue() == 'validator_id,bond_amount\n1,1000000000000000000000000\n'
+
+
+def test_print_records_unknown_format():
+    with pytest.raises(ValueError):
+        print_records(DELEGATIONS, 'xml')
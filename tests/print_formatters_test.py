@@ -0,0 +1,67 @@
+""" Tests for utils/print_formatters.py module """
+
+import os
+from unittest import mock
+
+from core.metrics import MetricsRunStats
+from utils.helper import page
+from utils.print_formatters import (
+    Formatter, StreamingTable, get_tty_width, print_metrics_run_stats
+)
+
+
+def test_get_tty_width_piped():
+    get_tty_width.cache_clear()
+    with mock.patch('sys.stdout.isatty', return_value=False), \
+            mock.patch('shutil.get_terminal_size') as get_terminal_size:
+        assert get_tty_width() == 0
+        get_terminal_size.assert_not_called()
+    get_tty_width.cache_clear()
+
+
+def test_get_tty_width_queried_once():
+    get_tty_width.cache_clear()
+    terminal_size = os.terminal_size((120, 40))
+    with mock.patch('sys.stdout.isatty', return_value=True), \
+            mock.patch('shutil.get_terminal_size', return_value=terminal_size) as get_terminal_size:
+        assert get_tty_width() == 120
+        Formatter().table(['Id', 'Name'], [[1, 'validator']])
+        assert get_tty_width() == 120
+        get_terminal_size.assert_called_once()
+    get_tty_width.cache_clear()
+
+
+def test_streaming_table(capsys):
+    rows = iter([[1, 'first'], [2, 'second'], [30, 'a much longer third']])
+    StreamingTable(['Id', 'Name'], sample_size=2).print_rows(rows)
+    assert capsys.readouterr().out.splitlines() == [
+        'Id    Name ',
+        '-----------',
+        '1    first ',
+        '2    second',
+        '30   a much longer third'
+    ]
+
+
+def test_streaming_table_no_rows(capsys):
+    StreamingTable(['Id', 'Name']).print_rows([])
+    assert capsys.readouterr().out.splitlines() == ['Id   Name', '---------']
+
+
+def test_page():
+    assert page(list(range(5))) == [0, 1, 2, 3, 4]
+    assert page(list(range(5)), offset=3) == [3, 4]
+    assert page(list(range(5)), offset=1, limit=2) == [1, 2]
+    assert page(range(5), offset=4, limit=2) == range(4, 5)
+
+
+def test_print_metrics_run_stats(capsys):
+    stats = MetricsRunStats(nodes=2, elapsed=4, latencies={7: 3.0, 2: 1.0},
+                            errors={9: 'timeout'})
+    print_metrics_run_stats(stats)
+    lines = capsys.readouterr().out.strip().split('\n')
+    assert lines[0] == ('Metrics collected for 2 node(s) in 4.0s (0.50 nodes/s), '
+                        'node latency: avg 2.0s, max 3.0s')
+    node_rows = [line.split() for line in lines[1:-1] if line.split()[0].isdigit()]
+    assert node_rows == [['2', '1.0'], ['7', '3.0']]
+    assert lines[-1] == 'Failed to collect metrics for node 9: timeout'
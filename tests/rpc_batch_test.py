@@ -0,0 +1,138 @@
+""" Tests for utils/rpc_batch.py module """
+
+from unittest import mock
+
+import pytest
+from eth_abi import encode_abi
+from eth_utils import function_abi_to_4byte_selector
+from web3 import Web3
+
+from core.validator import get_addresses_info
+from tests.benchmarks.chain import StandInRpc
+from utils.rpc_batch import (BatchRequestError, RpcCallError, decode_call_result, eth_call,
+                             request_batch)
+from utils.rpc_profiler import RpcProfiler, call_key
+
+VALIDATOR_SERVICE_ADDRESS = Web3.toChecksumAddress('0x' + '44' * 20)
+MAIN_ADDRESS = Web3.toChecksumAddress('0x' + 'a1' * 20)
+NODE_ADDRESS = Web3.toChecksumAddress('0x' + 'a2' * 20)
+UNKNOWN_ADDRESS = Web3.toChecksumAddress('0x' + 'a3' * 20)
+VALIDATOR_ID = 7
+
+GET_VALIDATOR_ID_ABI = {
+    'inputs': [{'name': 'validatorAddress', 'type': 'address'}],
+    'name': 'getValidatorId',
+    'outputs': [{'name': '', 'type': 'uint256'}],
+    'stateMutability': 'view',
+    'type': 'function'
+}
+VALIDATORS_ABI = {
+    'inputs': [{'name': '', 'type': 'uint256'}],
+    'name': 'validators',
+    'outputs': [
+        {'name': 'name', 'type': 'string'},
+        {'name': 'validatorAddress', 'type': 'address'},
+        {'name': 'requestedAddress', 'type': 'address'},
+        {'name': 'description', 'type': 'string'},
+        {'name': 'feeRate', 'type': 'uint256'},
+        {'name': 'registrationTime', 'type': 'uint256'},
+        {'name': 'minimumDelegationAmount', 'type': 'uint256'},
+        {'name': 'acceptNewRequests', 'type': 'bool'}
+    ],
+    'stateMutability': 'view',
+    'type': 'function'
+}
+SELECTORS = {
+    '0x' + function_abi_to_4byte_selector(abi).hex(): abi['name']
+    for abi in (GET_VALIDATOR_ID_ABI, VALIDATORS_ABI)
+}
+
+
+class StandInValidatorChain:
+    def handle(self, method, params):
+        if method == 'eth_getBalance':
+            return hex(int(params[0][-2:], 16) * 10 ** 18)
+        if method != 'eth_call':
+            raise ValueError(f'Method {method} is not supported')
+        data = params[0]['data']
+        name, argument = SELECTORS[data[:10]], data[10:]
+        if name == 'getValidatorId':
+            if int(argument, 16) not in (int(MAIN_ADDRESS, 16), int(NODE_ADDRESS, 16)):
+                raise ValueError('Validator address does not exist')
+            return '0x' + encode_abi(['uint256'], [VALIDATOR_ID]).hex()
+        return '0x' + encode_abi(
+            [output['type'] for output in VALIDATORS_ABI['outputs']],
+            ['test', MAIN_ADDRESS, '0x' + '00' * 20, 'desc', 100, 1600000000, 10 ** 18, True]
+        ).hex()
+
+
+@pytest.fixture
+def rpc():
+    with StandInRpc(StandInValidatorChain()) as rpc:
+        yield rpc
+
+
+@pytest.fixture
+def skale(rpc):
+    web3 = Web3(Web3.HTTPProvider(rpc.endpoint))
+    skale = mock.Mock(web3=web3)
+    skale.validator_service.contract = web3.eth.contract(
+        address=VALIDATOR_SERVICE_ADDRESS, abi=[GET_VALIDATOR_ID_ABI, VALIDATORS_ABI]
+    )
+    return skale
+
+
+def test_request_batch(rpc, skale):
+    contract = skale.validator_service.contract
+    results = request_batch(skale.web3, [
+        ('eth_getBalance', [NODE_ADDRESS, 'latest']),
+        eth_call(contract, 'getValidatorId', NODE_ADDRESS),
+        eth_call(contract, 'getValidatorId', UNKNOWN_ADDRESS)
+    ])
+    assert dict(rpc.calls) == {'batch': 1}
+    assert int(results[0], 16) == 0xa2 * 10 ** 18
+    assert decode_call_result(contract, 'getValidatorId', results[1]) == VALIDATOR_ID
+    assert isinstance(results[2], RpcCallError)
+    assert request_batch(skale.web3, []) == []
+
+
+def test_request_batch_fallback(rpc, skale):
+    contract = skale.validator_service.contract
+    calls = [eth_call(contract, 'getValidatorId', address)
+             for address in (MAIN_ADDRESS, NODE_ADDRESS, UNKNOWN_ADDRESS)]
+    with mock.patch('utils.rpc_batch.send_batch', side_effect=BatchRequestError('rejected')):
+        results = request_batch(skale.web3, calls)
+    assert dict(rpc.calls) == {'eth_call': 3}
+    assert [decode_call_result(contract, 'getValidatorId', result)
+            for result in results[:2]] == [VALIDATOR_ID, VALIDATOR_ID]
+    assert isinstance(results[2], RpcCallError)
+
+
+def test_get_addresses_info(rpc, skale):
+    addresses_info = get_addresses_info(skale, [MAIN_ADDRESS, NODE_ADDRESS, UNKNOWN_ADDRESS])
+    assert addresses_info == [
+        {'address': MAIN_ADDRESS, 'status': 'Primary', 'balance': 0xa1 * 10 ** 18},
+        {'address': NODE_ADDRESS, 'status': 'Linked', 'balance': 0xa2 * 10 ** 18},
+        {'address': UNKNOWN_ADDRESS, 'status': 'Linked', 'balance': 0xa3 * 10 ** 18}
+    ]
+    assert dict(rpc.calls) == {'batch': 2}
+
+
+def test_request_batch_profile(rpc, skale):
+    contract = skale.validator_service.contract
+    calls = [
+        ('eth_getBalance', [NODE_ADDRESS, 'latest']),
+        eth_call(contract, 'getValidatorId', NODE_ADDRESS),
+        eth_call(contract, 'getValidatorId', UNKNOWN_ADDRESS),
+        eth_call(contract, 'validators', VALIDATOR_ID)
+    ]
+    profiler = RpcProfiler()
+    profiler.enabled = True
+    with mock.patch('utils.rpc_batch.profiler', profiler):
+        request_batch(skale.web3, calls)
+    get_validator_id = call_key(*calls[1])
+    assert set(profiler.stats) == {('eth_getBalance', None, None), get_validator_id,
+                                   call_key(*calls[3])}
+    assert profiler.stats[get_validator_id].calls == 2
+    assert profiler.stats[get_validator_id].errors == 1
+    assert profiler.stats[('eth_getBalance', None, None)].errors == 0
@@ -0,0 +1,67 @@
+""" Tests for utils/rpc_cassette.py module """
+
+import gzip
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from utils.rpc_cassette import (Cassette, CassetteMissError, RecordingProvider,
+                                ReplayProvider)
+
+
+class CounterProvider(BaseProvider):
+    def __init__(self):
+        self.block_number = 0
+
+    def make_request(self, method, params):
+        self.block_number += 1
+        return {'jsonrpc': '2.0', 'id': 0, 'result': hex(self.block_number)}
+
+    def isConnected(self):
+        return True
+
+
+def test_record_and_replay(tmp_dir):
+    path = os.path.join(tmp_dir, 'cassette.jsonl.gz')
+    cassette = Cassette(path)
+    web3 = Web3(RecordingProvider(CounterProvider(), cassette), middlewares=[])
+    recorded = [web3.eth.block_number, web3.eth.block_number]
+    cassette.close()
+    assert recorded == [1, 2]
+
+    web3 = Web3(ReplayProvider(Cassette(path).load()), middlewares=[])
+    assert [web3.eth.block_number for _ in range(3)] == [1, 2, 2]
+    with pytest.raises(CassetteMissError):
+        web3.eth.get_block(1)
+
+
+def test_record_from_threads(tmp_filepath):
+    cassette = Cassette(tmp_filepath)
+    threads, requests = 8, 50
+    barrier = threading.Barrier(threads)
+    open_gzip = gzip.open
+
+    def slow_open(*args, **kwargs):
+        time.sleep(0.05)  # lets other threads reach the first record meanwhile
+        return open_gzip(*args, **kwargs)
+
+    def record(thread):
+        barrier.wait()
+        for number in range(requests):
+            cassette.record('eth_getBalance', [thread, number], {'result': hex(number)})
+
+    with mock.patch('utils.rpc_cassette.gzip.open', side_effect=slow_open):
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(record, range(threads)))
+    cassette.close()
+
+    replayed = Cassette(tmp_filepath).load()
+    for thread in range(threads):
+        for number in range(requests):
+            assert replayed.replay('eth_getBalance', [thread, number]) == {'result': hex(number)}
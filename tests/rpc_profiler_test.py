@@ -0,0 +1,68 @@
+""" Tests for utils/rpc_profiler.py module """
+
+import os
+from unittest import mock
+
+import pytest
+from eth_utils import function_abi_to_4byte_selector
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from utils.abi_cache import load_abi
+from utils.helper import write_json
+from utils.rpc_profiler import RpcProfiler, call_key
+
+WITHDRAW_BOUNTY_ABI = {'type': 'function', 'name': 'withdrawBounty', 'inputs': []}
+WITHDRAW_BOUNTY_SELECTOR = '0x' + function_abi_to_4byte_selector(WITHDRAW_BOUNTY_ABI).hex()
+ABI = {
+    'validator_service_address': '0x' + '22' * 20,
+    'validator_service_abi': [{'type': 'function', 'name': 'getValidator', 'inputs': []}],
+    'distributor_address': '0x' + '33' * 20,
+    'distributor_abi': [WITHDRAW_BOUNTY_ABI]
+}
+
+
+class BlockNumberProvider(BaseProvider):
+    def make_request(self, method, params):
+        return {'jsonrpc': '2.0', 'id': 0, 'result': '0x1'}
+
+    def isConnected(self):
+        return True
+
+
+def test_rpc_profiler_middleware():
+    profiler = RpcProfiler()
+    web3 = Web3(BlockNumberProvider(), middlewares=[])
+    web3.middleware_onion.inject(profiler.middleware, layer=0)
+    for _ in range(3):
+        assert web3.eth.block_number == 1
+
+    stats = profiler.stats['eth_blockNumber', None, None]
+    assert stats.calls == 3
+    assert stats.errors == 0
+    assert stats.bytes_received > 0
+    rows = profiler.summary_rows()
+    assert rows[0][:3] == ['eth_blockNumber', 3, 0]
+    assert sum(count for _, count in profiler.histogram()) == 3
+
+
+@pytest.fixture
+def abi_filepath(tmp_dir):
+    filepath = os.path.join(tmp_dir, 'rpc_profiler_test.json')
+    write_json(filepath, ABI)
+    yield filepath
+    for path in (filepath, os.path.join(tmp_dir, 'rpc_profiler_test.cache')):
+        if os.path.isfile(path):
+            os.remove(path)
+
+
+def test_rpc_profiler_contract_names(abi_filepath):
+    abi = load_abi(abi_filepath)
+    profiler = RpcProfiler()
+    profiler.record(call_key('eth_call', [{'to': ABI['distributor_address'].upper(),
+                                           'data': WITHDRAW_BOUNTY_SELECTOR + '00' * 32}]),
+                    0.1, {}, {})
+    with mock.patch('utils.rpc_profiler.load_abi', return_value=abi):
+        rows = profiler.summary_rows()
+    assert rows[0][0] == 'eth_call distributor.withdrawBounty'
+    assert 'validator_service_abi' not in abi.values
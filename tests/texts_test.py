@@ -0,0 +1,30 @@
+""" Tests for utils/texts.py module """
+
+import os
+
+from utils.texts import Texts, compile_texts, load_texts, parse_texts
+
+
+def test_compiled_texts(tmp_dir):
+    text_filepath = os.path.join(tmp_dir, 'texts_test.yml')
+    compiled_filepath = os.path.join(tmp_dir, 'texts_test.marshal')
+    with open(text_filepath, 'w') as text_file:
+        text_file.write('info:\n  help: Show info\n')
+    assert load_texts(text_filepath, compiled_filepath) == {'info': {'help': 'Show info'}}
+
+    compile_texts(text_filepath, compiled_filepath)
+    with open(text_filepath, 'a') as text_file:
+        text_file.write('init:\n  help: Init\n')
+    assert load_texts(text_filepath, compiled_filepath) == parse_texts(text_filepath)
+
+    compile_texts(text_filepath, compiled_filepath)
+    assert load_texts(text_filepath, compiled_filepath) == {
+        'info': {'help': 'Show info'},
+        'init': {'help': 'Init'}
+    }
+
+
+def test_texts_loaded_once():
+    texts = Texts()
+    assert Texts()._texts is texts._texts
+    assert texts['info']['help'] == parse_texts()['info']['help']
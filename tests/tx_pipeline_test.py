@@ -0,0 +1,140 @@
+""" Tests for core/tx_pipeline.py module """
+
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from eth_abi import decode_abi
+from hexbytes import HexBytes
+from web3 import Web3
+
+from core.transaction import TxFee
+from core.tx_pipeline import (MAX_RESUBMISSIONS, TX_FAILED, TX_MINED, TX_SKIPPED, PipelinedTx,
+                              send_pipelined)
+from tests.benchmarks.chain import StandInRpc
+
+DELEGATION_CONTROLLER_ADDRESS = Web3.toChecksumAddress('0x' + '55' * 20)
+WALLET_ADDRESS = Web3.toChecksumAddress('0x' + 'c1' * 20)
+FIRST_NONCE = 5
+REVERTED_DELEGATION_ID = 13
+DROPPED_NONCE = 6
+
+ACCEPT_ABI = {
+    'inputs': [{'name': 'delegationId', 'type': 'uint256'}],
+    'name': 'acceptPendingDelegation',
+    'outputs': [],
+    'stateMutability': 'nonpayable',
+    'type': 'function'
+}
+
+
+class StandInWallet:
+    """Signs transactions by serializing them, the stand-in chain parses them back"""
+    address = WALLET_ADDRESS
+
+    def sign(self, tx_dict):
+        raw_tx = json.dumps(tx_dict, sort_keys=True).encode()
+        return SimpleNamespace(rawTransaction=HexBytes(raw_tx),
+                               hash=HexBytes(Web3.keccak(raw_tx)))
+
+
+class StandInMempoolChain:
+    """Mines pooled transactions in nonce order whenever the nonce is requested.
+
+    The first broadcast of DROPPED_NONCE is accepted but forgotten, all
+    broadcasts of lost_nonce are
+    """
+
+    def __init__(self):
+        self.next_nonce = FIRST_NONCE
+        self.pool = {}
+        self.mined = {}
+        self.dropped = False
+        self.lost_nonce = None
+
+    def handle(self, method, params):
+        if method == 'eth_estimateGas':
+            delegation_id = decode_abi(['uint256'], bytes.fromhex(params[0]['data'][10:]))[0]
+            if delegation_id == REVERTED_DELEGATION_ID:
+                raise ValueError('execution reverted: Delegation is not pending')
+            return hex(50000)
+        if method == 'eth_getTransactionCount':
+            if params[1] == 'latest':
+                while self.next_nonce in self.pool:
+                    tx_hash = self.pool.pop(self.next_nonce)
+                    self.mined[tx_hash] = self.next_nonce
+                    self.next_nonce += 1
+            return hex(self.next_nonce)
+        if method == 'eth_sendRawTransaction':
+            raw_tx = bytes.fromhex(params[0][2:])
+            tx_hash = Web3.keccak(raw_tx).hex()
+            nonce = json.loads(raw_tx)['nonce']
+            if nonce == DROPPED_NONCE and not self.dropped:
+                self.dropped = True
+            elif nonce != self.lost_nonce:
+                self.pool[nonce] = tx_hash
+            return tx_hash
+        if method == 'eth_getTransactionReceipt':
+            if params[0] not in self.mined:
+                return None
+            return {'transactionHash': params[0], 'status': '0x1'}
+        if method == 'eth_getTransactionByHash':
+            known = params[0] in self.mined or params[0] in self.pool.values()
+            return {'hash': params[0]} if known else None
+        raise ValueError(f'Method {method} is not supported')
+
+
+@pytest.fixture
+def rpc():
+    with StandInRpc(StandInMempoolChain()) as rpc:
+        yield rpc
+
+
+@pytest.fixture
+def skale(rpc):
+    web3 = Web3(Web3.HTTPProvider(rpc.endpoint))
+    skale = mock.Mock(web3=web3, wallet=StandInWallet())
+    skale.delegation_controller.contract = web3.eth.contract(
+        address=DELEGATION_CONTROLLER_ADDRESS, abi=[ACCEPT_ABI]
+    )
+    return skale
+
+
+def accept_txs(skale, delegation_ids):
+    return [
+        PipelinedTx(f'Accept delegation {delegation_id}', skale.delegation_controller.contract,
+                    'acceptPendingDelegation', (delegation_id,))
+        for delegation_id in delegation_ids
+    ]
+
+
+def test_send_pipelined(rpc, skale):
+    txs = accept_txs(skale, range(10, 16))
+    updates = []
+    with mock.patch('core.tx_pipeline.RECEIPT_POLL_INTERVAL', 0):
+        send_pipelined(skale, txs, TxFee(gas_price=10 ** 9),
+                       on_update=lambda txs: updates.append([tx.status for tx in txs]))
+
+    assert [tx.status for tx in txs] == [TX_MINED] * 3 + [TX_SKIPPED] + [TX_MINED] * 2
+    assert [tx.nonce for tx in txs] == [5, 6, 7, None, 8, 9]
+    assert [tx.resubmissions for tx in txs] == [0, 1, 0, 0, 0, 0]
+    assert 'Delegation is not pending' in txs[3].error
+    # all transactions are broadcast in one batch before the first receipt is checked
+    assert rpc.calls['eth_sendRawTransaction'] == 0
+    assert len(updates) == 2
+
+
+def test_send_pipelined_nonce_gap(rpc, skale):
+    rpc.chain.lost_nonce = 7
+    txs = accept_txs(skale, [10, 11, 12, 14, 15])
+    with mock.patch('core.tx_pipeline.RECEIPT_POLL_INTERVAL', 0):
+        send_pipelined(skale, txs, TxFee(gas_price=10 ** 9))
+
+    assert [tx.status for tx in txs] == [TX_MINED] * 2 + [TX_FAILED] * 3
+    assert txs[2].resubmissions == MAX_RESUBMISSIONS
+    assert txs[2].error == 'Transaction is dropped'
+    # the transactions after the lost nonce are not resubmitted
+    assert [tx.resubmissions for tx in txs[3:]] == [0, 0]
+    assert all(tx.error == 'Nonce 7 is not used, the transaction can not be mined'
+               for tx in txs[3:])
@@ -22,6 +22,18 @@ def str_contains(string, values):
     return all(x in string for x in values)
 
 
+def parse_table(output, header):
+    """Cells of the rows printed under the table header, up to the first empty line"""
+    lines = output.splitlines()
+    start = next(i for i, line in enumerate(lines) if line.split() == header.split())
+    rows = []
+    for line in lines[start + 2:]:
+        if not line.strip():
+            break
+        rows.append(line.split())
+    return rows
+
+
 def create_new_validator_wallet_pk(skale, runner, new_wallet_pk):
     wallet, pk = new_wallet_pk
     result = runner.invoke(
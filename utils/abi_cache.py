@@ -0,0 +1,150 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of validator-cli
+#
+#   Copyright (C) 2020 SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Preparsed abi.json stored as a pickled per-key index.
+
+Cache file layout: magic bytes, 8 bytes header length, pickled header, pickled values.
+The header keeps sha256, size and mtime of abi.json, small values (addresses,
+flags) and offsets of the pickled contract ABIs, so a command loads only
+ABIs of the contracts it uses
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import struct
+from collections.abc import Mapping
+
+from utils.constants import SKALE_VAL_ABI_CACHE_FILE, SKALE_VAL_ABI_FILE
+
+logger = logging.getLogger(__name__)
+
+ABI_CACHE_VERSION = 1
+ABI_CACHE_MAGIC = b'SKVALABI'
+HEADER_LENGTH = struct.Struct('>Q')
+
+
+class AbiCacheError(Exception):
+    """Raised when ABI cache file is missing, corrupted or outdated"""
+
+
+def get_abi_cache_filepath(abi_filepath):
+    if abi_filepath == SKALE_VAL_ABI_FILE:
+        return SKALE_VAL_ABI_CACHE_FILE
+    return os.path.splitext(abi_filepath)[0] + '.cache'
+
+
+def abi_fingerprint(abi_filepath):
+    stat = os.stat(abi_filepath)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def abi_checksum(abi_filepath):
+    with open(abi_filepath, 'rb') as abi_file:
+        return hashlib.sha256(abi_file.read()).hexdigest()
+
+
+def build_abi_cache(abi_filepath=SKALE_VAL_ABI_FILE, cache_filepath=None):
+    """Parses abi.json once and writes the cache file, returns the cache filepath"""
+    cache_filepath = cache_filepath or get_abi_cache_filepath(abi_filepath)
+    with open(abi_filepath, 'rb') as abi_file:
+        content = abi_file.read()
+    size, mtime = abi_fingerprint(abi_filepath)
+    values, blobs, offsets, offset = {}, [], {}, 0
+    for key, value in json.loads(content).items():
+        if not isinstance(value, (list, dict)):
+            values[key] = value
+            continue
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        offsets[key] = (offset, len(blob))
+        blobs.append(blob)
+        offset += len(blob)
+    header = pickle.dumps({
+        'version': ABI_CACHE_VERSION,
+        'sha256': hashlib.sha256(content).hexdigest(),
+        'size': size,
+        'mtime': mtime,
+        'values': values,
+        'offsets': offsets
+    }, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_filepath = f'{cache_filepath}.tmp'
+    with open(tmp_filepath, 'wb') as cache_file:
+        cache_file.write(ABI_CACHE_MAGIC)
+        cache_file.write(HEADER_LENGTH.pack(len(header)))
+        cache_file.write(header)
+        for blob in blobs:
+            cache_file.write(blob)
+    os.replace(tmp_filepath, cache_filepath)
+    logger.info(f'ABI cache saved to {cache_filepath}, {len(offsets)} ABIs')
+    return cache_filepath
+
+
+class CachedAbi(Mapping):
+    """Read-only mapping with abi.json content that unpickles ABIs on first access"""
+
+    def __init__(self, cache_filepath, abi_filepath):
+        self.cache_filepath = cache_filepath
+        with open(cache_filepath, 'rb') as cache_file:
+            if cache_file.read(len(ABI_CACHE_MAGIC)) != ABI_CACHE_MAGIC:
+                raise AbiCacheError('ABI cache is corrupted')
+            try:
+                header_length, = HEADER_LENGTH.unpack(cache_file.read(HEADER_LENGTH.size))
+                header = pickle.loads(cache_file.read(header_length))
+            except (struct.error, pickle.UnpicklingError, EOFError, ValueError) as err:
+                raise AbiCacheError(f'ABI cache is corrupted: {err}')
+        if header.get('version') != ABI_CACHE_VERSION:
+            raise AbiCacheError('ABI cache version changed')
+        if (header['size'], header['mtime']) != abi_fingerprint(abi_filepath) and \
+                header['sha256'] != abi_checksum(abi_filepath):
+            raise AbiCacheError(f'{abi_filepath} changed')
+        self.data_offset = len(ABI_CACHE_MAGIC) + HEADER_LENGTH.size + header_length
+        self.offsets = header['offsets']
+        self.values = dict(header['values'])
+
+    def __getitem__(self, key):
+        if key not in self.values:
+            if key not in self.offsets:
+                raise KeyError(key)
+            offset, length = self.offsets[key]
+            with open(self.cache_filepath, 'rb') as cache_file:
+                cache_file.seek(self.data_offset + offset)
+                self.values[key] = pickle.loads(cache_file.read(length))
+        return self.values[key]
+
+    def __iter__(self):
+        yield from (key for key in self.values if key not in self.offsets)
+        yield from self.offsets
+
+    def __len__(self):
+        return len(set(self.values) | set(self.offsets))
+
+
+def load_abi(abi_filepath=SKALE_VAL_ABI_FILE):
+    """Returns abi.json content from the cache, rebuilds the cache if it's missing or outdated"""
+    cache_filepath = get_abi_cache_filepath(abi_filepath)
+    try:
+        return CachedAbi(cache_filepath, abi_filepath)
+    except FileNotFoundError:
+        logger.info(f'No ABI cache for {abi_filepath}, building')
+    except AbiCacheError as err:
+        logger.info(f'Rebuilding ABI cache: {err}')
+    build_abi_cache(abi_filepath, cache_filepath)
+    return CachedAbi(cache_filepath, abi_filepath)
@@ -39,6 +39,7 @@ else:
     ROOT_DIR = os.path.join(sys._MEIPASS, 'data')
 
 TEXT_FILE = os.path.join(ROOT_DIR, 'text.yml')
+COMPILED_TEXT_FILE = os.path.join(ROOT_DIR, 'text.marshal')
 
 LONG_LINE = '-' * 50
 SPIN_COLOR = 'yellow'
@@ -49,6 +50,11 @@ SKALE_VAL_CONFIG_FOLDER = os.path.join(HOME_DIR, '.skale-val-cli')
 SKALE_VAL_CONFIG_FILE = os.path.join(SKALE_VAL_CONFIG_FOLDER, 'config.json')
 SKALE_VAL_LEDGER_INFO_FILE = os.path.join(SKALE_VAL_CONFIG_FOLDER, 'ledger_info.json')
 SKALE_VAL_ABI_FILE = os.path.join(SKALE_VAL_CONFIG_FOLDER, 'abi.json')
+SKALE_VAL_ABI_CACHE_FILE = os.path.join(SKALE_VAL_CONFIG_FOLDER, 'abi.cache')
+SKALE_VAL_CACHE_FILE = os.path.join(SKALE_VAL_CONFIG_FOLDER, 'cache.db')
+RPC_RECORD_FILE = os.getenv('SK_VAL_RPC_RECORD')
+RPC_REPLAY_FILE = os.getenv('SK_VAL_RPC_REPLAY')
+RPC_REPLAY_LATENCY = float(os.getenv('SK_VAL_RPC_REPLAY_LATENCY') or 0)
 SGX_DATA_DIR = os.getenv('SGX_DATA_DIR') or os.path.join(SKALE_VAL_CONFIG_FOLDER, 'sgx')
 SGX_INFO_PATH = os.path.join(SGX_DATA_DIR, 'info.json')
 SGX_SSL_CERTS_PATH = os.path.join(SGX_DATA_DIR, 'ssl')
@@ -57,6 +63,8 @@ WALLET_TYPES = ['software', 'ledger', 'sgx']
 LEDGER_KEYS_TYPES = ['legacy', 'live']
 # DELEGATION_PERIOD_OPTIONS = ['3', '6', '9', '12']  # strings because of click.Choice design
 DELEGATION_PERIOD_OPTIONS = ['2']  # strings because of click.Choice design
+DELEGATION_STATUSES = ['PROPOSED', 'ACCEPTED', 'CANCELED', 'REJECTED', 'DELEGATED',
+                       'UNDELEGATION_REQUESTED', 'COMPLETED']
 
 PERMILLE_MULTIPLIER = 10
 
@@ -27,13 +27,14 @@ from decimal import Decimal
 
 
 import click
-from web3 import Web3
 
 from core.transaction import TxFee
 from utils.exit_codes import CLIExitCodes
-from utils.constants import (SKALE_VAL_CONFIG_FILE, SKALE_VAL_ABI_FILE, PERMILLE_MULTIPLIER,
-                             DEBUG_LOG_FILEPATH)
+from utils.output_formats import OUTPUT_FORMATS, TABLE_FORMAT
+from utils.constants import (SKALE_VAL_CONFIG_FILE, PERMILLE_MULTIPLIER,
+                             DEBUG_LOG_FILEPATH, DELEGATION_STATUSES)
 from utils.texts import Texts
+from utils.validations import TokenAmountType
 
 
 TEXTS = Texts()
@@ -71,9 +72,7 @@ def config_exists():
 
 
 def read_config():
-    config = read_json(SKALE_VAL_CONFIG_FILE)
-    config['abi'] = read_json(SKALE_VAL_ABI_FILE)
-    return config
+    return read_json(SKALE_VAL_CONFIG_FILE)
 
 
 def get_config():
@@ -87,6 +86,7 @@ def abort_if_false(ctx, param, value):
 
 
 def to_skl(wei, unit='ether'):  # todo: replace with from_wei()
+    from web3 import Web3  # web3 is imported on first use to keep CLI startup fast
     if wei is None:
         return None
     if wei == 0:
@@ -95,17 +95,24 @@ def to_skl(wei, unit='ether'):  # todo: replace with from_wei()
 
 
 def from_wei(val, unit='ether'):
+    from web3 import Web3
     if val is None:
         return None
     return Web3.fromWei(Decimal(val), unit)
 
 
 def to_wei(val, unit='ether'):
+    from web3 import Web3
     if val is None:
         return None
     return Web3.toWei(Decimal(val), unit)
 
 
+def page(items, offset=0, limit=None):
+    """Returns `limit` items starting from `offset`, all remaining items if limit is None"""
+    return items[offset:None if limit is None else offset + limit]
+
+
 def permille_to_percent(val):
     return int(val) / PERMILLE_MULTIPLIER
 
@@ -131,6 +138,50 @@ def error_exit(err, exit_code=CLIExitCodes.FAILURE):
     sys.exit(exit_code.value)
 
 
+def paging_options(func):
+    func = click.option(
+        '--offset',
+        type=click.IntRange(min=0),
+        default=0,
+        help=TEXTS['offset']['help']
+    )(func)
+    return click.option(
+        '--limit',
+        type=click.IntRange(min=1),
+        help=TEXTS['limit']['help']
+    )(func)
+
+
+def delegation_filter_options(func):
+    func = click.option(
+        '--min-amount',
+        type=TokenAmountType(),
+        help=TEXTS['delegation_filter']['min_amount']['help']
+    )(func)
+    func = click.option(
+        '--since',
+        type=click.DateTime(formats=['%Y-%m-%d']),
+        help=TEXTS['delegation_filter']['since']['help']
+    )(func)
+    return click.option(
+        '--status',
+        'statuses',
+        type=click.Choice(DELEGATION_STATUSES, case_sensitive=False),
+        multiple=True,
+        help=TEXTS['delegation_filter']['status']['help']
+    )(func)
+
+
+def output_format_option(func):
+    return click.option(
+        '--format',
+        'output_format',
+        type=click.Choice(OUTPUT_FORMATS),
+        default=TABLE_FORMAT,
+        help=TEXTS['format']['help']
+    )(func)
+
+
 def transaction_cmd(func):
     @click.option(
         '--pk-file',
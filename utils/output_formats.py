@@ -0,0 +1,71 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of validator-cli
+#
+#   Copyright (C) 2020 SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Machine-readable output of read commands.
+
+Records are SDK dicts printed as is: amounts stay integers in wei and
+timestamps stay integers, nothing is measured or converted for a terminal
+"""
+
+import csv
+import json
+import sys
+
+TABLE_FORMAT = 'table'
+JSON_FORMAT = 'json'
+NDJSON_FORMAT = 'ndjson'
+CSV_FORMAT = 'csv'
+OUTPUT_FORMATS = [TABLE_FORMAT, JSON_FORMAT, NDJSON_FORMAT, CSV_FORMAT]
+
+
+def is_structured(output_format):
+    return output_format is not None and output_format != TABLE_FORMAT
+
+
+def to_json(record):
+    return json.dumps(record, default=str)
+
+
+def print_records(records, output_format, file=None):
+    """Prints an iterable of dicts, NDJSON and CSV lines are flushed as records arrive"""
+    file = file or sys.stdout
+    if output_format == JSON_FORMAT:
+        print(json.dumps(list(records), default=str, indent=4), file=file)
+    elif output_format == NDJSON_FORMAT:
+        for record in records:
+            print(to_json(record), file=file, flush=True)
+    elif output_format == CSV_FORMAT:
+        writer = None
+        for record in records:
+            if writer is None:
+                writer = csv.DictWriter(file, fieldnames=list(record), extrasaction='ignore',
+                                        lineterminator='\n')
+                writer.writeheader()
+            writer.writerow(record)
+            file.flush()
+    else:
+        raise ValueError(f'Unknown output format: {output_format}')
+
+
+def print_record(record, output_format, file=None):
+    """Prints a single dict, as an object for JSON and as a one-row file for NDJSON and CSV"""
+    if output_format == JSON_FORMAT:
+        print(json.dumps(record, default=str, indent=4), file=file or sys.stdout)
+    else:
+        print_records([record], output_format, file)
@@ -18,19 +18,22 @@
 #   along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import datetime
-import os
+import functools
+import shutil
+import sys
+from typing import Iterable
 
 import texttable
 from terminaltables import SingleTable
 from utils.helper import from_wei, permille_to_percent, to_skl
 
 
+@functools.lru_cache(maxsize=None)
 def get_tty_width():
-    tty_size = os.popen('stty size 2> /dev/null', 'r').read().split()
-    if len(tty_size) != 2:
+    """Terminal width queried once per run, 0 (no wrapping) when output is piped"""
+    if not sys.stdout.isatty():
         return 0
-    _, width = tty_size
-    return int(width)
+    return shutil.get_terminal_size(fallback=(0, 0)).columns
 
 
 class Formatter(object):
@@ -44,6 +47,76 @@ class Formatter(object):
         return table.draw()
 
 
+class StreamingTable:
+    """Table printed row by row as rows are produced.
+
+    Column widths are taken from the headers and the first `sample_size` rows,
+    wider cells of the later rows are printed in full and shift the line
+    """
+    SAMPLE_SIZE = 50
+    PADDING = ' ' * 3
+
+    def __init__(self, headers, sample_size=SAMPLE_SIZE, file=None):
+        self.headers = [str(header) for header in headers]
+        self.sample_size = sample_size
+        self.file = file
+        self.widths = None
+
+    def print_rows(self, rows):
+        sample = []
+        for row in rows:
+            cells = [str(cell) for cell in row]
+            if self.widths is not None:
+                self._print_line(cells)
+                continue
+            sample.append(cells)
+            if len(sample) >= self.sample_size:
+                self._print_sample(sample)
+        if self.widths is None:
+            self._print_sample(sample)
+
+    def _print_sample(self, sample):
+        self.widths = [
+            max([len(header)] + [len(cells[i]) for cells in sample])
+            for i, header in enumerate(self.headers)
+        ]
+        print(self.PADDING.join(
+            header.center(width) for header, width in zip(self.headers, self.widths)
+        ), file=self.file)
+        print('-' * (sum(self.widths) + len(self.PADDING) * (len(self.widths) - 1)),
+              file=self.file)
+        for cells in sample:
+            self._print_line(cells)
+
+    def _print_line(self, cells):
+        print(self.PADDING.join(
+            cell.ljust(width) for cell, width in zip(cells, self.widths)
+        ), file=self.file)
+
+
+class Progress:
+    """Loaded items count shown on stderr while the next items are loading, TTY only"""
+
+    def __init__(self, label, total, file=None, enabled=True):
+        self.label = label
+        self.total = total
+        self.file = file or sys.stderr
+        self.enabled = enabled and self.file.isatty()
+        self.shown = False
+
+    def update(self, done):
+        if self.enabled:
+            self.file.write(f'\r{self.label}: {done}/{self.total}')
+            self.file.flush()
+            self.shown = True
+
+    def clear(self):
+        if self.shown:
+            self.file.write('\r\x1b[K')
+            self.file.flush()
+            self.shown = False
+
+
 def format_date(date):
     return date.strftime("%b %d %Y %H:%M:%S")
 
@@ -61,30 +134,33 @@ def print_validators(validators, wei):
         # f'Auto accept',
         'Validator status'
     ]
-    rows = []
-    for validator in validators:
-        dt = datetime.datetime.fromtimestamp(validator['registration_time'])
-        strtime = dt.strftime('%d.%m.%Y-%H:%M:%S')
-        status = 'Trusted' if validator['trusted'] else 'Registered'
-        if not wei:
-            validator['minimum_delegation_amount'] = from_wei(
-                validator['minimum_delegation_amount'])
-        fee_rate_percent = permille_to_percent(validator['fee_rate'])
-        rows.append([
-            validator['name'],
-            validator['id'],
-            validator['validator_address'],
-            validator['description'],
-            fee_rate_percent,
-            strtime,
-            validator['minimum_delegation_amount'],
-            # validator['auto_accept_delegations'],
-            status
-        ])
-    print(Formatter().table(headers, rows))
+    StreamingTable(headers).print_rows(
+        validator_row(validator, wei) for validator in validators
+    )
 
 
-def print_delegations(delegations: list, wei: bool) -> None:
+def validator_row(validator, wei):
+    dt = datetime.datetime.fromtimestamp(validator['registration_time'])
+    strtime = dt.strftime('%d.%m.%Y-%H:%M:%S')
+    status = 'Trusted' if validator['trusted'] else 'Registered'
+    if not wei:
+        validator['minimum_delegation_amount'] = from_wei(
+            validator['minimum_delegation_amount'])
+    fee_rate_percent = permille_to_percent(validator['fee_rate'])
+    return [
+        validator['name'],
+        validator['id'],
+        validator['validator_address'],
+        validator['description'],
+        fee_rate_percent,
+        strtime,
+        validator['minimum_delegation_amount'],
+        # validator['auto_accept_delegations'],
+        status
+    ]
+
+
+def print_delegations(delegations: Iterable[dict], wei: bool) -> None:
     amount_header = 'Amount (wei)' if wei else 'Amount (SKL)'
     headers = [
         'Id',
@@ -96,21 +172,24 @@ def print_delegations(delegations: list, wei: bool) -> None:
         'Created At',
         'Info'
     ]
-    rows = []
-    for delegation in delegations:
-        date = datetime.datetime.fromtimestamp(delegation['created'])
-        amount = delegation['amount'] if wei else to_skl(delegation['amount'])
-        rows.append([
-            delegation['id'],
-            delegation['address'],
-            delegation['status'],
-            delegation['validator_id'],
-            amount,
-            delegation['delegation_period'],
-            date,
-            delegation['info']
-        ])
-    print(Formatter().table(headers, rows))
+    StreamingTable(headers).print_rows(
+        delegation_row(delegation, wei) for delegation in delegations
+    )
+
+
+def delegation_row(delegation: dict, wei: bool) -> list:
+    date = datetime.datetime.fromtimestamp(delegation['created'])
+    amount = delegation['amount'] if wei else to_skl(delegation['amount'])
+    return [
+        delegation['id'],
+        delegation['address'],
+        delegation['status'],
+        delegation['validator_id'],
+        amount,
+        delegation['delegation_period'],
+        date,
+        delegation['info']
+    ]
 
 
 def print_linked_addresses(addresses):
@@ -124,7 +203,27 @@ def print_linked_addresses(addresses):
         rows.append([
             address_info['address'],
             address_info['status'],
-            address_info['balance']
+            from_wei(address_info['balance'])
+        ])
+    print(Formatter().table(headers, rows))
+
+
+def print_tx_statuses(txs):
+    headers = [
+        'Transaction',
+        'Nonce',
+        'Hash',
+        'Status',
+        'Error'
+    ]
+    rows = []
+    for tx in txs:
+        rows.append([
+            tx.name,
+            '' if tx.nonce is None else tx.nonce,
+            tx.tx_hash or '',
+            tx.status,
+            tx.error or ''
         ])
     print(Formatter().table(headers, rows))
 
@@ -215,6 +314,36 @@ def print_bounties(nodes, bounties, wei):
     print(table.draw())
 
 
+def print_metrics_run_stats(stats):
+    print(f'\nMetrics collected for {stats.nodes} node(s) in {stats.elapsed:.1f}s '
+          f'({stats.throughput:.2f} nodes/s), node latency: '
+          f'avg {stats.avg_latency:.1f}s, max {stats.max_latency:.1f}s')
+    if stats.latencies:
+        rows = [[node_id, f'{latency:.1f}']
+                for node_id, latency in sorted(stats.latencies.items())]
+        print(Formatter().table(['Node ID', 'Latency (s)'], rows))
+    for node_id, err in stats.errors.items():
+        print(f'Failed to collect metrics for node {node_id}: {err}')
+
+
+def print_rpc_profile(rows, histogram, file=None):
+    headers = [
+        'Method',
+        'Calls',
+        'Errors',
+        'Total (s)',
+        'p50 (ms)',
+        'p95 (ms)',
+        'Max (ms)',
+        'Sent (B)',
+        'Received (B)'
+    ]
+    print('\nJSON-RPC profile', file=file)
+    print(Formatter().table(headers, rows), file=file)
+    print('Latency histogram: ' + ', '.join(f'{label}: {count}' for label, count in histogram),
+          file=file)
+
+
 def print_total_info(total, wei):
     if wei:
         total_string = f'Total bounty per the given period: {total:} wei'
@@ -0,0 +1,157 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of validator-cli
+#
+#   Copyright (C) 2020 SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Read calls sent as JSON-RPC batches over the HTTP provider.
+
+Endpoints and providers without batch support (websocket, cassettes) get
+the same calls through a thread pool. Results are raw JSON-RPC results
+(hex strings), failed calls are returned as RpcCallError instances
+"""
+
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from requests import RequestException
+from web3 import HTTPProvider
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.encoding import Web3JsonEncoder
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3._utils.request import make_post_request
+
+from utils.rpc_profiler import call_key, profiler
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 100
+RPC_WORKERS = 8
+
+
+class BatchRequestError(Exception):
+    pass
+
+
+class RpcCallError(Exception):
+    pass
+
+
+def eth_call(contract, fn_name, *args):
+    data = contract.encodeABI(fn_name=fn_name, args=args)
+    return 'eth_call', [{'to': contract.address, 'data': data}, 'latest']
+
+
+def decode_call_result(contract, fn_name, result):
+    output_types = get_abi_output_types(contract.get_function_by_name(fn_name).abi)
+    values = map_abi_data(
+        BASE_RETURN_NORMALIZERS, output_types,
+        contract.web3.codec.decode_abi(output_types, bytes.fromhex(result[2:]))
+    )
+    return values[0] if len(values) == 1 else values
+
+
+def check_result(result):
+    if isinstance(result, RpcCallError):
+        raise result
+    return result
+
+
+def get_result(response):
+    if 'error' in response:
+        return RpcCallError(response['error'])
+    return response.get('result')
+
+
+def send_batch(web3, calls):
+    provider = web3.provider
+    if not isinstance(provider, HTTPProvider):
+        raise BatchRequestError(f'{type(provider).__name__} does not support batch requests')
+    results = []
+    for i in range(0, len(calls), MAX_BATCH_SIZE):
+        batch = calls[i:i + MAX_BATCH_SIZE]
+        payload = [
+            {'jsonrpc': '2.0', 'id': _id, 'method': method, 'params': params}
+            for _id, (method, params) in enumerate(batch)
+        ]
+        started_at = time.perf_counter()
+        raw_response = make_post_request(
+            provider.endpoint_uri,
+            json.dumps(payload, cls=Web3JsonEncoder).encode(),
+            **dict(provider.get_request_kwargs())
+        )
+        responses = json.loads(raw_response)
+        if profiler.enabled:
+            record_batch(payload, responses, time.perf_counter() - started_at)
+        if not isinstance(responses, list):
+            raise BatchRequestError(f'Unexpected batch response: {responses}')
+        responses = {response.get('id'): response for response in responses}
+        if any(_id not in responses for _id in range(len(batch))):
+            raise BatchRequestError(f'Incomplete batch response: {responses}')
+        results.extend(get_result(responses[_id]) for _id in range(len(batch)))
+    return results
+
+
+def record_batch(payload, responses, elapsed):
+    """Records every call of the batch under its own key with an equal share of the round-trip"""
+    responses = {response.get('id'): response for response in responses
+                 if isinstance(response, dict)} if isinstance(responses, list) else {}
+    for request in payload:
+        response = responses.get(request['id'])
+        profiler.record(call_key(request['method'], request['params']), elapsed / len(payload),
+                        [request['method'], request['params']], response,
+                        error=response is None or 'error' in response)
+
+
+def request_each(web3, calls, workers=RPC_WORKERS):
+    def request(call):
+        method, params = call
+        started_at = time.perf_counter()
+        response = None
+        try:
+            response = web3.provider.make_request(method, params)
+            return get_result(response)
+        finally:
+            if profiler.enabled:
+                profiler.record(call_key(method, params), time.perf_counter() - started_at,
+                                [method, params], response,
+                                error=response is None or 'error' in response)
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(calls))) as executor:
+        return list(executor.map(request, calls))
+
+
+def request_batch(web3, calls):
+    """Returns results of (method, params) calls sent in one round-trip where possible"""
+    if not calls:
+        return []
+    try:
+        return send_batch(web3, calls)
+    except (BatchRequestError, RequestException, ValueError) as err:
+        logger.info(f'Batch request failed, sending calls one by one: {err}')
+    return request_each(web3, calls)
+
+
+def iter_batch_results(web3, calls, chunk_size=MAX_BATCH_SIZE, workers=RPC_WORKERS):
+    """Yields results of the calls in order, chunks of calls are requested in parallel"""
+    chunks = [calls[i:i + chunk_size] for i in range(0, len(calls), chunk_size)]
+    if not chunks:
+        return
+    with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        for results in executor.map(lambda chunk: request_batch(web3, chunk), chunks):
+            yield from results
@@ -0,0 +1,155 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of validator-cli
+#
+#   Copyright (C) 2020 SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Record/replay of JSON-RPC traffic for offline runs of sk-val commands.
+
+Set SK_VAL_RPC_RECORD=<file> to save every request of a command with its response
+into a gzipped cassette, SK_VAL_RPC_REPLAY=<file> to serve responses back from it
+without a network (SK_VAL_RPC_REPLAY_LATENCY adds a delay in seconds to each of them).
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+
+from web3._utils.encoding import Web3JsonEncoder
+from web3.providers.base import BaseProvider
+
+from utils.constants import RPC_RECORD_FILE, RPC_REPLAY_FILE, RPC_REPLAY_LATENCY
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteMissError(Exception):
+    pass
+
+
+def request_key(method, params):
+    return json.dumps([method, params], cls=Web3JsonEncoder, sort_keys=True)
+
+
+class Cassette:
+    """Requests with their responses stored as gzipped JSON lines.
+
+    Repeated requests are answered in the recorded order, the last response is
+    reused once the recorded ones are exhausted. Requests are recorded and
+    replayed from several threads, the file and the queues are guarded by a lock
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.responses = defaultdict(deque)
+        self.last_responses = {}
+        self.file = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        with gzip.open(self.path, 'rt') as f:
+            for line in f:
+                interaction = json.loads(line)
+                key = request_key(interaction['method'], interaction['params'])
+                self.responses[key].append(interaction['response'])
+        return self
+
+    def record(self, method, params, response):
+        line = json.dumps({'method': method, 'params': params, 'response': response},
+                          cls=Web3JsonEncoder) + '\n'
+        with self.lock:
+            if self.file is None:
+                self.file = gzip.open(self.path, 'wt')
+                atexit.register(self.close)
+            self.file.write(line)
+
+    def replay(self, method, params):
+        key = request_key(method, params)
+        with self.lock:
+            if self.responses[key]:
+                self.last_responses[key] = self.responses[key].popleft()
+            elif key not in self.last_responses:
+                raise CassetteMissError(f'Request {method} {params} is not in {self.path}')
+            return self.last_responses[key]
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+class RecordingProvider(BaseProvider):
+    def __init__(self, provider, cassette):
+        self.provider = provider
+        self.cassette = cassette
+
+    def make_request(self, method, params):
+        response = self.provider.make_request(method, params)
+        self.cassette.record(method, params, response)
+        return response
+
+    def isConnected(self):
+        return self.provider.isConnected()
+
+
+class ReplayProvider(BaseProvider):
+    def __init__(self, cassette, latency=0):
+        self.cassette = cassette
+        self.latency = latency
+
+    def make_request(self, method, params):
+        if self.latency:
+            time.sleep(self.latency)
+        return self.cassette.replay(method, params)
+
+    def isConnected(self):
+        return True
+
+
+_cassette = None
+
+
+def get_cassette():
+    """Returns the cassette of the process if recording or replaying is enabled"""
+    global _cassette
+    if _cassette is None and RPC_REPLAY_FILE:
+        logger.info(f'Replaying RPC responses from {RPC_REPLAY_FILE}')
+        _cassette = Cassette(RPC_REPLAY_FILE).load()
+    elif _cassette is None and RPC_RECORD_FILE:
+        logger.info(f'Recording RPC requests to {RPC_RECORD_FILE}')
+        _cassette = Cassette(RPC_RECORD_FILE)
+    return _cassette
+
+
+def is_replaying():
+    return bool(RPC_REPLAY_FILE)
+
+
+def use_cassette(web3):
+    """Routes web3 requests through the recording or replaying provider if enabled"""
+    cassette = get_cassette()
+    if cassette is None:
+        return web3
+    if is_replaying():
+        web3.provider = ReplayProvider(cassette, RPC_REPLAY_LATENCY)
+    else:
+        web3.provider = RecordingProvider(web3.provider, cassette)
+    return web3
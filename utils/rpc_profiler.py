@@ -0,0 +1,183 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of validator-cli
+#
+#   Copyright (C) 2020 SKALE Labs
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import atexit
+import json
+import logging
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import List
+
+from eth_utils import function_abi_to_4byte_selector
+from web3._utils.encoding import Web3JsonEncoder
+
+from utils.abi_cache import load_abi
+from utils.print_formatters import print_rpc_profile
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500)
+
+
+@dataclass
+class CallStats:
+    calls: int = 0
+    errors: int = 0
+    latencies: List[float] = field(default_factory=list)
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+    def percentile(self, q):
+        latencies = sorted(self.latencies)
+        return latencies[min(int(len(latencies) * q), len(latencies) - 1)]
+
+
+def payload_size(payload):
+    return len(json.dumps(payload, cls=Web3JsonEncoder))
+
+
+def call_key(method, params):
+    """Splits eth_call requests by contract address and function selector"""
+    if method == 'eth_call' and params and isinstance(params[0], dict):
+        data = str(params[0].get('data', ''))
+        return method, str(params[0].get('to', '')).lower(), data[:10]
+    return method, None, None
+
+
+def get_abi_names(addresses):
+    """Returns names of the called contracts by address and their function names by selector.
+
+    ABIs come from the abi.json cache, only ABIs of the called contracts are unpickled
+    """
+    try:
+        abi = load_abi()
+    except (OSError, ValueError):
+        return {}, {}
+    contracts, functions = {}, {}
+    for key in abi:
+        if not key.endswith('_address'):
+            continue
+        address = abi[key]
+        if isinstance(address, str) and address.lower() in addresses:
+            contracts[address.lower()] = key[:-len('_address')]
+    for name in contracts.values():
+        for item in abi.get(f'{name}_abi', []):
+            if item.get('type') == 'function':
+                selector = '0x' + function_abi_to_4byte_selector(item).hex()
+                functions[selector] = item['name']
+    return contracts, functions
+
+
+class RpcProfiler:
+    """Collects JSON-RPC calls count, latencies and payload sizes by method"""
+
+    def __init__(self):
+        self.enabled = False
+        self.stats = defaultdict(CallStats)
+        self.lock = threading.Lock()
+
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            atexit.register(self.report)
+
+    def record(self, key, elapsed, request, response, error=False):
+        sent, received = payload_size(request), payload_size(response)
+        with self.lock:
+            stats = self.stats[key]
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.latencies.append(elapsed)
+            stats.bytes_sent += sent
+            stats.bytes_received += received
+
+    def middleware(self, make_request, web3):
+        def middleware(method, params):
+            started_at = time.perf_counter()
+            response = None
+            try:
+                response = make_request(method, params)
+                return response
+            finally:
+                self.record(call_key(method, params), time.perf_counter() - started_at,
+                            [method, params], response,
+                            error=response is None or 'error' in response)
+        return middleware
+
+    async def async_middleware(self, make_request, web3):
+        async def middleware(method, params):
+            started_at = time.perf_counter()
+            response = None
+            try:
+                response = await make_request(method, params)
+                return response
+            finally:
+                self.record(call_key(method, params), time.perf_counter() - started_at,
+                            [method, params], response,
+                            error=response is None or 'error' in response)
+        return middleware
+
+    def summary_rows(self):
+        contracts, functions = get_abi_names({to for _, to, _ in self.stats if to is not None})
+        rows = []
+        for (method, to, selector), stats in sorted(
+                self.stats.items(), key=lambda item: -sum(item[1].latencies)):
+            if to is not None:
+                method = f'{method} {contracts.get(to, to)}.{functions.get(selector, selector)}'
+            rows.append([
+                method,
+                stats.calls,
+                stats.errors,
+                f'{sum(stats.latencies):.3f}',
+                f'{stats.percentile(0.5) * 1000:.1f}',
+                f'{stats.percentile(0.95) * 1000:.1f}',
+                f'{max(stats.latencies) * 1000:.1f}',
+                stats.bytes_sent,
+                stats.bytes_received
+            ])
+        return rows
+
+    def histogram(self):
+        counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        for stats in self.stats.values():
+            for latency in stats.latencies:
+                counts[sum(latency * 1000 > bound for bound in LATENCY_BUCKETS_MS)] += 1
+        labels = [f'<={bound}ms' for bound in LATENCY_BUCKETS_MS]
+        labels.append(f'>{LATENCY_BUCKETS_MS[-1]}ms')
+        return list(zip(labels, counts))
+
+    def report(self):
+        if not self.stats:
+            return
+        rows, histogram = self.summary_rows(), self.histogram()
+        logger.debug(f'RPC profile: {rows}, latency histogram: {histogram}')
+        print_rpc_profile(rows, histogram, file=sys.stderr)
+
+
+profiler = RpcProfiler()
+
+
+def install_profiler(web3):
+    """Adds profiling middleware as the innermost layer, so every retry is counted"""
+    if profiler.enabled:
+        web3.middleware_onion.inject(profiler.middleware, layer=0)
+    return web3
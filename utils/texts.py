@@ -17,20 +17,53 @@
 #   You should have received a copy of the GNU Affero General Public License
 #   along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-from utils.constants import TEXT_FILE
+import hashlib
+import marshal
+
+from utils.constants import COMPILED_TEXT_FILE, TEXT_FILE
+
+
+def get_texts_checksum(text_filepath=TEXT_FILE):
+    with open(text_filepath, 'rb') as text_file:
+        return hashlib.sha256(text_file.read()).digest()
+
+
+def parse_texts(text_filepath=TEXT_FILE):
+    import yaml
+    with open(text_filepath, 'r') as stream:
+        try:
+            return yaml.safe_load(stream)
+        except yaml.YAMLError as exc:
+            print(exc)
+
+
+def compile_texts(text_filepath=TEXT_FILE, compiled_filepath=COMPILED_TEXT_FILE):
+    """Saves parsed text.yml with its checksum as a marshal blob, done during the build"""
+    with open(compiled_filepath, 'wb') as compiled_file:
+        marshal.dump((get_texts_checksum(text_filepath), parse_texts(text_filepath)),
+                     compiled_file)
+    return compiled_filepath
+
+
+def load_texts(text_filepath=TEXT_FILE, compiled_filepath=COMPILED_TEXT_FILE):
+    """Returns texts from the compiled blob, parses text.yml if the blob is missing or outdated"""
+    try:
+        with open(compiled_filepath, 'rb') as compiled_file:
+            checksum, texts = marshal.load(compiled_file)
+        if checksum == get_texts_checksum(text_filepath):
+            return texts
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    return parse_texts(text_filepath)
 
 
 class Texts():
+    """Texts from text.yml, loaded once per process and shared by all instances"""
+    _texts = None
+
     def __init__(self):
-        self._texts = self._load()
+        if Texts._texts is None:
+            Texts._texts = load_texts()
 
     def __getitem__(self, key):
         return self._texts.get(key)
-
-    def _load(self):
-        with open(TEXT_FILE, 'r') as stream:
-            try:
-                return yaml.safe_load(stream)
-            except yaml.YAMLError as exc:
-                print(exc)
@@ -17,22 +17,38 @@
 #   You should have received a copy of the GNU Affero General Public License
 #   along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from decimal import Decimal, InvalidOperation
 from urllib.parse import urlparse
 
 import click
-from web3.auto import w3
 
 
 class EthAddressType(click.ParamType):
     name = 'eth_address'
 
     def convert(self, value, param, ctx):
-        if w3.isAddress(value):
+        from web3 import Web3  # web3 is imported on first use to keep CLI startup fast
+        if Web3.isAddress(value):
             return value
         else:
             self.fail(f'Wrong Ethereum address provided: {value}', param, ctx)
 
 
+class TokenAmountType(click.ParamType):
+    """Non-negative amount of SKL parsed as Decimal, so it converts to wei exactly"""
+    name = 'amount'
+
+    def convert(self, value, param, ctx):
+        try:
+            amount = Decimal(str(value))
+        except InvalidOperation:
+            self.fail(f'Wrong amount provided: {value}', param, ctx)
+        if not amount.is_finite() or amount < 0:
+            self.fail(f'Wrong amount provided: {value}, should be a non-negative number',
+                      param, ctx)
+        return amount
+
+
 class PercentageType(click.ParamType):
     name = 'percentage'
 
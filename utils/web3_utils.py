@@ -21,41 +21,101 @@ import os
 import sys
 import logging
 
+from web3 import Web3
+from web3.eth import AsyncEth
+from web3.providers.async_rpc import AsyncHTTPProvider
 from yaspin import yaspin
 
 from skale import Skale
+from skale.config import NO_SYNC_TS_DIFF
+from skale.skale_manager import CONTRACTS_INFO, DEBUG_CONTRACTS_INFO
 from skale.utils.exceptions import IncompatibleAbiError
+from skale.utils.helper import get_contracts_info
 from skale.utils.web3_utils import init_web3
 from skale.wallets import LedgerWallet, SgxWallet, Web3Wallet
 from skale.wallets.ledger_wallet import LedgerCommunicationError
 
 from core.wallet_tools import get_ledger_wallet_info
 from core.sgx_tools import get_sgx_info, sgx_inited
+from utils.abi_cache import load_abi
 from utils.constants import SGX_SSL_CERTS_PATH, SKALE_VAL_ABI_FILE, SPIN_COLOR
 from utils.helper import get_config, print_err_with_log_path
+from utils.rpc_cassette import is_replaying, use_cassette
+from utils.rpc_profiler import install_profiler, profiler
 
 DISABLE_SPIN = os.getenv('DISABLE_SPIN')
 logger = logging.getLogger(__name__)
 
 
+class LazySkale(Skale):
+    """Skale that loads ABI from the preparsed cache and builds contract wrappers on first access.
+
+    Skale reads the whole ABI file again for every contract it initializes,
+    here only ABIs of the used contracts are loaded and contract_manager
+    is created only when needed. Wrappers are built with the public
+    add_lib_contract/init_upgradeable_contract and kept as instance attributes
+    """
+
+    def set_contracts_info(self):
+        self._abi = load_abi(self._abi_filepath)
+        contracts_info = get_contracts_info(CONTRACTS_INFO)
+        if self._abi.get('time_helpers_with_debug_address'):
+            logger.info('Debug contracts found in ABI file')
+            contracts_info.update(get_contracts_info(DEBUG_CONTRACTS_INFO))
+        self._contracts_info = contracts_info
+
+    def add_contract(self, name, contract):
+        super().add_contract(name, contract)
+        self.__dict__[name] = contract
+
+    def __getattr__(self, name):
+        if name.startswith('__') or '_contracts_info' not in self.__dict__:
+            raise AttributeError(name)
+        contract_info = self._contracts_info.get(name)
+        if contract_info is None:
+            logger.warning(f'{name} method/contract wasn\'t found')
+            return None
+        logger.debug(f'Contract {name} wasn\'t inited, creating now')
+        if contract_info.upgradeable:
+            self.init_upgradeable_contract(contract_info, self._abi)
+        else:
+            self.add_lib_contract(contract_info.name, contract_info.contract_class, self._abi)
+        return self.__dict__[name]
+
+
+def get_ts_diff():
+    """Chain sync check is disabled when responses are replayed from a cassette"""
+    return NO_SYNC_TS_DIFF if is_replaying() else None
+
+
 def init_skale(endpoint, wallet=None, disable_spin=DISABLE_SPIN):
     """Init read-only instance of SKALE library"""
     try:
-        if disable_spin:
-            return Skale(endpoint, SKALE_VAL_ABI_FILE, wallet)
+        if disable_spin or not sys.stdout.isatty():
+            skale = LazySkale(endpoint, SKALE_VAL_ABI_FILE, wallet, ts_diff=get_ts_diff())
+            install_profiler(use_cassette(skale.web3))
+            return skale
         with yaspin(text="Loading", color=SPIN_COLOR) as sp:
             sp.text = 'Connecting to SKALE Manager contracts'
-            skale = Skale(endpoint, SKALE_VAL_ABI_FILE, wallet)
+            skale = LazySkale(endpoint, SKALE_VAL_ABI_FILE, wallet, ts_diff=get_ts_diff())
+            install_profiler(use_cassette(skale.web3))
             return skale
     except IncompatibleAbiError:
         print('Version of validator-cli you use is incompatible with a given ABI!')
         sys.exit(0)
 
 
+def init_async_web3(endpoint):
+    """Init read-only web3 instance with async HTTP provider"""
+    middlewares = [profiler.async_middleware] if profiler.enabled else []
+    return Web3(AsyncHTTPProvider(endpoint), modules={'eth': (AsyncEth,)},
+                middlewares=middlewares)
+
+
 def init_skale_w_wallet(endpoint, wallet_type, pk_file=None, ledger_config={},
                         disable_spin=DISABLE_SPIN):
     """Init instance of SKALE library with wallet"""
-    web3 = init_web3(endpoint)
+    web3 = install_profiler(use_cassette(init_web3(endpoint, ts_diff=get_ts_diff())))
     if wallet_type == 'ledger':
         try:
             legacy = ledger_config['keys_type'] == 'legacy'
@@ -83,12 +143,13 @@ def print_wallet_info(wallet):
     print(f'Wallet type: {type(wallet).__name__}')
 
 
-def init_skale_from_config():
+def init_skale_from_config(disable_spin=False):
+    """Spinner is also disabled when stdout is not a terminal or DISABLE_SPIN is set"""
     config = get_config()
     if not config:
         print('You should run < init > first')
         return
-    return init_skale(config['endpoint'])
+    return init_skale(config['endpoint'], disable_spin=disable_spin or DISABLE_SPIN)
 
 
 def init_skale_w_wallet_from_config(pk_file=None):